@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+
+# Benchmark of calculation of expected length of the genome on a synthetic
+#   repeat-hub assembly: a few collapsed repeats ("hubs") overlap thousands of contigs
+#   at both termini, so the longest M overlaps of each hub terminus are selected
+#   out of many (M is multiplicity of the hub).
+# Selection with a bounded heap (`heapq.nlargest`) over rows of the collection
+#   is compared to the former full sort of all overlaps of a hub terminus.
+#
+# Usage: python3 benchmarks/bench_exp_genome_size.py [num_hubs] [num_overlaps_per_terminus]
+
+import os
+import sys
+import random
+import timeit
+from typing import List, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.combinator_statistics as sts
+from src.contigs import Contig, ContigCollection
+from src.overlaps import Overlap, OverlapCollection, add_comparison_overlaps, S2E, E2S
+
+
+def make_repeat_hub_assembly(num_hubs: int, num_overlaps: int):
+    # Function makes contigs and overlaps of a synthetic repeat-hub assembly:
+    #   each hub overlaps `num_overlaps` distinct contigs at start and at end.
+    # Returns contig collection and overlap collection.
+
+    rand: random.Random = random.Random(23)
+
+    contig_collection: ContigCollection = list()
+    overlap_collection: OverlapCollection = OverlapCollection()
+
+    hub: int
+    for hub in range(num_hubs):
+        hub_index: int = len(contig_collection)
+        contig_collection.append(Contig('HUB_{}'.format(hub), 5000, None, 50.0, 'A', 'A'))
+        contig_collection[hub_index].multplty = 1.0 + hub % 8
+
+        _: int
+        for _ in range(num_overlaps):
+            comparison: int
+            for comparison in (S2E, E2S):
+                partner_index: int = len(contig_collection)
+                contig_collection.append(
+                    Contig('NODE_{}'.format(partner_index), 1000, None, 50.0, 'A', 'A')
+                )
+                contig_collection[partner_index].multplty = 1.0
+                add_comparison_overlaps(overlap_collection, hub_index, partner_index,
+                                        comparison, rand.randint(21, 127))
+            # end for
+        # end for
+    # end for
+
+    return contig_collection, overlap_collection
+# end def make_repeat_hub_assembly
+
+
+def calc_overlap_len_full_sort(overlap_collection: OverlapCollection,
+                               i: int, contig: Contig) -> int:
+    # Former calculation of total length of overlapping regions of the i-th contig:
+    #   all overlaps of a terminus are turned into `Overlap`s and sorted
+    #   to select M longest ones.
+
+    total_overlap_len: int = 0
+
+    ovls: Sequence[Overlap]
+    for ovls in (overlap_collection.get_start_overlaps(i),
+                 overlap_collection.get_end_overlaps(i)):
+        if len(ovls) > contig.multplty:
+            ovls = sorted(ovls, key=lambda x: -x.ovl_len)[: int(contig.multplty)]
+        # end if
+        total_overlap_len += sum(ovl.ovl_len for ovl in ovls if ovl.contig_j >= i)
+    # end for
+
+    return total_overlap_len
+# end def calc_overlap_len_full_sort
+
+
+def main() -> None:
+    num_hubs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    num_overlaps: int = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    contig_collection, overlap_collection = make_repeat_hub_assembly(num_hubs, num_overlaps)
+    print('{} hubs, {} overlaps per hub terminus, {} contigs'\
+        .format(num_hubs, num_overlaps, len(contig_collection)))
+
+    # Build index of the collection in advance
+    overlap_collection.count_start_overlaps(0)
+
+    hubs: List[int] = [
+        i for i, contig in enumerate(contig_collection) if contig.name.startswith('HUB')
+    ]
+
+    results: List[int] = list()
+
+    name: str
+    for name, calc in (('bounded heap', sts._calc_overlap_len),
+                       ('full sort', calc_overlap_len_full_sort)):
+        def calc_hubs() -> int:
+            return sum(calc(overlap_collection, i, contig_collection[i]) for i in hubs)
+        # end def calc_hubs
+        results.append(calc_hubs())
+        seconds: float = min(timeit.repeat(calc_hubs, number=1, repeat=5))
+        print('{}: {:.3f} s for hub termini'.format(name, seconds))
+    # end for
+
+    assert results[0] == results[1]
+
+    seconds = min(timeit.repeat(
+        lambda: sts.calc_exp_genome_size(contig_collection, overlap_collection),
+        number=1, repeat=3
+    ))
+    print('calc_exp_genome_size: {:.3f} s for the whole assembly'.format(seconds))
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -1,10 +1,7 @@
 # -*- encoding: utf-8 -*-
 
-from typing import MutableSequence
-
-import src.combinator_statistics as sts
 from src.contigs import ContigCollection, ContigIndex
-from src.overlaps import OverlapCollection, Overlap
+from src.overlaps import OverlapCollection
 
 
 def assign_multiplty(contig_collection: ContigCollection, overlap_collection: OverlapCollection) -> None:
@@ -51,7 +48,7 @@ def assign_multiplty(contig_collection: ContigCollection, overlap_collection: Ov
         else:
             # Calculate multiplicity based on overlaps
             contig_collection[i].multplty = _calc_multiplty_by_overlaps(
-                overlap_collection[i]
+                overlap_collection, i
             )
         # end if
     # end for
@@ -67,19 +64,17 @@ def _calc_multiplty_by_coverage(curr_coverage: float, first_contig_coverage: flo
 # end def _calc_multiplty_by_coverage
 
 
-def _calc_multiplty_by_overlaps(ovl_list: MutableSequence[Overlap]) -> float:
+def _calc_multiplty_by_overlaps(overlap_collection: OverlapCollection,
+                                key: ContigIndex) -> float:
     # Function for calculating multiplicity of a given contig
     #   based on number of overlaps of this contig.
-    # :param ovl_list: list of overlaps of current contig;
+    # :param overlap_collection: instance of OverlapCollection;
+    # :param key: key (index) of current contig;
 
     # Count overlaps associated with start
-    num_start_matches: int = len(tuple(
-        filter(sts.is_start_match, ovl_list)
-    ))
+    num_start_matches: int = overlap_collection.count_start_overlaps(key)
     # Count overlaps associated with end
-    num_end_matches:   int = len(tuple(
-        filter(sts.is_end_match, ovl_list)
-    ))
+    num_end_matches:   int = overlap_collection.count_end_overlaps(key)
 
     # Obtain multiplicity based on number of overlaps
     multiplicity: float = max(
@@ -0,0 +1,247 @@
+# -*- encoding: utf-8 -*-
+
+# Bloom-filter prefilter of pairs of contigs.
+#
+# An overlap of length at least 'mink' starts with the 'mink'-prefix
+#   (boundary k-mer) of a terminus matched by it's prefix: a start or an rc-end
+#   (see `src.sorted_termini`). Boundary k-mers of all contigs are added to
+#   a Bloom filter, which takes a fixed amount of memory, instead of a full index:
+#   - a boundary k-mer, which is already present on addition, is added to the filter
+#     of duplicated k-mers (start-to-start-like overlaps);
+#   - 'mink'-windows of ends and rc-starts are probed in the filter, and windows
+#     found there are added to the filter of hit k-mers (end-to-start-like overlaps).
+# Most windows are not found in the filter and are dropped without any exact comparison.
+# Then, only boundary k-mers passing the filters of duplicated and hit k-mers are sorted,
+#   and a pair of contigs is compared by `src.overlaps.compare_contig_partners` only if
+#   they share a boundary k-mer, or if a hit window of one of them is a boundary k-mer
+#   of the other one. Bloom filters have no false negatives, so overlaps are detected exactly.
+
+import math
+from bisect import bisect_left
+from typing import List, Set, Tuple, Iterator
+
+from src.contigs import Contig, ContigCollection, ContigIndex
+from src.overlaps import OverlapCollection
+from src.minimizers import compare_candidate_partners, report_candidate_pairs
+
+
+# Default false-positive rate of a Bloom filter
+DEFAULT_BLOOM_FPR: float = 0.01
+# Default memory budget for all Bloom filters, MB
+DEFAULT_BLOOM_MEMORY: int = 256
+
+# Number of Bloom filters built by the prefilter
+_NUM_FILTERS: int = 3
+
+
+class BloomFilter:
+    # Class represents a Bloom filter of strings.
+    # Positions of bits are obtained by double hashing.
+
+    def __init__(self, num_items: int, fpr: float, max_bits: int):
+        # :param num_items: expected number of items;
+        # :param fpr: desired false-positive rate;
+        # :param max_bits: maximum size of the filter in bits:
+        #   if the filter of the desired false-positive rate is larger, it is truncated,
+        #   and the rate increases;
+
+        num_items = max(num_items, 1)
+
+        optimal_bits: int = math.ceil(-num_items * math.log(fpr) / math.log(2) ** 2)
+        self.num_bits: int = max(8, min(optimal_bits, max_bits))
+        self.num_hashes: int = max(1, round(self.num_bits / num_items * math.log(2)))
+        self.num_items: int = num_items
+
+        self._bits: bytearray = bytearray((self.num_bits + 7) // 8)
+    # end def __init__
+
+    def _get_positions(self, item: str) -> List[int]:
+        # Function returns positions of bits corresponding to an item
+        hash_1: int = hash(item)
+        hash_2: int = hash((item, self.num_hashes)) | 1
+        return [(hash_1 + h * hash_2) % self.num_bits for h in range(self.num_hashes)]
+    # end def _get_positions
+
+    def add(self, item: str) -> bool:
+        # Function adds an item to the filter.
+        # Returns True if the item has been (probably) present in the filter.
+        present: bool = True
+        pos: int
+        for pos in self._get_positions(item):
+            mask: int = 1 << (pos & 7)
+            if not self._bits[pos >> 3] & mask:
+                present = False
+                self._bits[pos >> 3] |= mask
+            # end if
+        # end for
+        return present
+    # end def add
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._get_positions(item)
+        )
+    # end def __contains__
+
+    def expected_fpr(self) -> float:
+        # Function returns expected false-positive rate for the expected number of items
+        return (1 - math.exp(-self.num_hashes * self.num_items / self.num_bits)) \
+               ** self.num_hashes
+    # end def expected_fpr
+
+    def __len__(self) -> int:
+        # Returns size of the filter in bytes
+        return len(self._bits)
+    # end def __len__
+# end class BloomFilter
+
+
+def detect_adjacent_contigs_bloom(contig_collection: ContigCollection,
+                                  mink: int, maxk: int,
+                                  fpr: float = DEFAULT_BLOOM_FPR,
+                                  memory: int = DEFAULT_BLOOM_MEMORY,
+                                  max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function detects adjacent contigs by comparing termini of contigs,
+    #   which pass the Bloom-filter prefilter.
+    # Result is identical to one returned by `src.overlaps.detect_adjacent_contigs`.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param fpr: desired false-positive rate of Bloom filters;
+    # :param memory: memory budget for all Bloom filters, MB;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    candidate_partners: List[List[ContigIndex]] = find_bloom_candidate_partners(
+        contig_collection, mink, fpr, memory
+    )
+    report_candidate_pairs(contig_collection, candidate_partners, mink, 'Bloom filter')
+
+    return compare_candidate_partners(contig_collection, candidate_partners, mink, maxk,
+                                      max_overlaps_per_terminus)
+# end def detect_adjacent_contigs_bloom
+
+
+def find_bloom_candidate_partners(contig_collection: ContigCollection, mink: int,
+                                  fpr: float, memory: int) -> List[List[ContigIndex]]:
+    # Function finds pairs of contigs passing the Bloom-filter prefilter.
+    # Returns list of candidate partners of each contig:
+    #   the i-th element contains indices of contigs greater than i, in ascending order.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param fpr: desired false-positive rate of Bloom filters;
+    # :param memory: memory budget for all Bloom filters, MB;
+
+    # Termini shorter than 'mink' do not overlap anything
+    indexed: List[ContigIndex] = [
+        x for x, contig in enumerate(contig_collection) if len(contig.start) >= mink
+    ]
+
+    # Duplicated and hit k-mers are boundary k-mers as well,
+    #   so all filters hold at most 2 items per contig
+    num_items: int = 2 * len(indexed)
+    max_bits: int = memory * 8 * 1024 * 1024 // _NUM_FILTERS
+    boundary_filter: BloomFilter = BloomFilter(num_items, fpr, max_bits)
+    duplicate_filter: BloomFilter = BloomFilter(num_items, fpr, max_bits)
+    hit_filter: BloomFilter = BloomFilter(num_items, fpr, max_bits)
+
+    x: ContigIndex
+    contig: Contig
+    for x in indexed:
+        contig = contig_collection[x]
+        boundary_kmer: str
+        for boundary_kmer in (contig.start[:mink], contig.rcend[:mink]):
+            if boundary_filter.add(boundary_kmer):
+                duplicate_filter.add(boundary_kmer)
+            # end if
+        # end for
+    # end for
+
+    # 'mink'-windows of ends and rc-starts found in the filter of boundary k-mers.
+    # Windows are not stored: they are probed again below, once target k-mers are known,
+    #   since a saturated filter would otherwise retain almost every window.
+    for x in indexed:
+        window: str
+        for window in _iterate_windows(contig_collection[x], mink):
+            if window in boundary_filter:
+                hit_filter.add(window)
+            # end if
+        # end for
+    # end for
+
+    print('Bloom filters: {} x {} bytes, {} hash functions, expected false-positive rate {:.4f}'\
+        .format(_NUM_FILTERS, len(boundary_filter),
+                boundary_filter.num_hashes, boundary_filter.expected_fpr()))
+
+    # Only boundary k-mers passing the filters are sorted, to find shared ones exactly
+    duplicate_kmers: List[Tuple[str, ContigIndex]] = list()
+    target_kmers: List[Tuple[str, ContigIndex]] = list()
+    for x in indexed:
+        contig = contig_collection[x]
+        boundary_kmer: str
+        for boundary_kmer in (contig.start[:mink], contig.rcend[:mink]):
+            if boundary_kmer in duplicate_filter:
+                duplicate_kmers.append((boundary_kmer, x))
+            # end if
+            if boundary_kmer in hit_filter:
+                target_kmers.append((boundary_kmer, x))
+            # end if
+        # end for
+    # end for
+    duplicate_kmers.sort()
+    target_kmers.sort()
+
+    candidate_partners: List[Set[ContigIndex]] = [set() for _ in contig_collection]
+
+    # Pairs of contigs sharing boundary k-mers
+    a: int = 0
+    while a < len(duplicate_kmers):
+        b: int = a + 1
+        while b < len(duplicate_kmers) and duplicate_kmers[b][0] == duplicate_kmers[a][0]:
+            b += 1
+        # end while
+        contigs: List[ContigIndex] = sorted(set(kmer[1] for kmer in duplicate_kmers[a:b]))
+        c: int
+        for c in range(len(contigs) - 1):
+            candidate_partners[contigs[c]].update(contigs[c+1:])
+        # end for
+        a = b
+    # end while
+
+    # Pairs of contigs, such that a window of one of them is a boundary k-mer of the other one
+    target_seqs: List[str] = [kmer[0] for kmer in target_kmers]
+    for x in indexed:
+        for window in _iterate_windows(contig_collection[x], mink):
+            if not window in hit_filter:
+                continue
+            # end if
+            b = bisect_left(target_seqs, window)
+            while b < len(target_seqs) and target_seqs[b] == window:
+                y: ContigIndex = target_kmers[b][1]
+                if x < y:
+                    candidate_partners[x].add(y)
+                elif y < x:
+                    candidate_partners[y].add(x)
+                # end if
+                b += 1
+            # end while
+        # end for
+    # end for
+
+    return [sorted(partners) for partners in candidate_partners]
+# end def find_bloom_candidate_partners
+
+
+def _iterate_windows(contig: Contig, mink: int) -> Iterator[str]:
+    # Generator yields 'mink'-windows of end and rc-start of a contig.
+    seq: str
+    for seq in (contig.end, contig.rcstart):
+        pos: int
+        for pos in range(len(seq) - mink + 1):
+            yield seq[pos : pos+mink]
+        # end for
+    # end for
+# end def _iterate_windows
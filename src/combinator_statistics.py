@@ -1,6 +1,6 @@
 # -*- encoding: utf-8 -*-
 
-from typing import Collection, Sequence, Callable
+from typing import Collection, Sequence, Callable, Dict, List, Any
 from statistics import mean, median
 
 from src.contigs import ContigIndex, Contig, ContigCollection
@@ -8,6 +8,10 @@ from src.overlaps import START, RCSTART, END, RCEND
 from src.overlaps import Overlap, OverlapCollection
 
 
+# Number of termini of a contig
+_NUM_CONTIG_TERMINI: int = 2
+
+
 class CoverageCalculator:
     # Class for calcuating statistics associated with coverage.
 
@@ -111,38 +115,38 @@ def calc_lq_coef(contig_collection: ContigCollection,
     # :param overlap_collection: instance of OverlapCollection returned by
     #   `src.overlaps.detect_adjacent_contigs` function;
 
-    # Number of termini of a contig
-    num_contig_termini: int = 2
     # Total number of dead ends taking account of multiplicity
-    total_dead_ends: int = 0
+    total_dead_ends: int = sum(
+        _count_dead_ends(overlap_collection, i) for i in range(len(contig_collection))
+    )
 
-    i: int
-    contig: Contig
-    # Iterate over contigs
-    for i, contig in enumerate(contig_collection):
-        # Count overlaps associated with start
-        start_is_not_dead: int = is_not_empty(tuple(
-            filter(is_start_match, overlap_collection[i])
-        ))
-        # Count overlaps associated with end
-        end_is_not_dead:   int = is_not_empty(tuple(
-            filter(is_end_match, overlap_collection[i])
-        ))
-
-        # Calculate number of dead ends of the current contig
-        num_dead_ends: int = num_contig_termini \
-                             - start_is_not_dead - end_is_not_dead
-        # Add to `total_dead_ends`
-        total_dead_ends += num_dead_ends
-    # end for
+    return _calc_lq_coef(total_dead_ends, len(contig_collection))
+# end def calc_lq_coef
+
+
+def _count_dead_ends(overlap_collection: OverlapCollection, key: ContigIndex) -> int:
+    # Function counts dead ends (termini having no overlaps) of `key` contig.
+
+    # Count overlaps associated with start
+    start_is_not_dead: int = int(overlap_collection.count_start_overlaps(key) != 0)
+    # Count overlaps associated with end
+    end_is_not_dead:   int = int(overlap_collection.count_end_overlaps(key) != 0)
+
+    # Calculate number of dead ends of the current contig
+    return _NUM_CONTIG_TERMINI - start_is_not_dead - end_is_not_dead
+# end def _count_dead_ends
+
+
+def _calc_lq_coef(total_dead_ends: int, num_contigs: int) -> float:
+    # Function calculates LQ-coefficient from total number of dead ends.
 
     # Total number of termini taking account of multiplicity
-    total_termini: int = int(num_contig_termini * len(contig_collection))
+    total_termini: int = int(_NUM_CONTIG_TERMINI * num_contigs)
     # Calculate the LQ coefficient
     lq_coef: float = (1 - total_dead_ends / total_termini) * 100.0
 
     return round(lq_coef, 2)
-# end def calc_lq_coef
+# end def _calc_lq_coef
 
 
 def calc_exp_genome_size(contig_collection: ContigCollection,
@@ -153,65 +157,15 @@ def calc_exp_genome_size(contig_collection: ContigCollection,
     #   `src.overlaps.detect_adjacent_contigs` function;
 
     # In this variable, total length of overlapping regions will be stored
-    total_overlap_len: int = 0
-
-    # Iterate over contigs
-    i: ContigIndex
-    contig: Contig
-    for i, contig in enumerate(contig_collection):
-
-        # Get start-associated overlaps
-        start_ovls: Sequence[Overlap] = tuple(
-            filter(
-                is_start_match,
-                overlap_collection[i]
-            )
-        )
-        # Get end-associated overlaps
-        end_ovls: Sequence[Overlap] = tuple(
-            filter(
-                is_end_match,
-                overlap_collection[i]
-            )
-        )
-
-        # Function for `filter`.
-        # Purpose: we won't consider contigs with index > i
-        #   in order not to count an overlap twice.
-        not_already_counted: Callable = lambda x: x.contig_j >= i
-
-        ovls: Sequence[Overlap]
-        for ovls in (start_ovls, end_ovls):
-
-            ovls_to_add: Sequence[Overlap]
-
-            if len(ovls) <= contig.multplty:
-                # No extra overlaps. # We will just add lengths of overlaps to `total_overlap_len`.
-                ovls_to_add = filter(not_already_counted, ovls)
-            else:
-                # Some extra overlaps discovered.
-                # We will consider only M longest overlaps,
-                #   where M is contig's multiplicity.
-                ovls_to_add = filter(
-                    not_already_counted,
-                    sorted(                   # sort overlaps in a descending order
-                        ovls, key=lambda x: -x.ovl_len
-                    )[: int(contig.multplty)] # select M first (M the longest) overlaps
-                )
-            # end if
-
-            # Add lengths of overlaps to `total_overlap_len`
-            ovl: Overlap
-            for ovl in ovls_to_add:
-                total_overlap_len += ovl.ovl_len
-            # end for
-        # end for
-    # end for
+    total_overlap_len: int = sum(
+        _calc_overlap_len(overlap_collection, i, contig)
+        for i, contig in enumerate(contig_collection)
+    )
 
     # Calculate length of the genome, taking account of multiplicity of contigs.
     expected_genome_size: int = sum(                      # Sum products of contigs'
         map(                                              #   lengths and multiplicities:
-            lambda x: int(x.length * round(x.multplty)),  # len1*multplty1 + len2*multplty2 + ...
+            _calc_multiplied_length,                      # len1*multplty1 + len2*multplty2 + ...
             contig_collection
         )
     )\
@@ -221,6 +175,187 @@ def calc_exp_genome_size(contig_collection: ContigCollection,
 # end def calc_exp_genome_size
 
 
+def _calc_overlap_len(overlap_collection: OverlapCollection,
+                      i: ContigIndex, contig: Contig) -> int:
+    # Function calculates total length of overlapping regions of the i-th contig,
+    #   which are not counted for contigs preceding it.
+
+    total_overlap_len: int = 0
+
+    # Function for `filter`.
+    # Purpose: we won't consider contigs with index > i
+    #   in order not to count an overlap twice.
+    not_already_counted: Callable = lambda x: x.contig_j >= i
+
+    num_ovls: int
+    get_ovls: Callable[[ContigIndex], Sequence[Overlap]]
+    get_longest_ovls: Callable[[ContigIndex, int], Sequence[Overlap]]
+    for num_ovls, get_ovls, get_longest_ovls in (
+        (overlap_collection.count_start_overlaps(i),     # start-associated overlaps
+         overlap_collection.get_start_overlaps,
+         overlap_collection.get_longest_start_overlaps),
+        (overlap_collection.count_end_overlaps(i),       # end-associated overlaps
+         overlap_collection.get_end_overlaps,
+         overlap_collection.get_longest_end_overlaps),
+    ):
+
+        ovls_to_add: Sequence[Overlap]
+
+        if num_ovls <= contig.multplty:
+            # No extra overlaps. # We will just add lengths of overlaps to `total_overlap_len`.
+            ovls_to_add = filter(not_already_counted, get_ovls(i))
+        else:
+            # Some extra overlaps discovered.
+            # We will consider only M longest overlaps,
+            #   where M is contig's multiplicity.
+            # They are selected with a bounded heap instead of full sort of all overlaps.
+            ovls_to_add = filter(
+                not_already_counted,
+                get_longest_ovls(i, int(contig.multplty))
+            )
+        # end if
+
+        # Add lengths of overlaps to `total_overlap_len`
+        ovl: Overlap
+        for ovl in ovls_to_add:
+            total_overlap_len += ovl.ovl_len
+        # end for
+    # end for
+
+    return total_overlap_len
+# end def _calc_overlap_len
+
+
+def _calc_multiplied_length(contig: Contig) -> int:
+    # Function returns length of a contig multiplied by it's multiplicity.
+    return int(contig.length * round(contig.multplty))
+# end def _calc_multiplied_length
+
+
+class Summary:
+    # Container class representing summary statistics of an assembly.
+    # Fields:
+    #  1. `num_contigs` -- number of contigs.
+    #  2. `sum_contig_lengths` -- sum of contig lengths, bp.
+    #  3. `exp_genome_size` -- expected length of the genome, bp.
+    #  4. `min_coverage`, `max_coverage`, `mean_coverage`, `median_coverage` --
+    #    coverage statistics (None if no coverage values are available).
+    #  5. `lq_coef` -- LQ-coefficient.
+    #  6. `num_hub_termini` -- number of termini having more overlaps than the cap allows.
+    #  7. `num_dropped_overlaps` -- number of overlaps dropped by the cap.
+
+    def __init__(self, num_contigs: int, sum_contig_lengths: int, exp_genome_size: int,
+                 min_coverage: float, max_coverage: float,
+                 mean_coverage: float, median_coverage: float,
+                 lq_coef: float,
+                 num_hub_termini: int = 0, num_dropped_overlaps: int = 0) -> None:
+        self.num_contigs = num_contigs
+        self.sum_contig_lengths = sum_contig_lengths
+        self.exp_genome_size = exp_genome_size
+        self.min_coverage = min_coverage
+        self.max_coverage = max_coverage
+        self.mean_coverage = mean_coverage
+        self.median_coverage = median_coverage
+        self.lq_coef = lq_coef
+        self.num_hub_termini = num_hub_termini
+        self.num_dropped_overlaps = num_dropped_overlaps
+    # end def __init__
+
+    def as_dict(self) -> Dict[str, Any]:
+        # Returns dictionary of statistics for machine-readable output.
+        return dict(vars(self))
+    # end def as_dict
+# end class Summary
+
+
+class SummaryAccumulator:
+    # Class calculates all summary statistics in a single traversal of contigs
+    #   and their overlaps: contigs are added one by one,
+    #   and statistics are accumulated on the fly.
+
+    def __init__(self) -> None:
+        self._num_contigs: int = 0
+        self._sum_contig_lengths: int = 0
+        self._sum_multiplied_lengths: int = 0
+        self._total_overlap_len: int = 0
+        self._total_dead_ends: int = 0
+        self._num_hub_termini: int = 0
+        self._num_dropped_overlaps: int = 0
+        self._coverages: List[float] = list()
+    # end def __init__
+
+    def add_contig(self, overlap_collection: OverlapCollection,
+                   key: ContigIndex, contig: Contig) -> None:
+        # Method adds a contig and it's overlaps to the statistics.
+        # Multiplicity must be assigned to the contig.
+        #
+        # :param overlap_collection: instance of OverlapCollection;
+        # :param key: key (index) of the contig;
+        # :param contig: the contig;
+        self._num_contigs += 1
+        self._sum_contig_lengths += contig.length
+        self._sum_multiplied_lengths += _calc_multiplied_length(contig)
+        self._total_overlap_len += _calc_overlap_len(overlap_collection, key, contig)
+        self._total_dead_ends += _count_dead_ends(overlap_collection, key)
+        self._num_hub_termini += int(overlap_collection.is_start_hub(key)) \
+                                 + int(overlap_collection.is_end_hub(key))
+        self._num_dropped_overlaps += overlap_collection.count_dropped_overlaps(key)
+        if not contig.cov is None:
+            self._coverages.append(contig.cov)
+        # end if
+    # end def add_contig
+
+    def get_summary(self) -> Summary:
+        # Method returns accumulated statistics as instance of `Summary`.
+
+        min_coverage: float = None # no coverage values are available
+        max_coverage: float = None
+        mean_coverage: float = None
+        median_coverage: float = None
+        if len(self._coverages) != 0:
+            min_coverage = min(self._coverages)
+            max_coverage = max(self._coverages)
+            mean_coverage = round(mean(self._coverages), 2)
+            median_coverage = round(median(self._coverages), 2)
+        # end if
+
+        return Summary(
+            self._num_contigs,
+            self._sum_contig_lengths,
+            self._sum_multiplied_lengths - self._total_overlap_len,
+            min_coverage,
+            max_coverage,
+            mean_coverage,
+            median_coverage,
+            _calc_lq_coef(self._total_dead_ends, self._num_contigs),
+            self._num_hub_termini,
+            self._num_dropped_overlaps
+        )
+    # end def get_summary
+# end class SummaryAccumulator
+
+
+def calc_summary(contig_collection: ContigCollection,
+                 overlap_collection: OverlapCollection) -> Summary:
+    # Function calculates summary statistics in a single traversal of contigs.
+    # Multiplicity must be assigned to contigs.
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param overlap_collection: instance of OverlapCollection returned by
+    #   `src.overlaps.detect_adjacent_contigs` function;
+
+    accumulator: SummaryAccumulator = SummaryAccumulator()
+
+    i: ContigIndex
+    contig: Contig
+    for i, contig in enumerate(contig_collection):
+        accumulator.add_contig(overlap_collection, i, contig)
+    # end for
+
+    return accumulator.get_summary()
+# end def calc_summary
+
+
 def is_start_match(ovl: Overlap) -> bool:
     # Function returns True if overlap `ovl` is associated with start.
     return (ovl.terminus_i == START and ovl.terminus_j == END)\
@@ -0,0 +1,283 @@
+# -*- encoding: utf-8 -*-
+
+# Persistent cache of parsed contigs.
+#
+# Contigs parsed from an input file are stored in a compact binary file
+#   in cache directory (see `get_cache_dpath`), one cache file per input file.
+# The cache file stores size, mtime and content digest of the input file
+#   and maximum k-mer length ('maxk'), with which termini were cut.
+# Cached contigs are reused for any 'maxk' lower than or equal to the cached one:
+#   shorter termini are cut from stored ones.
+# Content digest is recalculated only if size or mtime of the input file changes,
+#   so that a touched, but unchanged file is not parsed again.
+
+import os
+import math
+import struct
+import hashlib
+from typing import List, Tuple, BinaryIO
+
+from src.contigs import Contig, ContigCollection, get_contig_collection
+
+
+# Name of default cache directory, which is created in user's cache directory
+#   (`$XDG_CACHE_HOME`, or `~/.cache` if it is not set)
+_CACHE_DNAME: str = 'combinator-FQ'
+
+# Extention of contig cache files
+_CONTIGS_EXT: str = '.contigs'
+
+# Cache file format
+_MAGIC: bytes = b'CFQC'
+_VERSION: int = 1
+# magic, version, file size, file mtime (ns), digest, maxk, number of contigs
+_HEADER_FORMAT: struct.Struct = struct.Struct('<4sHQQ16sII')
+# name length, contig length, coverage (NaN for None), GC-content,
+#   start length, end length
+_RECORD_FORMAT: struct.Struct = struct.Struct('<IQddII')
+
+# Size of blocks (in bytes), in which input files are read to calculate digest
+_DIGEST_BLOCK_SIZE: int = 1024 * 1024
+
+
+# Custom types declaration
+# Key of an input file: (size, mtime in nanoseconds, digest)
+FileKey = Tuple[int, int, bytes]
+
+
+def get_cache_dpath(cache_dpath: str = None) -> str:
+    # Function returns path to cache directory.
+    # Cache directory does not depend on output directory, thus the cache
+    #   is shared by runs writing results to different output directories.
+    # :param cache_dpath: path to cache directory specified by user,
+    #   or None for default one;
+
+    if not cache_dpath is None:
+        return os.path.abspath(cache_dpath)
+    # end if
+
+    user_cache_dpath: str = os.environ.get('XDG_CACHE_HOME', '')
+    if user_cache_dpath == '':
+        user_cache_dpath = os.path.join(os.path.expanduser('~'), '.cache')
+    # end if
+
+    return os.path.join(user_cache_dpath, _CACHE_DNAME)
+# end def get_cache_dpath
+
+
+def calc_file_digest(infpath: str) -> bytes:
+    # Function calculates digest of content of a file.
+    # :param infpath: path to the file;
+
+    digest = hashlib.blake2b(digest_size=16)
+
+    infile: BinaryIO
+    with open(infpath, 'rb') as infile:
+        block: bytes
+        for block in iter(lambda: infile.read(_DIGEST_BLOCK_SIZE), b''):
+            digest.update(block)
+        # end for
+    # end with
+
+    return digest.digest()
+# end def calc_file_digest
+
+
+def load_contig_collection(infpath: str, maxk: int, threads: int,
+                           cache_dpath: str) -> Tuple[ContigCollection, bytes]:
+    # Function returns collection of contigs from an input file and
+    #   digest of the input file.
+    # Contigs are loaded from cache, if possible. Otherwise, they are parsed
+    #   by `src.contigs.get_contig_collection` and stored in cache.
+    #
+    # :param infpath: path to input fasta file;
+    # :param maxk: maximum k-mer length to consider;
+    # :param threads: number of threads for decompression of BGZF files;
+    # :param cache_dpath: path to cache directory;
+
+    cache_fpath: str = _get_contigs_cache_fpath(infpath, cache_dpath)
+    file_stat: os.stat_result = os.stat(infpath)
+
+    cached_key: FileKey = None
+    cached_maxk: int = None
+    try:
+        cached_key, cached_maxk = _read_cache_header(cache_fpath)
+    except (OSError, ValueError, struct.error):
+        # No cache or it is corrupted
+        pass
+    # end try
+
+    digest: bytes
+    if not cached_key is None and cached_key[:2] == (file_stat.st_size, file_stat.st_mtime_ns):
+        # File is not modified: trust the stored digest
+        digest = cached_key[2]
+    else:
+        digest = calc_file_digest(infpath)
+    # end if
+
+    key: FileKey = (file_stat.st_size, file_stat.st_mtime_ns, digest)
+
+    if not cached_key is None and cached_key[2] == digest and maxk <= cached_maxk:
+        try:
+            contig_collection: ContigCollection = _read_cache(cache_fpath, maxk)
+        except (OSError, ValueError, struct.error):
+            pass
+        else:
+            print('Contigs are loaded from cache `{}`'.format(cache_fpath))
+            if cached_key != key:
+                # Update size and mtime of the file
+                _write_cache(cache_fpath, key, cached_maxk,
+                             _read_cache(cache_fpath, cached_maxk))
+            else:
+                # Mark the cache file as recently used
+                try:
+                    os.utime(cache_fpath)
+                except OSError:
+                    pass
+                # end try
+            # end if
+            return contig_collection, digest
+        # end try
+    # end if
+
+    contig_collection = get_contig_collection(infpath, maxk, threads)
+    _write_cache(cache_fpath, key, maxk, contig_collection)
+
+    return contig_collection, digest
+# end def load_contig_collection
+
+
+def _get_contigs_cache_fpath(infpath: str, cache_dpath: str) -> str:
+    # Function returns path to cache file for an input file.
+    # Name of the cache file is derived from absolute path to the input file.
+    path_digest: str = hashlib.blake2b(
+        os.path.abspath(infpath).encode('utf-8'),
+        digest_size=8
+    ).hexdigest()
+    return os.path.join(cache_dpath, path_digest + _CONTIGS_EXT)
+# end def _get_contigs_cache_fpath
+
+
+def _read_cache_header(cache_fpath: str) -> Tuple[FileKey, int]:
+    # Function reads header of a cache file.
+    # Returns key of the input file and 'maxk' of the cache.
+    # Raises ValueError if the file is not a cache file of current version.
+
+    cachefile: BinaryIO
+    with open(cache_fpath, 'rb') as cachefile:
+        return _unpack_header(cachefile.read(_HEADER_FORMAT.size))[:2]
+    # end with
+# end def _read_cache_header
+
+
+def _unpack_header(data: bytes) -> Tuple[FileKey, int, int]:
+    # Function unpacks header of a cache file:
+    #   returns key of the input file, 'maxk' and number of contigs.
+
+    magic, version, size, mtime_ns, digest, maxk, num_contigs = _HEADER_FORMAT.unpack(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError('invalid cache file')
+    # end if
+
+    return (size, mtime_ns, digest), maxk, num_contigs
+# end def _unpack_header
+
+
+def _read_cache(cache_fpath: str, maxk: int) -> ContigCollection:
+    # Function reads contigs from a cache file.
+    # Termini are cut to 'maxk' bases.
+    #
+    # :param cache_fpath: path to cache file;
+    # :param maxk: maximum k-mer length to consider;
+
+    cachefile: BinaryIO
+    with open(cache_fpath, 'rb') as cachefile:
+        data: bytes = cachefile.read()
+    # end with
+
+    num_contigs: int
+    _, _, num_contigs = _unpack_header(data[:_HEADER_FORMAT.size])
+    pos: int = _HEADER_FORMAT.size
+
+    contig_collection: ContigCollection = list()
+
+    for _ in range(num_contigs):
+        name_len, length, cov, gc_content, start_len, end_len = \
+            _RECORD_FORMAT.unpack_from(data, pos)
+        pos += _RECORD_FORMAT.size
+
+        name: str = data[pos : pos+name_len].decode('utf-8')
+        pos += name_len
+        start: str = data[pos : pos+start_len].decode('ascii')
+        pos += start_len
+        end: str = data[pos : pos+end_len].decode('ascii')
+        pos += end_len
+
+        contig_collection.append(
+            Contig(
+                name=name,
+                length=length,
+                cov=None if math.isnan(cov) else cov,
+                gc_content=gc_content,
+                start=start[:maxk],
+                end=end[-maxk:]
+            )
+        )
+    # end for
+
+    if pos != len(data):
+        raise ValueError('invalid cache file')
+    # end if
+
+    return contig_collection
+# end def _read_cache
+
+
+def _write_cache(cache_fpath: str, key: FileKey, maxk: int,
+                 contig_collection: ContigCollection) -> None:
+    # Function writes contigs to a cache file.
+    # Cache is written to a temporary file, which then replaces the cache file,
+    #   thus an interrupted run never leaves a truncated cache.
+    # Failure to write cache is not fatal.
+    #
+    # :param cache_fpath: path to cache file;
+    # :param key: key of the input file;
+    # :param maxk: maximum k-mer length, with which termini were cut;
+    # :param contig_collection: contigs to store;
+
+    parts: List[bytes] = [
+        _HEADER_FORMAT.pack(_MAGIC, _VERSION, *key, maxk, len(contig_collection))
+    ]
+
+    contig: Contig
+    for contig in contig_collection:
+        name: bytes = contig.name.encode('utf-8')
+        start: bytes = contig.start.encode('ascii')
+        end: bytes = contig.end.encode('ascii')
+        parts.append(
+            _RECORD_FORMAT.pack(
+                len(name), contig.length,
+                math.nan if contig.cov is None else contig.cov,
+                contig.gc_content,
+                len(start), len(end)
+            )
+        )
+        parts.extend((name, start, end))
+    # end for
+
+    tmp_fpath: str = '{}.{}.tmp'.format(cache_fpath, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(cache_fpath), exist_ok=True)
+        cachefile: BinaryIO
+        with open(tmp_fpath, 'wb') as cachefile:
+            cachefile.write(b''.join(parts))
+        # end with
+        os.replace(tmp_fpath, cache_fpath)
+    except OSError as err:
+        print('Warning: cannot write cache file `{}`.'.format(cache_fpath))
+        print(str(err))
+        if os.path.exists(tmp_fpath):
+            os.remove(tmp_fpath)
+        # end if
+    # end try
+# end def _write_cache
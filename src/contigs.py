@@ -1,12 +1,13 @@
 # -*- encoding: utf-8 -*-
 
 import re
-import gzip
+import mmap
 from functools import partial
-from typing import List, Tuple, Dict, Generator, NewType
-from typing import Callable, ContextManager, TextIO
+from typing import List, Tuple, Dict, Generator, NewType, Any, Optional
+from typing import Callable, BinaryIO, Iterator, Union
 
 from src.platform import platf_depend_exit
+from src.gzip_reader import iterate_gzip_chunks
 
 
 # Dictionary maps complementary bases according to IUPAC:
@@ -17,8 +18,32 @@ _COMPL_DICT: Dict[str, str] = {
     'H': 'D', 'V': 'B', 'U': 'A', 'N': 'N'
 }
 
+# Translation table for `str.translate` made of `_COMPL_DICT`
+_COMPL_TABLE: Dict[int, int] = str.maketrans(
+    ''.join(_COMPL_DICT.keys()),
+    ''.join(_COMPL_DICT.values())
+)
+
+# Translation table, which maps nucleotides to base-4 digits for packing of termini.
+# Complementary nucleotides map to digits d and 3-d, so that complement of a packed
+#   sequence of length n is obtained by XORing it with (4^n - 1).
+_PACK_TABLE: Dict[int, int] = str.maketrans('ACGT', '0123')
+
 # All possible bases for fasta validation
 _INVALID_SEQ_PATTERN = r'[^AGTCRYSWKMBDHVUN]+'
+_INVALID_BYTES_PATTERN = re.compile(_INVALID_SEQ_PATTERN.encode('ascii'), re.IGNORECASE)
+
+# Deletion tables for `bytes.translate`.
+# Deleting valid non-GC bases from a fragment leaves GC bases and invalid bases in it.
+# Deleting GC bases from the rest leaves invalid bases only.
+_NON_GC_BASES: bytes = b'ATRYWKMBDHVUNatrywkmbdhvun'
+_GC_BASES: bytes = b'GCSgcs'
+
+# Deletion table for `bytes.translate`, which removes line breaks from sequence data
+_LINE_BREAKS: bytes = b'\r\n'
+
+# Size of chunks (in bytes), in which input files are read
+_CHUNK_SIZE: int = 4 * 1024 * 1024
 
 # Pattern that matches SPAdes's header of a seqeunce in FASTA file
 _SPADES_PATTERN: str = r'^NODE_[0-9]+_length_[0-9]+_cov_[0-9,\.]+'
@@ -32,25 +57,60 @@ class Contig:
     #  3. `cov` -- coverage.
     #  4. `gc_content` -- GC-content.
     #  5. `start` -- prefix of length k of this contig.
-    #  6. `rcstart` -- reverse-complement of `start`.
+    #  6. `rcstart` -- reverse-complement of `start` (computed on first access).
     #  7. `end` -- suffix of length k of this contig.
-    #  8. `rcend` -- reverse-complement of `end`.
+    #  8. `rcend` -- reverse-complement of `end` (computed on first access).
     #  9. `multplty` -- multiplicity (copies of this contig in the genome).
+    #  10. `packed_start`, `packed_rcend` -- `start` and `rcend` packed into integers,
+    #    2 bits per base, the first base occupying the lowest bits (computed on first access).
+    #  11. `packed_end`, `packed_rcstart` -- `end` and `rcstart` packed into integers,
+    #    2 bits per base, the last base occupying the lowest bits (computed on first access).
+    #  Packed termini are None if termini contain IUPAC ambiguity codes.
 
     def __init__(self, name: str, length: int,
                  cov: float, gc_content: float,
-                 start: str, rcstart: str, end: str, rcend: str) -> None:
+                 start: str, end: str,
+                 rcstart: str = None, rcend: str = None) -> None:
         self.name = name
         self.length = length
         self.cov = cov
         self.gc_content = gc_content
         self.start = start
-        self.rcstart = rcstart
         self.end = end
-        self.rcend = rcend
+        if not rcstart is None:
+            self.rcstart = rcstart
+        # end if
+        if not rcend is None:
+            self.rcend = rcend
+        # end if
         self.multplty = None
     # end end __init__
 
+    def __getattr__(self, name: str) -> Any:
+        # Method is called only if attribute `name` is not set.
+        # Reverse complements and packed termini are computed here on first access and
+        #   stored as ordinary attributes: further accesses do not reach this method.
+        # Thus, contigs, which are never compared, never pay for reverse complement.
+        value: Any
+        if name == 'rcstart':
+            value = _rc(self.start)
+        elif name == 'rcend':
+            value = _rc(self.end)
+        elif name == 'packed_start':
+            value = _pack(self.start[::-1])
+        elif name == 'packed_end':
+            value = _pack(self.end)
+        elif name == 'packed_rcstart':
+            value = _complement_packed(self.packed_start, len(self.start))
+        elif name == 'packed_rcend':
+            value = _complement_packed(self.packed_end, len(self.end))
+        else:
+            raise AttributeError(name)
+        # end if
+        setattr(self, name, value)
+        return value
+    # end def __getattr__
+
 #     def __repr__(self):
 #         return '<Contig: {}; {} bp; coverage {}; GC content {}%. multiplicity {};\n\
 # {}\n\
@@ -66,20 +126,26 @@ class Contig:
 ContigCollection = NewType('ContigCollection', List[Contig])
 ContigIndex = NewType('ContigIndex', int)
 
+# Chunk of input file: bytes or memory-mapped file
+Chunk = Union[bytes, mmap.mmap]
+
 
-def get_contig_collection(infpath: str, maxk: int) -> ContigCollection:
+def get_contig_collection(infpath: str, maxk: int, threads: int = 1) -> ContigCollection:
     # Function parses a collection of `Contig`s (see above) from a given fasta file.
     # Returns instance of `ContigCollection` (see above).
     # :param infpath: path to input fasta file;
     # :param maxk: maximum k-mer length to consider;
+    # :param threads: number of threads for decompression of BGZF files;
 
     # Initialize result colletion
     contig_collection: ContigCollection = list()
 
-    # Iterate over contigs and form contig_collection
-    contig_header: str
-    contig_seq: str
-    for contig_header, contig_seq in _fasta_generator(infpath):
+    # Iterate over contigs and form contig_collection.
+    # Entire sequences are not stored: only their termini and statistics.
+    record: _FastaRecordSummary
+    for record in _fasta_summary_generator(infpath, maxk, threads):
+
+        contig_header: str = record.header[1:]
 
         # Simplify name
         contig_name: str = _format_contig_name(contig_header)
@@ -88,19 +154,20 @@ def get_contig_collection(infpath: str, maxk: int) -> ContigCollection:
         cov: float = _parse_coverage(contig_header)
 
         # Calculate GC-content
-        gc_content: float = _calc_gc_content(contig_seq)
+        gc_content: float = record.gc_count / record.length * 100
+
+        start: str = record.start.decode('ascii')
+        end: str = record.end.decode('ascii')
 
         # Append recently created contig to the `contig_collection`
         contig_collection.append(
             Contig(
                 name=contig_name,
-                length=len(contig_seq),
+                length=record.length,
                 cov=cov,
                 gc_content=gc_content,
-                start=contig_seq[:maxk],
-                rcstart=_rc(contig_seq[:maxk].upper()),
-                end=contig_seq[-maxk:].upper(),
-                rcend=_rc(contig_seq[-maxk:].upper())
+                start=start,
+                end=end
             )
         )
     # end for
@@ -109,23 +176,6 @@ def get_contig_collection(infpath: str, maxk: int) -> ContigCollection:
 # end def get_contig_collection
 
 
-def _calc_gc_content(sequence: str) -> float:
-    # Function calculates GC-content.
-    # :param sequence: sequence to calculate GC content;
-
-    gc_count: int = 0
-
-    base: str
-    for base in ('G', 'C', 'S'):
-        gc_count += sequence.count(base)
-    # end for
-
-    gc_content: float = (gc_count / len(sequence) * 100)
-
-    return gc_content
-# end def _calc_gc_content
-
-
 def _is_spades_header(header: str) -> bool:
     # function determines whether header is created by SPAdes.
     # :param header: fasta header of interest;
@@ -178,81 +228,258 @@ def _parse_coverage(fasta_header: str) -> str:
 # end def _parse_coverage
 
 
-def _get_compl_base(base: str) -> str:
-    # Function returns complement "comrade" of a given base.
-    return _COMPL_DICT[base]
-# end def _get_compl_base
-
-
 def _rc(seq: str) -> str:
     # Function returns reverse-complement "comrade" of passed DNA sequence.
-    return ''.join(
-        map(
-         _get_compl_base,
-         reversed(seq)
-        )
-    )
+    return seq.translate(_COMPL_TABLE)[::-1]
 # end def _rc
 
 
-def _fasta_generator(infpath: str) -> Generator[Tuple[str, str], None, None]:
-    # Generator yields "fasta-tuples: 0-th element of such a tuple is sequence name,
-    #   and 1-st element if sequence itself.
+def _pack(seq: str) -> Optional[int]:
+    # Function packs a sequence into an integer, 2 bits per base:
+    #   the last base occupies the lowest bits.
+    # Returns None if the sequence is empty or contains IUPAC ambiguity codes.
+    try:
+        return int(seq.translate(_PACK_TABLE), 4)
+    except ValueError:
+        return None
+    # end try
+# end def _pack
+
+
+def _complement_packed(packed: Optional[int], length: int) -> Optional[int]:
+    # Function returns complement of a packed sequence of given length.
+    # Order of bases is kept: packed reverse complement of a sequence is complement of
+    #   the sequence packed in reverse order.
+    if packed is None:
+        return None
+    # end if
+    return packed ^ ((1 << (2 * length)) - 1)
+# end def _complement_packed
+
+
+class _FastaRecordSummary:
+    # Class summarizes sequence of a fasta record on the fly,
+    #   so that the entire sequence is never stored:
+    #   length, GC count, invalid bases, first and last 'maxk' bases.
+
+    def __init__(self, header: str, maxk: int) -> None:
+        # :param header: fasta header (WITH preceding `>`);
+        # :param maxk: maximum k-mer length to consider;
+        self.header: str = header
+        self.length: int = 0
+        self.gc_count: int = 0
+        self.start: bytes = b''
+        self.end: bytes = b''
+        self._maxk: int = maxk
+        self._invalid_bases: List[Tuple[int, str]] = list()
+    # end def __init__
+
+    def feed(self, fragment: bytes) -> None:
+        # Method appends fragment (with no whitespace) to the summary.
+        # Fragment is swept by `bytes.translate` only, and uppercased are termini only.
+
+        # GC bases and invalid bases
+        rest: bytes = fragment.translate(None, _NON_GC_BASES)
+        # Invalid bases
+        invalid: bytes = rest.translate(None, _GC_BASES)
+
+        self.gc_count += len(rest) - len(invalid)
+
+        if len(invalid) != 0:
+            # Locate invalid bases: it is done once per invalid file, so regex is fine
+            self._invalid_bases.extend(
+                (self.length + match.start() + 1, match.group(0).upper().decode('utf-8', 'replace'))
+                for match in _INVALID_BYTES_PATTERN.finditer(fragment)
+            )
+        # end if
 
-    curr_seq_name: str = '' # current sequence name
-    curr_seq: str = '' # current sequence
+        self.length += len(fragment)
 
-    open_func: Callable[[str], ContextManager] # function for opening input file
+        if len(self.start) < self._maxk:
+            self.start += fragment[: self._maxk - len(self.start)].upper()
+        # end if
+        self.end = (self.end + fragment[-self._maxk:].upper())[-self._maxk:]
+    # end def feed
 
-    # Choose `open_func`
-    if infpath.endswith('.gz'):
-        open_func = partial(gzip.open, mode='rt', encoding='utf-8')
-    else:
-        open_func = partial(open, mode='rt', encoding='utf-8')
-    # end if
+    def finish(self) -> None:
+        # Method validates the record.
+        _check_fasta_record(self.header, self.length, self._invalid_bases)
+    # end def finish
+# end class _FastaRecordSummary
 
-    infile: TextIO
-    with open_func(infpath) as infile:
 
-        eof: bool = False # indicates of End Of File is reached
+def _fasta_summary_generator(infpath: str, maxk: int,
+                             threads: int = 1) -> Generator['_FastaRecordSummary', None, None]:
+    # Generator yields summaries (see `_FastaRecordSummary`) of fasta records.
+    # :param infpath: path to input fasta file;
+    # :param maxk: maximum k-mer length to consider;
+    # :param threads: number of threads for decompression of BGZF files;
+    return _scan_fasta(infpath, lambda header: _FastaRecordSummary(header, maxk), threads)
+# end def _fasta_summary_generator
+
+
+def _iterate_chunks(infpath: str, threads: int = 1) -> Iterator[Chunk]:
+    # Generator yields contents of input fasta file in chunks.
+    # Plain files are memory-mapped and yielded as a single chunk:
+    #   the OS page cache serves the data, and no copy of the file is made.
+    # Gzipped files are decompressed concurrently with parsing
+    #   (see `src.gzip_reader`) and yielded in chunks of about `_CHUNK_SIZE` bytes.
+    #
+    # :param infpath: path to input fasta file;
+    # :param threads: number of threads for decompression of BGZF files;
 
-        # Get the first sequence name
-        curr_seq_name = infile.readline().strip()
+    if infpath.endswith('.gz'):
+        yield from iterate_gzip_chunks(infpath, _CHUNK_SIZE, threads)
+        return
+    # end if
 
-        while not eof:
-            # Get next line whatever it is
-            line: str = infile.readline().strip()
+    infile: BinaryIO
 
-            if line.startswith('>') or line == '':
-                # We reached end of current sequence
+    with open(infpath, mode='rb') as infile:
+        try:
+            mapped_file: mmap.mmap = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and non-regular files (e.g. pipes) cannot be mapped
+            yield from iter(partial(infile.read, _CHUNK_SIZE), b'')
+        else:
+            with mapped_file:
+                yield mapped_file
+            # end with
+        # end try
+    # end with
+# end def _iterate_chunks
 
-                # Validate parsed sequence
-                try:
-                    _validate_fasta(curr_seq_name, curr_seq)
-                except ValueError:
-                    platf_depend_exit(1)
-                # end try
 
-                yield curr_seq_name[1:], curr_seq # yield current sequence
+def _scan_fasta(infpath: str, make_record: Callable[[str], Any],
+                threads: int = 1) -> Generator[Any, None, None]:
+    # Generator parses fasta file and yields complete and validated records.
+    # Sequence data between headers is passed to records as whole fragments,
+    #   rather than line by line. Fragments are at most `_CHUNK_SIZE` bytes long.
+    # Chunks are accessed only by `find` and slicing, thus they may be
+    #   either bytes or memory-mapped files.
+    #
+    # :param infpath: path to input fasta file;
+    # :param make_record: function, which creates a record from a header.
+    #   Record must have methods `feed(fragment)` and `finish()`;
+    # :param threads: number of threads for decompression of BGZF files;
+
+    record: Any = None                # current record
+    header_parts: List[bytes] = None # parts of current header, if it is being read
+    at_line_start: bool = True       # indicates if scanning position is at line start
+
+    chunk: Chunk
+    for chunk in _iterate_chunks(infpath, threads):
+
+        chunk_len: int = len(chunk)
+        pos: int = 0
+        while pos < chunk_len:
+
+            if not header_parts is None:
+                # Read header until the end of line
+                eol: int = chunk.find(b'\n', pos)
+                if eol == -1:
+                    header_parts.append(chunk[pos:])
+                    break
+                # end if
+                header_parts.append(chunk[pos:eol])
+                record = make_record(_decode_header(header_parts))
+                header_parts = None
+                pos = eol + 1
+                at_line_start = True
+            else:
+                # Find the next header
+                next_header: int
+                if at_line_start and chunk[pos:pos+1] == b'>':
+                    next_header = pos
+                else:
+                    next_header = chunk.find(b'\n>', pos)
+                    if next_header != -1:
+                        next_header += 1
+                    # end if
+                # end if
+                region_end: int = next_header if next_header != -1 else chunk_len
+
+                # Pass sequence data preceding the header to the current record
+                window_start: int
+                for window_start in range(pos, region_end, _CHUNK_SIZE):
+                    window: bytes = chunk[window_start : min(window_start + _CHUNK_SIZE,
+                                                             region_end)]
+                    # Only line breaks are removed: other whitespace is reported as invalid bases
+                    fragment: bytes = window.translate(None, _LINE_BREAKS)
+                    if len(fragment) != 0:
+                        if record is None:
+                            # There is sequence data before the first header
+                            _exit_not_fasta(window.split(b'\n')[0].strip())
+                        # end if
+                        record.feed(fragment)
+                    # end if
+                # end for
+                if region_end > pos:
+                    at_line_start = chunk[region_end-1:region_end] == b'\n'
+                # end if
 
-                curr_seq_name = line # read next header
-                curr_seq = ''        # empty sequence
+                if next_header == -1:
+                    break
+                # end if
 
-                if line == '': # no more sequences -- end of file
-                    eof = True
+                # Current record is complete
+                if not record is None:
+                    yield _finish_record(record)
                 # end if
-            else:
-                curr_seq += line.upper() # new line is a sequence -- append it to `curr_seq`
+                header_parts = list()
+                pos = next_header
             # end if
         # end while
-    # end with
-# end def _fasta_generator
+    # end for
+
+    # Header at the end of file
+    if not header_parts is None:
+        record = make_record(_decode_header(header_parts))
+    # end if
+
+    if record is None:
+        # Empty file
+        _exit_not_fasta(b'')
+    # end if
+
+    yield _finish_record(record)
+# end def _scan_fasta
+
+
+def _decode_header(header_parts: List[bytes]) -> str:
+    # Function joins parts of fasta header and converts them to string.
+    return b''.join(header_parts).decode('utf-8', 'replace').strip()
+# end def _decode_header
+
+
+def _finish_record(record: Any) -> Any:
+    # Function validates a complete fasta record and exits if it is invalid.
+    try:
+        record.finish()
+    except ValueError:
+        platf_depend_exit(1)
+    # end try
+    return record
+# end def _finish_record
+
+
+def _exit_not_fasta(first_line: bytes) -> None:
+    # Function reports that file does not start with a fasta header and exits.
+    try:
+        _check_fasta_record(first_line.decode('utf-8', 'replace'), 0, list())
+    except ValueError:
+        platf_depend_exit(1)
+    # end try
+# end def _exit_not_fasta
 
 
-def _validate_fasta(curr_seq_name: str, curr_seq: str):
-    # Function validates fasta given record.
+def _check_fasta_record(curr_seq_name: str, seq_len: int,
+                        invalid_bases: List[Tuple[int, str]]):
+    # Function validates fasta record given it's header and summary of the sequence.
     # :param curr_seq_name: fasta header of current sequence (WITH preceding `>`);
-    # :param curr_seq: sequence casted to uppercase;
+    # :param seq_len: length of the sequence;
+    # :param invalid_bases: invalid fragments found in the sequence
+    #   and their 1-based positions: [(position, fragment), ...];
 
     # Validate header
     if not curr_seq_name.startswith('>'):
@@ -262,20 +489,19 @@ def _validate_fasta(curr_seq_name: str, curr_seq: str):
         raise ValueError
     # end if
 
-    # Check if `curr_seq` is not empty string
-    if curr_seq == '':
+    # Check if sequence is not empty
+    if seq_len == 0:
         print('Error: sequence `{}` is empty.'.format(curr_seq_name))
         raise ValueError
     # end if
 
     # Validate sequence
-    invalid_bases: List[str] = re.findall(_INVALID_SEQ_PATTERN, curr_seq)
     if len(invalid_bases) != 0:
         print('Error: invalid bases found in fasta sequence `{}`.'.format(curr_seq_name))
         # Surround invalid data with backticks for convenience
         print('Here they are: {}'.format(
-            ', '.join(map(lambda x: '`{}`'.format(x), invalid_bases))
+            ', '.join(map(lambda x: '`{}` (position {})'.format(x[1], x[0]), invalid_bases))
         ))
         raise ValueError
     # end if
-# end def _validate_fasta
+# end def _check_fasta_record
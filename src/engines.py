@@ -0,0 +1,79 @@
+# -*- encoding: utf-8 -*-
+
+from typing import Callable, Dict
+
+from src.contigs import ContigCollection
+from src.overlaps import OverlapCollection, detect_adjacent_contigs
+from src.terminus_index import detect_adjacent_contigs_hashed
+from src.terminus_matrix import detect_adjacent_contigs_numpy
+from src.sorted_termini import detect_adjacent_contigs_sorted
+from src.minimizers import detect_adjacent_contigs_minimizers
+from src.bloom import detect_adjacent_contigs_bloom, DEFAULT_BLOOM_FPR, DEFAULT_BLOOM_MEMORY
+from src.parallel import detect_adjacent_contigs_parallel
+
+
+# Function, which detects adjacent contigs:
+#   (contig_collection, mink, maxk, max_overlaps_per_terminus) -> OverlapCollection
+DetectionEngine = Callable[[ContigCollection, int, int, int], OverlapCollection]
+
+
+# Dictionary maps names of overlap detection engines to engines themselves.
+# All engines return identical `OverlapCollection`s.
+ENGINES: Dict[str, DetectionEngine] = {
+    'pairwise':  detect_adjacent_contigs,            # compare termini of each pair of contigs
+    'hash':      detect_adjacent_contigs_hashed,     # look termini up in hash indices
+    'numpy':     detect_adjacent_contigs_numpy,      # compare termini in vectorized way
+    'sorted':    detect_adjacent_contigs_sorted,     # walk runs of sorted termini
+    'minimizer': detect_adjacent_contigs_minimizers, # compare contigs sharing minimizers
+    'bloom':     detect_adjacent_contigs_bloom,      # compare contigs passing Bloom filters
+}
+
+DEFAULT_ENGINE: str = 'pairwise'
+
+# Engine, which is used by default if 'maxk' is at least `LONG_OVERLAP_MAXK`.
+# Pairwise search of long suffix-prefix overlaps is slow, and hash indices grow
+#   with each k, while sorted termini take memory proportional to total length
+#   of termini, and only suffixes starting with a seed are searched
+#   (see `src.sorted_termini` for time complexity).
+LONG_OVERLAP_ENGINE: str = 'sorted'
+LONG_OVERLAP_MAXK: int = 1000
+
+# Engine, which is used by sweep over k-mer lengths (see `src.k_sweep`)
+K_SWEEP_ENGINE: str = 'hash'
+# Engine, which is used by shards of pairs of contigs (see `src.sharding`)
+SHARD_ENGINE: str = 'pairwise'
+
+
+def detect_overlaps(contig_collection: ContigCollection,
+                    mink: int, maxk: int, engine: str,
+                    threads: int = 1,
+                    bloom_fpr: float = DEFAULT_BLOOM_FPR,
+                    bloom_memory: int = DEFAULT_BLOOM_MEMORY,
+                    max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function detects adjacent contigs using engine specified by name.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param engine: name of the engine (a key of `ENGINES`);
+    # :param threads: number of processes for pairwise comparison;
+    # :param bloom_fpr: false-positive rate of Bloom filters of `bloom` engine;
+    # :param bloom_memory: memory budget for Bloom filters of `bloom` engine, MB;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig during detection; None means no limit;
+
+    # Pairwise comparison can be distributed among multiple processes
+    if engine == 'pairwise' and threads > 1:
+        return detect_adjacent_contigs_parallel(contig_collection, mink, maxk, threads,
+                                                max_overlaps_per_terminus)
+    # end if
+
+    if engine == 'bloom':
+        return detect_adjacent_contigs_bloom(contig_collection, mink, maxk,
+                                             bloom_fpr, bloom_memory,
+                                             max_overlaps_per_terminus)
+    # end if
+
+    return ENGINES[engine](contig_collection, mink, maxk, max_overlaps_per_terminus)
+# end def detect_overlaps
@@ -1,5 +1,13 @@
 # -*- encoding: utf-8 -*-
 
+from typing import List, Optional
+
+
+# Number of false occurences of an overlap seed, after which
+#   `find_overlap_e2s` switches to linear-time border computation.
+_MAX_FAILED_CANDIDATES: int = 8
+
+
 def find_overlap_s2s(seq1: str, seq2: str, mink: int, maxk: int) -> int:
     # Function searches for identity between starts of seq1 and seq2.
     # Function regards overlap of length [mink, maxk].
@@ -36,17 +44,92 @@ def find_overlap_e2s(seq1: str, seq2: str, mink: int, maxk: int) -> int:
     # Returns 0 if overlap is less than 'mink' and
     #   length of overlap (which is <= maxk) otherwise.
 
-    ovl_len: int = 0
+    if mink > maxk:
+        return 0
+    # end if
+
+    # Entire sequences shorter than 'maxk' match each other at every i >= their length
+    #   (`seq1[-i:]` and `seq2[:i]` are both entire sequences in this case).
+    if len(seq1) < maxk and seq1 == seq2:
+        return maxk
+    # end if
+
+    suffix: str = seq1[-maxk:]
+    prefix: str = seq2[:maxk]
+
+    # Overlap must start with the first 'mink' bases of `prefix`.
+    # Thus, we search for this seed in `suffix` from left to right, and
+    #   the first occurence, which is followed by the rest of `prefix`,
+    #   gives the longest overlap.
+    seed: str = prefix[:mink]
+    if len(seed) < mink:
+        return 0
+    # end if
+
+    suffix_len: int = len(suffix)
+    failed_candidates: int = 0
+
+    pos: int = suffix.find(seed, max(0, suffix_len - len(prefix)))
+    while pos != -1:
+        if prefix.startswith(suffix[pos:]):
+            return suffix_len - pos
+        # end if
+
+        # Low-complexity sequences contain lots of false seed occurences.
+        # Resort to linear-time border computation to avoid quadratic behaviour.
+        failed_candidates += 1
+        if failed_candidates > _MAX_FAILED_CANDIDATES:
+            ovl_len: int = _longest_border(prefix, suffix)
+            return ovl_len if ovl_len >= mink else 0
+        # end if
+
+        pos = suffix.find(seed, pos + 1)
+    # end while
+
+    return 0
+# end def find_overlap_e2s
+
+
+def _longest_border(prefix: str, suffix: str) -> int:
+    # Function finds length of the longest suffix of `suffix`,
+    #   which is a prefix of `prefix`, in a single linear pass.
+    # It is Knuth-Morris-Pratt matching of `prefix` against `suffix`:
+    #   the state after the last character of `suffix` is the answer.
+    #
+    # :param prefix: sequence, start of which is matched;
+    # :param suffix: sequence, end of which is matched;
+
+    prefix_len: int = len(prefix)
+
+    # Compute failure function of `prefix`
+    failure: List[int] = [0] * prefix_len
+    border: int = 0
 
     i: int
-    for i in range(mink, maxk+1):
-        if seq1[-i:] == seq2[:i]:
-            ovl_len = i
+    for i in range(1, prefix_len):
+        while border != 0 and prefix[border] != prefix[i]:
+            border = failure[border - 1]
+        # end while
+        if prefix[border] == prefix[i]:
+            border += 1
         # end if
+        failure[i] = border
     # end for
 
-    return ovl_len
-# end def find_overlap_e2s
+    # Match `prefix` against `suffix`
+    border = 0
+    base: str
+    for base in suffix:
+        while border != 0 and (border == prefix_len or prefix[border] != base):
+            border = failure[border - 1]
+        # end while
+        if border != prefix_len and prefix[border] == base:
+            border += 1
+        # end if
+    # end for
+
+    return border
+# end def _longest_border
 
 
 def find_overlap_e2e(seq1: str, seq2: str, mink: int, maxk: int) -> int:
@@ -71,3 +154,97 @@ def find_overlap_e2e(seq1: str, seq2: str, mink: int, maxk: int) -> int:
 
     return 0 if overlap == 0 else (mink + overlap - 1)
 # end def find_overlap_e2e
+
+
+def find_overlap_s2s_packed(seq1: str, packed1: Optional[int],
+                            seq2: str, packed2: Optional[int],
+                            mink: int, maxk: int) -> int:
+    # Function searches for identity between starts of seq1 and seq2
+    #   using their packed representations (see `src.contigs.Contig`):
+    #   the first base occupies the lowest bits.
+    # Falls back to `find_overlap_s2s` if a sequence cannot be packed.
+    # Returns the same value as `find_overlap_s2s` does.
+    #
+    # :param seq1: one sequence;
+    # :param packed1: `seq1` packed, or None;
+    # :param seq2: another sequence;
+    # :param packed2: `seq2` packed, or None;
+    # :param mink: minimun overlap;
+    # :param maxk: maximum overlap;
+
+    if packed1 is None or packed2 is None:
+        return find_overlap_s2s(seq1, seq2, mink, maxk)
+    # end if
+
+    # Lowest set bit of XOR of packed sequences is the first mismatch,
+    #   thus longest common prefix (LCP) is found without per-base loop
+    diff: int = packed1 ^ packed2
+    lcp: int = ((diff & -diff).bit_length() - 1) >> 1
+
+    if lcp < mink and diff != 0:
+        return 0
+    # end if
+    return _limit_packed_lcp(lcp, diff, len(seq1), len(seq2), mink, maxk)
+# end def find_overlap_s2s_packed
+
+
+def find_overlap_e2e_packed(seq1: str, packed1: Optional[int],
+                            seq2: str, packed2: Optional[int],
+                            mink: int, maxk: int) -> int:
+    # Function searches for identity between ends of seq1 and seq2
+    #   using their packed representations (see `src.contigs.Contig`):
+    #   the last base occupies the lowest bits.
+    # Falls back to `find_overlap_e2e` if a sequence cannot be packed.
+    # Returns the same value as `find_overlap_e2e` does.
+    #
+    # :param seq1: one sequence;
+    # :param packed1: `seq1` packed, or None;
+    # :param seq2: another sequence;
+    # :param packed2: `seq2` packed, or None;
+    # :param mink: minimun overlap;
+    # :param maxk: maximum overlap;
+
+    if packed1 is None or packed2 is None:
+        return find_overlap_e2e(seq1, seq2, mink, maxk)
+    # end if
+
+    # Longest common suffix is found as LCP in `find_overlap_s2s_packed`
+    diff: int = packed1 ^ packed2
+    lcp: int = ((diff & -diff).bit_length() - 1) >> 1
+
+    if lcp < mink and diff != 0:
+        return 0
+    # end if
+    return _limit_packed_lcp(lcp, diff, len(seq1), len(seq2), mink, maxk)
+# end def find_overlap_e2e_packed
+
+
+def _limit_packed_lcp(lcp: int, diff: int, len1: int, len2: int,
+                      mink: int, maxk: int) -> int:
+    # Function turns LCP of packed sequences into length of an overlap.
+    # Missing bases of a shorter sequence are zero bits, thus LCP is limited by lengths.
+    #
+    # :param lcp: LCP of packed sequences (negative if they are equal);
+    # :param diff: XOR of packed sequences;
+    # :param len1: length of the 1-st sequence;
+    # :param len2: length of the 2-nd sequence;
+    # :param mink: minimun overlap;
+    # :param maxk: maximum overlap;
+
+    if mink > maxk:
+        return 0
+    # end if
+
+    # Entire equal sequences match each other at every length (see `find_overlap_s2s`)
+    if diff == 0 and len1 == len2:
+        return maxk
+    # end if
+
+    if diff == 0:
+        lcp = min(len1, len2)
+    else:
+        lcp = min(lcp, len1, len2)
+    # end if
+
+    return 0 if lcp < mink else min(lcp, maxk)
+# end def _limit_packed_lcp
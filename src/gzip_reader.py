@@ -0,0 +1,284 @@
+# -*- encoding: utf-8 -*-
+
+# Decompression of gzipped input files concurrently with parsing.
+#
+# BGZF files (blocked gzip, as written by `bgzip`) consist of independent gzip members,
+#   and size of each member is stored in it's header. Therefore, members can be
+#   located without decompression and decompressed in a pool of threads.
+# Boundaries of members of ordinary gzip files are not known until they are decompressed,
+#   so such files are decompressed sequentially, but in a background thread.
+# If a BGZF file is followed by ordinary gzip members (e.g. files are concatenated),
+#   these members are decompressed sequentially after BGZF blocks.
+# zlib releases the GIL while decompressing, thus decompression and parsing overlap.
+
+import gzip
+import zlib
+import queue
+import struct
+import threading
+from functools import partial
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Iterator, BinaryIO, Deque, Any
+
+
+# Length of fixed part of gzip header: magic, CM, FLG, MTIME, XFL, OS, XLEN
+_GZIP_HEADER_LEN: int = 12
+# FEXTRA flag of gzip header
+_FEXTRA: int = 4
+
+# Maximum number of decompressed chunks waiting to be parsed, per thread
+_QUEUE_SIZE_PER_THREAD: int = 2
+
+# Timeout (in seconds) of putting a chunk to a full queue.
+# The background thread checks if reading is cancelled after this timeout.
+_PUT_TIMEOUT: float = 0.1
+
+
+def iterate_gzip_chunks(infpath: str, chunk_size: int, threads: int) -> Iterator[bytes]:
+    # Generator yields decompressed contents of a gzipped file in chunks,
+    #   in order of their appearance in the file.
+    # BGZF files are decompressed in `threads` threads,
+    #   other gzip files are decompressed in a single background thread.
+    #
+    # :param infpath: path to gzipped file;
+    # :param chunk_size: approximate size of chunks (in bytes) to yield;
+    # :param threads: number of threads to decompress BGZF files in;
+
+    if is_bgzf(infpath):
+        return _iterate_bgzf_chunks(infpath, chunk_size, threads)
+    # end if
+    return _iterate_gzip_chunks_background(infpath, chunk_size)
+# end def iterate_gzip_chunks
+
+
+def is_bgzf(infpath: str) -> bool:
+    # Function checks if a gzipped file is a BGZF file,
+    #   i.e. if header of it's first member contains BGZF block size.
+    #
+    # :param infpath: path to gzipped file;
+
+    infile: BinaryIO
+    with open(infpath, 'rb') as infile:
+        try:
+            return _read_bgzf_block(infile) != b''
+        except ValueError:
+            return False
+        # end try
+    # end with
+# end def is_bgzf
+
+
+def _read_bgzf_block(infile: BinaryIO) -> bytes:
+    # Function reads a single BGZF block (an entire gzip member) from a file.
+    # Returns empty bytes at the end of file.
+    # Raises ValueError if there is no valid BGZF block at current position.
+    #
+    # :param infile: file opened in binary mode;
+
+    header: bytes = infile.read(_GZIP_HEADER_LEN)
+    if len(header) == 0:
+        return b''
+    # end if
+
+    if len(header) < _GZIP_HEADER_LEN or header[:2] != b'\x1f\x8b' \
+       or not header[3] & _FEXTRA:
+        raise ValueError('not a BGZF block')
+    # end if
+
+    xlen: int = struct.unpack('<H', header[10:12])[0]
+    extra: bytes = infile.read(xlen)
+
+    # Look for 'BC' subfield containing size of the block minus 1
+    pos: int = 0
+    while pos + 4 <= len(extra):
+        subfield_len: int = struct.unpack('<H', extra[pos+2 : pos+4])[0]
+        if extra[pos : pos+2] == b'BC' and subfield_len == 2:
+            block_size: int = struct.unpack('<H', extra[pos+4 : pos+6])[0] + 1
+            rest: bytes = infile.read(block_size - _GZIP_HEADER_LEN - xlen)
+            if len(rest) != block_size - _GZIP_HEADER_LEN - xlen:
+                raise ValueError('truncated BGZF block')
+            # end if
+            return header + extra + rest
+        # end if
+        pos += 4 + subfield_len
+    # end while
+
+    raise ValueError('not a BGZF block')
+# end def _read_bgzf_block
+
+
+def _iterate_bgzf_batches(infile: BinaryIO, batch_size: int) -> Iterator[List[bytes]]:
+    # Generator groups BGZF blocks into batches of approximately `batch_size`
+    #   compressed bytes. A batch is a unit of work for a decompressing thread.
+    # Generator stops at the first member, which is not a BGZF block,
+    #   and leaves the file positioned at the start of this member.
+    #
+    # :param infile: BGZF file opened in binary mode;
+    # :param batch_size: approximate size of a batch (in bytes);
+
+    batch: List[bytes] = list()
+    size: int = 0
+
+    while True:
+        offset: int = infile.tell()
+        block: bytes
+        try:
+            block = _read_bgzf_block(infile)
+        except ValueError:
+            infile.seek(offset)
+            break
+        # end try
+        if block == b'':
+            break
+        # end if
+
+        batch.append(block)
+        size += len(block)
+        if size >= batch_size:
+            yield batch
+            batch = list()
+            size = 0
+        # end if
+    # end while
+
+    if len(batch) != 0:
+        yield batch
+    # end if
+# end def _iterate_bgzf_batches
+
+
+def _decompress_batch(batch: List[bytes]) -> bytes:
+    # Function decompresses a batch of BGZF blocks.
+    # :param batch: list of entire gzip members;
+    return b''.join(map(lambda block: zlib.decompress(block, 16 + zlib.MAX_WBITS), batch))
+# end def _decompress_batch
+
+
+def _iterate_bgzf_chunks(infpath: str, chunk_size: int, threads: int) -> Iterator[bytes]:
+    # Generator decompresses batches of BGZF blocks in a pool of threads
+    #   and yields them in order. Members following the last BGZF block
+    #   are decompressed sequentially.
+    # At most `threads * _QUEUE_SIZE_PER_THREAD` batches are in progress at once,
+    #   thus memory consumption is bounded.
+    #
+    # :param infpath: path to BGZF file;
+    # :param chunk_size: approximate size of compressed batches (in bytes);
+    # :param threads: number of threads;
+
+    max_pending: int = max(1, threads) * _QUEUE_SIZE_PER_THREAD
+    pending: Deque[Future] = deque()
+
+    infile: BinaryIO
+    executor: ThreadPoolExecutor
+    with open(infpath, 'rb') as infile, ThreadPoolExecutor(max(1, threads)) as executor:
+        try:
+            batch: List[bytes]
+            for batch in _iterate_bgzf_batches(infile, chunk_size):
+                pending.append(executor.submit(_decompress_batch, batch))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                # end if
+            # end for
+
+            while len(pending) != 0:
+                yield pending.popleft().result()
+            # end while
+
+            # Rest of the file is not BGZF
+            gzfile: BinaryIO
+            with gzip.GzipFile(fileobj=infile, mode='rb') as gzfile:
+                yield from iter(partial(gzfile.read, chunk_size), b'')
+            # end with
+        finally:
+            # Do not decompress remaining batches if reading is cancelled
+            future: Future
+            for future in pending:
+                future.cancel()
+            # end for
+        # end try
+    # end with
+# end def _iterate_bgzf_chunks
+
+
+def _iterate_gzip_chunks_background(infpath: str, chunk_size: int) -> Iterator[bytes]:
+    # Generator yields chunks of a gzipped file decompressed in a background thread.
+    # Chunks are passed through a bounded queue, thus the thread stays
+    #   at most `_QUEUE_SIZE_PER_THREAD` chunks ahead of parsing.
+    #
+    # :param infpath: path to gzipped file;
+    # :param chunk_size: size of chunks (in bytes);
+
+    chunk_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_SIZE_PER_THREAD)
+    cancelled: threading.Event = threading.Event()
+
+    reader: threading.Thread = threading.Thread(
+        target=_decompress_to_queue,
+        args=(infpath, chunk_size, chunk_queue, cancelled),
+        daemon=True
+    )
+    reader.start()
+
+    try:
+        while True:
+            item: Any = chunk_queue.get()
+            if item is None:
+                break
+            elif isinstance(item, BaseException):
+                raise item
+            # end if
+            yield item
+        # end while
+    finally:
+        cancelled.set()
+        reader.join()
+    # end try
+# end def _iterate_gzip_chunks_background
+
+
+def _decompress_to_queue(infpath: str, chunk_size: int,
+                         chunk_queue: queue.Queue, cancelled: threading.Event) -> None:
+    # Function is the target of the background decompressing thread.
+    # It puts decompressed chunks to the queue, and then None.
+    # If an error occurs, the exception is put to the queue instead.
+    #
+    # :param infpath: path to gzipped file;
+    # :param chunk_size: size of chunks (in bytes);
+    # :param chunk_queue: queue to put chunks to;
+    # :param cancelled: event, which is set if reading is cancelled;
+
+    item: Any
+    try:
+        infile: BinaryIO
+        with gzip.open(infpath, 'rb') as infile:
+            for item in iter(partial(infile.read, chunk_size), b''):
+                if not _put_unless_cancelled(chunk_queue, item, cancelled):
+                    return
+                # end if
+            # end for
+        # end with
+        item = None
+    except Exception as err:
+        item = err
+    # end try
+
+    _put_unless_cancelled(chunk_queue, item, cancelled)
+# end def _decompress_to_queue
+
+
+def _put_unless_cancelled(chunk_queue: queue.Queue, item: Any,
+                          cancelled: threading.Event) -> bool:
+    # Function puts an item to the queue waiting for a free slot.
+    # Returns False if reading is cancelled before the item is put, else True.
+
+    while not cancelled.is_set():
+        try:
+            chunk_queue.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            pass
+        # end try
+    # end while
+
+    return False
+# end def _put_unless_cancelled
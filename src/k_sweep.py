@@ -0,0 +1,76 @@
+# -*- encoding: utf-8 -*-
+
+# Sweep over k-mer lengths.
+#
+# For each k of a sweep, overlaps of length exactly k are detected (as if
+#   the program was run with `-k k`), and statistics are calculated for them.
+# Input file is parsed once, with 'maxk' equal to the greatest k of the sweep:
+#   termini of length k are cut from the longest ones, and their reverse
+#   complements are computed once. For each k, termini are joined in
+#   a hash index (see `src.terminus_index`), which costs O(N) instead of
+#   O(N^2) pairwise comparisons.
+
+from typing import List, Tuple, Dict, Sequence
+
+import src.combinator_statistics as sts
+from src.contigs import ContigCollection
+from src.assign_multiplicity import assign_multiplty
+from src.overlaps import OverlapCollection, ComparisonHit, collect_overlaps
+from src.oriented_termini import ComparisonKey, make_comparison_hits
+from src.terminus_index import join_k_termini
+
+
+# Custom types declaration
+# Sweep range: (start, stop, step); stop is included
+KSweepRange = Tuple[int, int, int]
+# Result for a single k: (k, number of overlaps, number of contigs having overlaps,
+#   LQ-coefficient, expected length of the genome)
+KSweepPoint = Tuple[int, int, int, float, int]
+
+
+def get_sweep_ks(sweep_range: KSweepRange) -> Sequence[int]:
+    # Function returns lengths of k-mers of a sweep.
+    # :param sweep_range: sweep range (start, stop, step);
+    start, stop, step = sweep_range
+    return range(start, stop + 1, step)
+# end def get_sweep_ks
+
+
+def sweep_k(contig_collection: ContigCollection, ks: Sequence[int]) -> List[KSweepPoint]:
+    # Function detects overlaps for each k in `ks` and calculates statistics for them.
+    # Function assigns multiplicity to contigs for each k: multiplicity
+    #   calculated for the last k is retained.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function with 'maxk' >= max(ks);
+    # :param ks: lengths of k-mers;
+
+    sweep_points: List[KSweepPoint] = list()
+
+    k: int
+    for k in ks:
+        # Overlaps of length exactly k
+        best_ovl_lens: Dict[ComparisonKey, int] = dict.fromkeys(
+            join_k_termini(contig_collection, k), k
+        )
+        hits: List[ComparisonHit] = make_comparison_hits(contig_collection,
+                                                         best_ovl_lens, k, k)
+        overlap_collection: OverlapCollection = collect_overlaps(hits)
+
+        assign_multiplty(contig_collection, overlap_collection)
+        summary: sts.Summary = sts.calc_summary(contig_collection, overlap_collection)
+
+        sweep_points.append((
+            k,
+            len(hits),
+            len(overlap_collection),
+            summary.lq_coef,
+            summary.exp_genome_size,
+        ))
+
+        print('\rk={}/{}'.format(k, ks[-1]), end='')
+    # end for
+    print()
+
+    return sweep_points
+# end def sweep_k
@@ -1,17 +1,30 @@
 # -*- encoding: utf-8 -*-
 
-from typing import Sequence, Dict, Any
+import sys
+from typing import Sequence, Dict, Any, List, Tuple
 
 import src.output as out
 import src.contigs as cnt
+import src.engines as eng
 import src.overlaps as ovl
 import src.assign_multiplicity as amu
-from src.parse_args import parse_args
+from src.parse_args import parse_args, parse_merge_args
 from src.filesystem import conf_prefix, make_outdir
+from src.contig_cache import load_contig_collection, get_cache_dpath, calc_file_digest
+from src.result_cache import load_overlaps, save_overlaps
+from src.k_sweep import KSweepPoint, get_sweep_ks, sweep_k
+import src.sharding as shr
+from src.platform import platf_depend_exit
 
 
 def main(version: str, last_update_date: str) -> None:
 
+    # Merge partial results of shards
+    if sys.argv[1:2] == ['merge']:
+        _merge(version, last_update_date)
+        return
+    # end if
+
     contigs_fpaths: Sequence[str] # paths to input files
     params: Dict[str, Any] # parameters of the program
 
@@ -29,38 +42,196 @@ def main(version: str, last_update_date: str) -> None:
         # Create output dir
         make_outdir(params['o'])
 
-        # Read contigs
-        contig_collection: cnt.ContigCollection = cnt.get_contig_collection(fpath, params['a'])
+        cache_dpath: str = get_cache_dpath(params['cache_dir'])
+
+        if not params['sweep'] is None:
+            # Sweep over k-mer lengths instead of a single run
+            _sweep_k(fpath, params, cache_dpath)
+            print('-'*20)
+            continue
+        # end if
+
+        if not params['shard'] is None:
+            # Detect overlaps for a shard of pairs of contigs only
+            _detect_shard(fpath, params, cache_dpath)
+            print('-'*20)
+            continue
+        # end if
+
+        contig_collection: cnt.ContigCollection
+        input_digest: bytes
+        contig_collection, input_digest = _read_contigs(fpath, params['a'], params, cache_dpath)
+
+        overlap_collection: ovl.OverlapCollection = None
+        if params['cache']:
+            # Load overlaps detected by a previous run
+            overlap_collection = load_overlaps(
+                cache_dpath, input_digest, contig_collection, params['i'], params['a'],
+                params['max_ovl']
+            )
+        # end if
+
+        if overlap_collection is None:
+            # Detect adjacent contigs
+            overlap_collection = eng.detect_overlaps(
+                contig_collection, params['i'], params['a'], params['e'], params['t'],
+                params['bloom_fpr'], params['bloom_mem'], params['max_ovl']
+            )
+            # Capped overlaps are incomplete, thus they are not cached
+            if params['cache'] and params['max_ovl'] is None:
+                save_overlaps(cache_dpath, input_digest, len(contig_collection),
+                              params['i'], params['a'], overlap_collection)
+            # end if
+        # end if
+
+        _write_outputs(fpath, contig_collection, overlap_collection, params['o'])
 
-        # Detect adjacent contigs
-        overlap_collection: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
-            contig_collection, params['i'], params['a']
-        )
+        print('-'*20)
+    # end for
+# end def main
 
-        # Assign multiplicity to contigs
-        amu.assign_multiplty(contig_collection, overlap_collection)
 
-        # Make prefix for current input file
-        prefix: str = conf_prefix(fpath, params['o'])
+def _write_outputs(fpath: str, contig_collection: cnt.ContigCollection,
+                   overlap_collection: ovl.OverlapCollection, outdpath: str) -> None:
+    # Function assigns multiplicity to contigs and writes output files.
 
-        # Write output files
-        # Write adjacency table
-        out.write_adjacency_table(contig_collection, overlap_collection, params['o'], prefix)
-        # Write full log
-        out.write_full_log(contig_collection, overlap_collection, params['o'], prefix)
-        # Write summary
-        out.write_summary(contig_collection, overlap_collection, fpath, params['o'], prefix)
+    # Assign multiplicity to contigs
+    amu.assign_multiplty(contig_collection, overlap_collection)
 
-        print('-'*20)
-    # end for
-# end def main
+    # Make prefix for current input file
+    prefix: str = conf_prefix(fpath, outdpath)
+
+    # Write output files
+    # Write adjacency table
+    out.write_adjacency_table(contig_collection, overlap_collection, outdpath, prefix)
+    # Write full log
+    out.write_full_log(contig_collection, overlap_collection, outdpath, prefix)
+    # Write summary
+    out.write_summary(contig_collection, overlap_collection, fpath, outdpath, prefix)
+# end def _write_outputs
+
+
+def _read_contigs(fpath: str, maxk: int, params: Dict[str, Any],
+                  cache_dpath: str) -> Tuple[cnt.ContigCollection, bytes]:
+    # Function reads contigs from input file (or from cache, if they have been already parsed).
+    # Returns contig collection and digest of input file (None if cache is disabled).
+
+    if params['cache']:
+        return load_contig_collection(fpath, maxk, params['t'], cache_dpath)
+    # end if
+    return cnt.get_contig_collection(fpath, maxk, params['t']), None
+# end def _read_contigs
+
+
+def _sweep_k(fpath: str, params: Dict[str, Any], cache_dpath: str) -> None:
+    # Function performs sweep over k-mer lengths and writes it's results.
+
+    ks: Sequence[int] = get_sweep_ks(params['sweep'])
+
+    # Termini of all lengths are cut from the longest ones
+    contig_collection: cnt.ContigCollection
+    contig_collection, _ = _read_contigs(fpath, ks[-1], params, cache_dpath)
+
+    sweep_points: List[KSweepPoint] = sweep_k(contig_collection, ks)
+
+    prefix: str = conf_prefix(fpath, params['o'])
+    out.write_k_sweep_table(sweep_points, params['o'], prefix)
+# end def _sweep_k
+
+
+def _detect_shard(fpath: str, params: Dict[str, Any], cache_dpath: str) -> None:
+    # Function detects overlaps for a shard of pairs of contigs
+    #   and writes them to partial file.
+
+    contig_collection: cnt.ContigCollection
+    input_digest: bytes
+    contig_collection, input_digest = _read_contigs(fpath, params['a'], params, cache_dpath)
+    if input_digest is None:
+        input_digest = calc_file_digest(fpath)
+    # end if
+
+    print('Shard {}/{}'.format(*params['shard']))
+    shard_hits: List[ovl.ComparisonHit] = shr.detect_shard_hits(
+        contig_collection, params['i'], params['a'], params['shard']
+    )
+
+    prefix: str = conf_prefix(fpath, params['o'])
+    header: shr.PartialHeader = (input_digest, len(contig_collection),
+                                 params['i'], params['a'], *params['shard'])
+    shr.write_partial(shr.get_partial_fpath(params['o'], prefix, params['shard']),
+                      header, shard_hits)
+# end def _detect_shard
+
+
+def _merge(version: str, last_update_date: str) -> None:
+    # Function merges partial results of shards and writes output files.
+
+    fpath: str
+    partial_fpaths: Sequence[str]
+    params: Dict[str, Any]
+    fpath, partial_fpaths, params = parse_merge_args(version, last_update_date)
+
+    partials: List[shr.Partial] = shr.read_partials(partial_fpaths)
+    digest, num_contigs, mink, maxk, _, num_shards = partials[0][0]
+    params['i'], params['a'] = mink, maxk
+
+    _report_parameters(params, version, last_update_date)
+    print('Merging {} shards for file `{}`'.format(num_shards, fpath))
+
+    make_outdir(params['o'])
+    cache_dpath: str = get_cache_dpath(params['cache_dir'])
+
+    contig_collection: cnt.ContigCollection
+    input_digest: bytes
+    contig_collection, input_digest = _read_contigs(fpath, maxk, params, cache_dpath)
+    if input_digest is None:
+        input_digest = calc_file_digest(fpath)
+    # end if
+
+    if input_digest != digest or len(contig_collection) != num_contigs:
+        print('Error: partial files are made for another input file.')
+        platf_depend_exit(1)
+    # end if
+
+    overlap_collection: ovl.OverlapCollection = ovl.collect_overlaps(
+        shr.merge_partial_hits(partials), params['max_ovl']
+    )
+    # Capped overlaps are incomplete, thus they are not cached
+    if params['cache'] and params['max_ovl'] is None:
+        save_overlaps(cache_dpath, input_digest, num_contigs,
+                      mink, maxk, overlap_collection)
+    # end if
+
+    _write_outputs(fpath, contig_collection, overlap_collection, params['o'])
+# end def _merge
 
 
 def _report_parameters(params, version, last_update_date):
     print('{}. Version {}. {} edition.'.format('combinator-FQ', version, last_update_date))
     print('Parameters:')
-    print(' - Minimum k: {} bp.'.format(params['i']))
-    print(' - Maximum k: {} bp.'.format(params['a']))
+    if params['sweep'] is None:
+        print(' - Minimum k: {} bp.'.format(params['i']))
+        print(' - Maximum k: {} bp.'.format(params['a']))
+    else:
+        print(' - k sweep: from {} to {} bp with step {} bp.'.format(*params['sweep']))
+    # end if
+    if not params['shard'] is None:
+        print(' - Shard: {} of {}.'.format(*params['shard']))
+    # end if
+    print(' - Overlap detection engine: {}.'.format(params['e']))
+    if params['e'] == 'bloom':
+        print(' - Bloom filters: false-positive rate {}, memory budget {} MB.'\
+            .format(params['bloom_fpr'], params['bloom_mem']))
+    # end if
+    if not params['max_ovl'] is None:
+        print(' - Maximum number of overlaps per terminus: {}.'.format(params['max_ovl']))
+    # end if
+    print(' - Threads: {}.'.format(params['t']))
+    if params['cache']:
+        print(' - Cache: enabled, directory `{}`.'.format(get_cache_dpath(params['cache_dir'])))
+    else:
+        print(' - Cache: disabled.')
+    # end if
     print(' - Output directory: `{}`.'.format(params['o']))
     print('-' * 20)
 # end def _report_parameters
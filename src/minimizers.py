@@ -0,0 +1,199 @@
+# -*- encoding: utf-8 -*-
+
+# Minimizer-based prefilter of pairs of contigs.
+#
+# Most pairs of contigs share nothing, yet pairwise comparison performs
+#   all ten comparisons of termini for each of them. Here, only candidate pairs,
+#   which share a minimizer, are compared by `src.overlaps.compare_contig_partners`.
+# A (w, k)-minimizer of a window of w consecutive k-mers is the k-mer
+#   with the least hash. An overlap of length at least 'mink' contains
+#   the first (w + k - 1) bases of a terminus, which is matched by it's prefix
+#   (a start or an rc-end; see `src.sorted_termini`). Thus it contains
+#   the minimizer of this boundary window, which is:
+#   - the boundary minimizer of another start or rc-end (start-to-start-like overlaps);
+#   - the minimizer of some window of another end or rc-start (end-to-start-like overlaps).
+# So, pairs of contigs sharing no such minimizer are not compared,
+#   and overlaps are detected exactly.
+
+from typing import Dict, List, Set, Sequence
+
+from src.contigs import Contig, ContigCollection, ContigIndex
+from src.overlaps import OverlapCollection, ComparisonHit
+from src.overlaps import compare_contig_partners, add_comparison_overlaps
+
+
+# Length of k-mers and number of k-mers in a window of minimizers.
+# They are decreased for low 'mink', so that windows are not longer than 'mink'.
+MINIMIZER_K: int = 15
+MINIMIZER_W: int = 10
+
+
+def detect_adjacent_contigs_minimizers(contig_collection: ContigCollection,
+                                       mink: int, maxk: int,
+                                       max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function detects adjacent contigs by comparing termini of contigs
+    #   sharing minimizers only.
+    # Result is identical to one returned by `src.overlaps.detect_adjacent_contigs`.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    candidate_partners: List[List[ContigIndex]] = find_candidate_partners(contig_collection,
+                                                                          mink)
+    report_candidate_pairs(contig_collection, candidate_partners, mink, 'Minimizer')
+
+    return compare_candidate_partners(contig_collection, candidate_partners, mink, maxk,
+                                      max_overlaps_per_terminus)
+# end def detect_adjacent_contigs_minimizers
+
+
+def find_candidate_partners(contig_collection: ContigCollection,
+                            mink: int) -> List[List[ContigIndex]]:
+    # Function finds pairs of contigs sharing minimizers.
+    # Returns list of candidate partners of each contig:
+    #   the i-th element contains indices of contigs greater than i, in ascending order.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param mink: minimum length of and overlap to be detected;
+
+    k: int = min(MINIMIZER_K, mink)
+    w: int = min(MINIMIZER_W, mink - k + 1)
+
+    # Index of boundary minimizers of starts and rc-ends
+    boundary_index: Dict[int, List[ContigIndex]] = dict()
+    # Minimizers of each contig: boundary ones and ones of all windows of ends and rc-starts
+    contig_minimizers: List[Set[int]] = list()
+
+    x: ContigIndex
+    contig: Contig
+    for x, contig in enumerate(contig_collection):
+        minimizers: Set[int] = set()
+
+        # Termini shorter than 'mink' do not overlap anything
+        if len(contig.start) >= mink:
+            seq: str
+            for seq in (contig.start, contig.rcend):
+                minimizer: int = get_boundary_minimizer(seq, w, k)
+                minimizers.add(minimizer)
+                try:
+                    boundary_index[minimizer].append(x)
+                except KeyError:
+                    boundary_index[minimizer] = [x]
+                # end try
+            # end for
+            for seq in (contig.end, contig.rcstart):
+                minimizers.update(get_window_minimizers(seq, w, k))
+            # end for
+        # end if
+
+        contig_minimizers.append(minimizers)
+    # end for
+
+    candidate_partners: List[Set[ContigIndex]] = [set() for _ in contig_collection]
+
+    for x, minimizers in enumerate(contig_minimizers):
+        for minimizer in minimizers:
+            y: ContigIndex
+            for y in boundary_index.get(minimizer, tuple()):
+                if x < y:
+                    candidate_partners[x].add(y)
+                elif y < x:
+                    candidate_partners[y].add(x)
+                # end if
+            # end for
+        # end for
+    # end for
+
+    return [sorted(partners) for partners in candidate_partners]
+# end def find_candidate_partners
+
+
+def get_boundary_minimizer(seq: str, w: int, k: int) -> int:
+    # Function returns the minimizer of the first window of a sequence.
+    #
+    # :param seq: sequence;
+    # :param w: number of k-mers in a window;
+    # :param k: length of k-mers;
+    return min(hash(seq[pos : pos+k]) for pos in range(w))
+# end def get_boundary_minimizer
+
+
+def get_window_minimizers(seq: str, w: int, k: int) -> Set[int]:
+    # Function returns minimizers of all windows of a sequence.
+    #
+    # :param seq: sequence;
+    # :param w: number of k-mers in a window;
+    # :param k: length of k-mers;
+
+    hashes: List[int] = [hash(seq[pos : pos+k]) for pos in range(len(seq) - k + 1)]
+    return set(min(hashes[pos : pos+w]) for pos in range(len(hashes) - w + 1))
+# end def get_window_minimizers
+
+
+def compare_candidate_partners(contig_collection: ContigCollection,
+                               candidate_partners: Sequence[Sequence[ContigIndex]],
+                               mink: int, maxk: int,
+                               max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function compares termini of contigs to termini of their candidate partners.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param candidate_partners: candidate partners of each contig:
+    #   the i-th element contains indices of contigs greater than i, in ascending order;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    num_contigs: int = len(contig_collection)
+
+    overlap_collection: OverlapCollection = OverlapCollection(max_overlaps_per_terminus)
+
+    i: ContigIndex
+    for i in range(num_contigs):
+        hit: ComparisonHit
+        for hit in compare_contig_partners(contig_collection, i, candidate_partners[i],
+                                           mink, maxk):
+            add_comparison_overlaps(overlap_collection, *hit)
+        # end for
+
+        print('\r{}/{}'.format(i+1, num_contigs), end='')
+    # end for
+    print()
+
+    return overlap_collection
+# end def compare_candidate_partners
+
+
+def report_candidate_pairs(contig_collection: ContigCollection,
+                           candidate_partners: Sequence[Sequence[ContigIndex]],
+                           mink: int, prefilter_name: str) -> None:
+    # Function prints number of candidate pairs of contigs and reduction ratio:
+    #   number of pairs compared pairwise per number of candidate pairs.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param candidate_partners: candidate partners of each contig;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param prefilter_name: name of the prefilter to print;
+
+    num_contigs: int = len(contig_collection)
+
+    # Contigs shorter than 'mink' are not compared to contigs that follow them
+    num_pairs: int = sum(
+        num_contigs - 1 - i for i in range(num_contigs)
+        if contig_collection[i].length > mink
+    )
+    num_candidate_pairs: int = sum(
+        len(candidate_partners[i]) for i in range(num_contigs)
+        if contig_collection[i].length > mink
+    )
+
+    print('{} prefilter: {} candidate pairs of contigs out of {}'\
+        .format(prefilter_name, num_candidate_pairs, num_pairs))
+    if num_candidate_pairs != 0:
+        print('Reduction ratio: {:.1f}'.format(num_pairs / num_candidate_pairs))
+    # end if
+# end def report_candidate_pairs
@@ -0,0 +1,204 @@
+# -*- encoding: utf-8 -*-
+
+# Oriented-terminus model of contig comparisons.
+#
+# Each contig contributes two termini of length k: k-prefix of it's start (P) and
+#   k-suffix of it's end (S). Considering both strands of the contig, P is an incoming
+#   prefix of the forward strand and rc(P) is an outgoing suffix of the reverse strand;
+#   S is an outgoing suffix of the forward strand and rc(S) is an incoming prefix
+#   of the reverse strand.
+# A terminus and it's reverse complement are stored under a single canonical k-mer
+#   (the lesser of the two) along with orientation of the terminus relative to it.
+# Thus, all ten comparisons performed by `src.overlaps.detect_adjacent_contigs`
+#   are reduced to a single join of termini by their canonical k-mers:
+#   type of a comparison (i.e. `Terminus`es of resulting overlaps) is derived
+#   from sides of joined termini and from their relative orientation.
+
+from typing import Dict, List, Tuple, NewType, Iterator, Sequence
+
+from src.contigs import Contig, ContigCollection, ContigIndex
+from src.overlaps import Comparison, ComparisonHit
+from src.overlaps import SELF_E2S, SELF_S2RCE, S2E, E2S, S2RCS, E2RCE, S2S, E2E, S2RCE, E2RCS
+
+
+# Following sides of a contig are defined in the model.
+Side = NewType('Side', int)
+
+PREFIX: Side = 0 # k-prefix of start
+SUFFIX: Side = 1 # k-suffix of end
+
+
+# Following orientations of a terminus relative to it's canonical k-mer are defined.
+Orientation = NewType('Orientation', int)
+
+FORWARD:    Orientation = 0 # terminus is the canonical k-mer itself
+REVERSE:    Orientation = 1 # terminus is reverse complement of the canonical k-mer
+PALINDROME: Orientation = 2 # terminus is equal to it's reverse complement
+
+
+# Custom types declaration
+# Terminus of a contig: (index of the contig, side, orientation)
+OrientedTerminus = Tuple[ContigIndex, Side, Orientation]
+# Key of a comparison: (i, j, comparison)
+ComparisonKey = Tuple[ContigIndex, ContigIndex, Comparison]
+
+
+# Dictionary maps (side of the i-th contig, side of the j-th contig, identical orientation)
+#   to `Comparison` of contigs i and j (i < j).
+# "Identical orientation" means that termini are identical, otherwise
+#   one terminus is reverse complement of another one.
+_JOIN_RULES: Dict[Tuple[Side, Side, bool], Comparison] = {
+    (PREFIX, SUFFIX, True):  S2E,
+    (SUFFIX, PREFIX, True):  E2S,
+    (PREFIX, PREFIX, False): S2RCS,
+    (SUFFIX, SUFFIX, False): E2RCE,
+    (PREFIX, PREFIX, True):  S2S,
+    (SUFFIX, SUFFIX, True):  E2E,
+    (PREFIX, SUFFIX, False): S2RCE,
+    (SUFFIX, PREFIX, False): E2RCS,
+}
+
+# The same for termini of a single contig.
+# Start-to-rc-start and end-to-rc-end matches of a contig are not considered.
+_SELF_JOIN_RULES: Dict[Tuple[Side, Side, bool], Comparison] = {
+    (PREFIX, SUFFIX, True):  SELF_E2S,
+    (SUFFIX, PREFIX, True):  SELF_E2S,
+    (PREFIX, SUFFIX, False): SELF_S2RCE,
+    (SUFFIX, PREFIX, False): SELF_S2RCE,
+}
+
+
+def canonize(k_mer: str, rc_k_mer: str) -> Tuple[str, Orientation]:
+    # Function returns canonical k-mer for a terminus and orientation of the terminus.
+    #
+    # :param k_mer: terminus;
+    # :param rc_k_mer: reverse complement of the terminus;
+
+    if k_mer < rc_k_mer:
+        return k_mer, FORWARD
+    elif k_mer > rc_k_mer:
+        return rc_k_mer, REVERSE
+    # end if
+    return k_mer, PALINDROME
+# end def canonize
+
+
+def get_canonical_termini(contig: Contig, k: int) -> Tuple[Tuple[str, Orientation],
+                                                           Tuple[str, Orientation]]:
+    # Function returns canonical k-mers and orientations of both termini of a contig:
+    #   ((canonical k-mer, orientation) of k-prefix, (canonical k-mer, orientation) of k-suffix).
+    # Reverse complements are taken from rc-termini of the contig, thus
+    #   no reverse complement is computed here.
+    #
+    # :param contig: contig of interest;
+    # :param k: length of termini;
+
+    return (
+        canonize(contig.start[:k], contig.rcstart[-k:]),
+        canonize(contig.end[-k:], contig.rcend[:k])
+    )
+# end def get_canonical_termini
+
+
+def iterate_k_termini(contig_collection: ContigCollection,
+                      k: int) -> Iterator[Tuple[str, OrientedTerminus]]:
+    # Generator yields (canonical k-mer, oriented terminus) tuples for
+    #   all contigs having termini of length k.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param k: length of termini;
+
+    x: ContigIndex
+    contig: Contig
+    for x, contig in enumerate(contig_collection):
+        # Termini of contigs shorter than 'maxk' are entire sequences
+        if len(contig.start) >= k:
+            prefix: Tuple[str, Orientation]
+            suffix: Tuple[str, Orientation]
+            prefix, suffix = get_canonical_termini(contig, k)
+            yield prefix[0], (x, PREFIX, prefix[1])
+            yield suffix[0], (x, SUFFIX, suffix[1])
+        # end if
+    # end for
+# end def iterate_k_termini
+
+
+def join_termini(termini: Sequence[OrientedTerminus]) -> Iterator[ComparisonKey]:
+    # Generator joins termini sharing a canonical k-mer.
+    # It yields (i, j, comparison) keys of all comparisons these termini match in.
+    #
+    # :param termini: oriented termini sharing a canonical k-mer;
+
+    a: int
+    b: int
+    for a in range(len(termini)):
+        for b in range(a + 1, len(termini)):
+            x, side_x, orient_x = termini[a]
+            y, side_y, orient_y = termini[b]
+            if x > y:
+                x, side_x, orient_x, y, side_y, orient_y = y, side_y, orient_y, x, side_x, orient_x
+            # end if
+
+            rules: Dict[Tuple[Side, Side, bool], Comparison] = \
+                _SELF_JOIN_RULES if x == y else _JOIN_RULES
+
+            # Palindromic termini match each other in both orientations
+            identical: bool
+            for identical in (True, False):
+                if orient_x == PALINDROME or (orient_x == orient_y) == identical:
+                    comparison: Comparison = rules.get((side_x, side_y, identical))
+                    if not comparison is None:
+                        yield x, y, comparison
+                    # end if
+                # end if
+            # end for
+        # end for
+    # end for
+# end def join_termini
+
+
+def make_comparison_hits(contig_collection: ContigCollection,
+                         best_ovl_lens: Dict[ComparisonKey, int],
+                         mink: int, maxk: int) -> List[ComparisonHit]:
+    # Function converts lengths of the longest matches of joined termini
+    #   to comparison hits identical to ones `src.overlaps.compare_contig_row` returns.
+    # Returns hits sorted by (i, j, comparison).
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param best_ovl_lens: dictionary mapping (i, j, comparison) keys to
+    #   lengths of the longest matching termini;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+
+    hits: List[ComparisonHit] = list()
+
+    key: ComparisonKey
+    ovl_len: int
+    for key, ovl_len in best_ovl_lens.items():
+        i, j, comparison = key
+        contig_i: Contig = contig_collection[i]
+
+        # Contigs shorter than 'mink' are not compared to contigs that follow them
+        if contig_i.length <= mink:
+            continue
+        # end if
+
+        # If contigs are shorter than 'maxk', their termini are entire sequences.
+        # Functions `src.find_overlap.find_overlap_*` report overlap of length 'maxk'
+        #   if such entire termini of equal length are identical.
+        if ovl_len == contig_i.length == contig_collection[j].length and ovl_len < maxk:
+            ovl_len = maxk
+        # end if
+
+        # Contig, which matches itself entirely, is not circular
+        if comparison == SELF_E2S and ovl_len == contig_i.length:
+            continue
+        # end if
+
+        hits.append((i, j, comparison, ovl_len))
+    # end for
+
+    hits.sort()
+
+    return hits
+# end def make_comparison_hits
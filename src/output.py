@@ -2,13 +2,21 @@
 
 import os
 import sys
-from typing import TextIO, Callable, Dict, Collection, List, MutableSequence
+from typing import TextIO, Callable, Dict, Collection, List, Sequence, Iterable
 
 from src.platform import platf_depend_exit
 import src.combinator_statistics as sts
 from src.contigs import Contig, ContigCollection, ContigIndex
 from src.overlaps import Overlap, OverlapCollection
 from src.overlaps import Terminus, START, RCSTART, END, RCEND
+from src.k_sweep import KSweepPoint
+
+
+# Size of buffers of adjacency table and full log, bytes
+OUTPUT_BUFFER_SIZE: int = 1024 * 1024
+
+# Number of rows, which are formatted and then written to an output file at once
+_ROWS_PER_BATCH: int = 4096
 
 
 # Dictionary maps `Terminus` to it's "letter" representation
@@ -63,51 +71,44 @@ def write_summary(contig_collection: ContigCollection,
         # Summary with some statistics:
         _double_write(' === Summary ===', outfile)
 
+        # All statistics are calculated in a single traversal of contigs
+        summary: sts.Summary = sts.calc_summary(contig_collection, overlap_collection)
+
         # Number of contigs processed:
-        wrk_str = '{} contigs were processed.'.format(len(contig_collection))
+        wrk_str = '{} contigs were processed.'.format(summary.num_contigs)
         _double_write(wrk_str, outfile)
 
         # Sum of contigs' lengths
-        wrk_str = 'Sum of contig lengths: {} bp'\
-            .format(sts.calc_sum_contig_lengths(contig_collection))
+        wrk_str = 'Sum of contig lengths: {} bp'.format(summary.sum_contig_lengths)
         _double_write(wrk_str, outfile)
 
         # Expected length of the genome
-        wrk_str = 'Expected length of the genome: {} bp'\
-            .format(sts.calc_exp_genome_size(contig_collection, overlap_collection))
-        _double_write(wrk_str, outfile)
-
-        # Calculate coverage statistics
-        cov_calc = sts.CoverageCalculator(contig_collection)
-
-        # Min coverage
-        min_coverage: float = cov_calc.get_min_coverage()
-        wrk_str = 'Min coverage: {}'\
-            .format(min_coverage if not min_coverage is None else 'NA')
+        wrk_str = 'Expected length of the genome: {} bp'.format(summary.exp_genome_size)
         _double_write(wrk_str, outfile)
 
-        # Max coverage
-        max_coverage: float = cov_calc.get_max_coverage()
-        wrk_str = 'Max coverage: {}'\
-            .format(max_coverage if not max_coverage is None else 'NA')
-        _double_write(wrk_str, outfile)
-
-        # Mean coverage
-        mean_coverage: float = cov_calc.calc_mean_coverage()
-        wrk_str = 'Mean coverage: {}'\
-            .format(mean_coverage if not mean_coverage is None else 'NA')
-        _double_write(wrk_str, outfile)
-
-        # Median coverage
-        median_coverage: float = cov_calc.calc_median_coverage()
-        wrk_str = 'Median coverage: {}'\
-            .format(median_coverage if not median_coverage is None else 'NA')
-        _double_write(wrk_str, outfile)
+        # Coverage statistics
+        name: str
+        coverage: float
+        for name, coverage in (('Min', summary.min_coverage),
+                               ('Max', summary.max_coverage),
+                               ('Mean', summary.mean_coverage),
+                               ('Median', summary.median_coverage)):
+            wrk_str = '{} coverage: {}'.format(name, coverage if not coverage is None else 'NA')
+            _double_write(wrk_str, outfile)
+        # end for
 
         # LQ coefficient
-        wrk_str = 'LQ-coefficient: {}'\
-            .format(sts.calc_lq_coef(contig_collection, overlap_collection))
+        wrk_str = 'LQ-coefficient: {}'.format(summary.lq_coef)
         _double_write(wrk_str, outfile)
+
+        # Hub termini, which have more overlaps than the cap allows
+        if not overlap_collection.max_overlaps_per_terminus is None:
+            wrk_str = 'Hub termini (more than {} overlaps): {}'\
+                .format(overlap_collection.max_overlaps_per_terminus, summary.num_hub_termini)
+            _double_write(wrk_str, outfile)
+            wrk_str = 'Overlaps not shown: {}'.format(summary.num_dropped_overlaps)
+            _double_write(wrk_str, outfile)
+        # end if
     # end with
 # end def write_summary
 
@@ -133,9 +134,12 @@ def write_adjacency_table(contig_collection: ContigCollection,
 
     print('Writing adjacency table to `{}`'.format(adj_table_fpath))
 
+    # Names are looked up by indices of overlapping contigs
+    names: List[str] = [contig.name for contig in contig_collection]
+
     # Proceed
     outfile: TextIO
-    with open(adj_table_fpath, 'w') as outfile:
+    with open(adj_table_fpath, 'w', buffering=OUTPUT_BUFFER_SIZE) as outfile:
 
         # Write head of the table:
         outfile.write('\t'.join([
@@ -151,48 +155,14 @@ def write_adjacency_table(contig_collection: ContigCollection,
         ]))
         outfile.write('\n')
 
-        wrk_str: str
-
-        # Iterate over contigs and write their properties
+        # Write properties of contigs, a row per contig
         i: ContigIndex
         contig: Contig
-        for i, contig in enumerate(contig_collection):
-
-            # Ordinal number and name
-            outfile.write('{}\t'.format(i + 1))
-            outfile.write('{}\t'.format(contig.name))
-
-            # Length
-            outfile.write('{}\t'.format(contig.length))
-
-            # Coverage
-            wrk_str = '-' if contig.cov is None else '{:.2f}'.format(contig.cov)
-            outfile.write('{}\t'.format(wrk_str))
-
-            # GC content of the contig
-            outfile.write('{:.2f}'.format(contig.gc_content) + '\t')
-
-            # Multiplicity
-            outfile.write('{:.2f}\t'.format(contig.multplty))
-
-            # Empty column for annotation
-            outfile.write('\t')
-
-            # Information about discovered adjacency
-            # "Start" column
-            wrk_str = _get_overlaps_str_for_table(overlap_collection,
-                                                  contig_collection,
-                                                  i, 's')
-            outfile.write('{}\t'.format(wrk_str))
-
-            # "End" column
-            wrk_str = _get_overlaps_str_for_table(overlap_collection,
-                                                  contig_collection,
-                                                  i, 'e')
-            outfile.write('{}'.format(wrk_str))
-
-            outfile.write('\n')
-        # end for
+        _write_batched(
+            (_get_table_row(overlap_collection, names, i, contig)
+             for i, contig in enumerate(contig_collection)),
+            outfile
+        )
     # end with
 # end def write_adjacency_table
 
@@ -219,26 +189,66 @@ def write_full_log(contig_collection: ContigCollection,
 
     print('Writing full matching log to `{}`'.format(log_fpath))
 
+    # Names are looked up by indices of overlapping contigs
+    names: List[str] = [contig.name for contig in contig_collection]
+
     # Proceed
     outfile: TextIO
-    with open(log_fpath, 'w') as outfile:
-
-        wrk_str: str
+    with open(log_fpath, 'w', buffering=OUTPUT_BUFFER_SIZE) as outfile:
 
         # Write information about discovered adjacency
         i: ContigIndex
-        for i, _ in enumerate(contig_collection):
-            # Write what matches start of current contig
-            wrk_str = _get_overlaps_str_for_log(overlap_collection,
-                                                contig_collection, i)
-            if not wrk_str is None:
-                outfile.write('{}\n'.format(wrk_str))
-            # end if
-        # end for
+        wrk_str: str
+        _write_batched(
+            ('{}\n'.format(wrk_str)
+             for wrk_str in (_get_overlaps_str_for_log(overlap_collection, names, i)
+                             for i in range(len(contig_collection)))
+             if not wrk_str is None),
+            outfile
+        )
     # end with
 # end def write_full_log
 
 
+def write_k_sweep_table(sweep_points: Sequence[KSweepPoint],
+                        outdpath: str, out_prefix: str) -> None:
+    # Function writes results of a sweep over k-mer lengths to output TSV file.
+    #
+    # :param sweep_points: results returned by `src.k_sweep.sweep_k` function;
+    # :param outdpath: path to output directory;
+    # :param out_prefix: prefix for current output files;
+
+    # Make path to output TSV file
+    sweep_table_fpath: str = os.path.join(
+        outdpath,
+        '{}_combinator_k_sweep.tsv'\
+            .format(out_prefix)
+    )
+
+    print('Writing k sweep table to `{}`'.format(sweep_table_fpath))
+
+    # Proceed
+    outfile: TextIO
+    with open(sweep_table_fpath, 'w') as outfile:
+
+        # Write head of the table:
+        outfile.write('\t'.join([
+            'k',
+            'Overlaps',
+            'Contigs with overlaps',
+            'LQ-coefficient',
+            'Expected length of the genome',
+        ]))
+        outfile.write('\n')
+
+        sweep_point: KSweepPoint
+        for sweep_point in sweep_points:
+            outfile.write('{}\t{}\t{}\t{}\t{}\n'.format(*sweep_point))
+        # end for
+    # end with
+# end def write_k_sweep_table
+
+
 def _double_write(outstr: str, outfile: TextIO) -> None:
     # Function for writing and printing.
     # "Double" means that it writes identical data both to
@@ -254,23 +264,67 @@ def _double_write(outstr: str, outfile: TextIO) -> None:
 # end def double_write
 
 
-def _get_start_matches(overlaps: MutableSequence[Overlap]) -> Collection[Overlap]:
-    # Function selects "start-associated" overlaps from a collection of overlaps.
-    return tuple(
-        filter(sts.is_start_match, overlaps)
+def _write_batched(rows: Iterable[str], outfile: TextIO) -> None:
+    # Function writes formatted rows to a file in batches of `_ROWS_PER_BATCH` rows,
+    #   each batch with a single call of `write`.
+    #
+    # :param rows: formatted rows, each ending with new line char;
+    # :param outfile: file-like instance of output file to write in;
+
+    batch: List[str] = list()
+
+    row: str
+    for row in rows:
+        batch.append(row)
+        if len(batch) == _ROWS_PER_BATCH:
+            outfile.write(''.join(batch))
+            batch.clear()
+        # end if
+    # end for
+
+    outfile.write(''.join(batch))
+# end def _write_batched
+
+
+def _get_table_row(overlap_collection: OverlapCollection, names: Sequence[str],
+                   key: ContigIndex, contig: Contig) -> str:
+    # Function formats row of adjacency table for `key` contig.
+    #
+    # :param overlap_collection: instance of OverlapCollection;
+    # :param names: names of contigs;
+    # :param key: key (index) of contig;
+    # :param contig: the contig;
+
+    return '{}\t{}\t{}\t{}\t{:.2f}\t{:.2f}\t\t{}\t{}\n'.format(
+        key + 1,                                                  # ordinal number
+        contig.name,
+        contig.length,
+        '-' if contig.cov is None else '{:.2f}'.format(contig.cov),
+        contig.gc_content,
+        contig.multplty,
+        # empty column for annotation is followed by "Start" and "End" columns
+        _get_overlaps_str_for_table(overlap_collection, names, key, 's'),
+        _get_overlaps_str_for_table(overlap_collection, names, key, 'e')
     )
+# end def _get_table_row
+
+
+def _get_start_matches(overlap_collection: OverlapCollection,
+                       key: ContigIndex) -> Collection[Overlap]:
+    # Function selects "start-associated" overlaps of `key` contig.
+    return overlap_collection.get_start_overlaps(key)
 # end def _get_start_matches
 
 
-def _get_end_matches(overlaps: MutableSequence[Overlap]) -> Collection[Overlap]:
-    # Function selects "end-associated" overlaps from a collection of overlaps.
-    return tuple(
-        filter(sts.is_end_match, overlaps)
-    )
+def _get_end_matches(overlap_collection: OverlapCollection,
+                     key: ContigIndex) -> Collection[Overlap]:
+    # Function selects "end-associated" overlaps of `key` contig.
+    return overlap_collection.get_end_overlaps(key)
 # end def _get_end_matches
 
 
-def _select_get_matches(term: str) -> Callable[[MutableSequence[Overlap]], Collection[Overlap]]:
+def _select_get_matches(term: str) -> Callable[[OverlapCollection, ContigIndex],
+                                               Collection[Overlap]]:
     # Function returns function depending on `term` (terminus) parameter.
     # If `term` is 's', it returns `_get_start_matches` function.
     # If `term` is 'e', it returns `_get_end_matches` function.
@@ -293,29 +347,32 @@ def _select_get_matches(term: str) -> Callable[[MutableSequence[Overlap]], Colle
 
 
 def _get_overlaps_str_for_table(overlap_collection: OverlapCollection,
-                                contig_collection:  ContigCollection,
+                                names: Sequence[str],
                                 key: ContigIndex, term: str) -> str:
     # Function extracts overlaps of `key` contigs associated with `term` terminus,
     #   converts this collection of `src.overlaps.Overlap` to string representation
     #   for adjacency table.
     # After this, the fucntion returns this string.
     #
-    # :param contig_collection: instance of ContigCollection returned by
-    #   `src.contigs.get_contig_collection` function;
     # :param overlap_collection: instance of OverlapCollection returned by
     #   `src.overlaps.detect_adjacent_contigs` function;
+    # :param names: names of contigs;
     # :param key: key (index) of contig;
     # :param term: "terminus" -- 's' or 'e';
 
     # Select function for obtaining `term`-associated overlaps.
-    get_matches: Callable[[List[Overlap]], Collection[Overlap]]
+    get_matches: Callable[[OverlapCollection, ContigIndex], Collection[Overlap]]
     get_matches = _select_get_matches(term)
 
     # Extract overlaps associated with `term` terminus for `key` contig
-    overlaps: Collection[Overlap] = get_matches(overlap_collection[key])
+    overlaps: Collection[Overlap] = get_matches(overlap_collection, key)
+
+    # Overlaps dropped from a hub terminus are summarized
+    num_dropped: int = overlap_collection.count_dropped_start_overlaps(key) if term == 's' \
+                       else overlap_collection.count_dropped_end_overlaps(key)
 
     # Convert `Overlap` instances to string representation
-    if len(overlaps) == 0:
+    if len(overlaps) == 0 and num_dropped == 0:
         return '-' # no proper overlaps found
     else:
         match_strings: List[str] = list() # list for formatted strings
@@ -330,14 +387,17 @@ def _get_overlaps_str_for_table(overlap_collection: OverlapCollection,
                 letter2: str = _KEY2LETTER_MAP[ovl.terminus_j]
                 # Convert and append
                 match_strings.append('[{}={}({}); ovl={}]'\
-                    .format(letter1, letter2, contig_collection[ovl.contig_j].name,
-                            ovl.ovl_len))
+                    .format(letter1, letter2, names[ovl.contig_j], ovl.ovl_len))
             # If contig matches itself (it is circular)
             else:
                 match_strings.append('[Circle; ovl={}]'.format(ovl.ovl_len))
             # end if
         # end for
 
+        if num_dropped != 0:
+            match_strings.append('[+{} more]'.format(num_dropped))
+        # end if
+
         # Separate formatted strings with spaces
         return ' '.join(match_strings)
     # end if
@@ -345,17 +405,16 @@ def _get_overlaps_str_for_table(overlap_collection: OverlapCollection,
 
 
 def _get_overlaps_str_for_log(overlap_collection: OverlapCollection,
-                              contig_collection:  ContigCollection,
+                              names: Sequence[str],
                               key: ContigIndex) -> str:
     # Function extracts overlaps of `key` contigs associated with `term` terminus,
     #   converts this collection of `src.overlaps.Overlap` to string representation
     #   for full log.
     # After this, the fucntion returns this string.
     #
-    # :param contig_collection: instance of ContigCollection returned by
-    #   `src.contigs.get_contig_collection` function;
     # :param overlap_collection: instance of OverlapCollection returned by
     #   `src.overlaps.detect_adjacent_contigs` function;
+    # :param names: names of contigs;
     # :param key: key (index) of contig;
 
     # Extract overlaps for current contig
@@ -365,6 +424,7 @@ def _get_overlaps_str_for_log(overlap_collection: OverlapCollection,
         return None # no proper overlaps found
     else:
         match_strings: List[str] = list() # list for formatted strings
+        name: str = names[key]
 
         ovl: Overlap
         for ovl in overlaps:
@@ -378,21 +438,27 @@ def _get_overlaps_str_for_log(overlap_collection: OverlapCollection,
 
                 # Convert and append
                 match_strings.append('{}: {} matches {} of {} with overlap of {} bp'\
-                    .format(contig_collection[key].name, word1, word2,
-                        contig_collection[ovl.contig_j].name, ovl.ovl_len))
+                    .format(name, word1, word2, names[ovl.contig_j], ovl.ovl_len))
             else:
                 # Contig is circular
                 if ovl.terminus_i == END and ovl.terminus_j == START:
                     match_strings.append('{}: contig is circular with overlap of {} bp'\
-                        .format(contig_collection[key].name, ovl.ovl_len))
+                        .format(name, ovl.ovl_len))
                 # Start of contig matches it's own reverse-complement end
                 elif ovl.terminus_i == START and ovl.terminus_j == RCEND:
                     match_strings.append('{}: start is identical to it\'s own rc-end with overlap of {} bp'\
-                        .format(contig_collection[key].name, ovl.ovl_len))
+                        .format(name, ovl.ovl_len))
                 # end if
             # end if
         # end for
 
+        # Overlaps dropped from hub termini are summarized
+        num_dropped: int = overlap_collection.count_dropped_overlaps(key)
+        if num_dropped != 0:
+            match_strings.append('{}: {} more overlaps are not shown'\
+                .format(name, num_dropped))
+        # end if
+
         # Separate formatted strings with new line chars
         return '\n'.join(match_strings)
     # end if
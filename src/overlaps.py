@@ -1,9 +1,12 @@
 # -*- encoding: utf-8 -*-
 
-from typing import NewType, Dict, List
+from array import array
+from heapq import nlargest, heappush, heapreplace
+from typing import NewType, Dict, List, Tuple, Iterable, Sequence, Callable
 
-from src.contigs import ContigCollection, ContigIndex
+from src.contigs import Contig, ContigCollection, ContigIndex
 from src.find_overlap import find_overlap_s2s, find_overlap_e2s, find_overlap_e2e
+from src.find_overlap import find_overlap_s2s_packed, find_overlap_e2e_packed
 
 
 # Following termini are defined in the program:
@@ -18,8 +21,109 @@ END:     Terminus = 2
 RCEND:   Terminus = 3
 
 
+# Following comparisons of termini are performed by the program.
+# Comparison of contig i with contig j (i <= j) results in two overlaps:
+#   one is stored for the i-th contig, and another one -- for the j-th contig.
+Comparison = NewType('Comparison', int)
+
+
+# Assign values for defined comparisons.
+# Values reflect the order in which `detect_adjacent_contigs` compares termini.
+SELF_E2S:   Comparison = 0 # end of contig i matches it's own start
+SELF_S2RCE: Comparison = 1 # start of contig i matches it's own rc-end
+S2E:        Comparison = 2 # i-th start matches j-th end
+E2S:        Comparison = 3 # i-th end matches j-th start
+S2RCS:      Comparison = 4 # i-th start matches j-th rc-start
+E2RCE:      Comparison = 5 # i-th end matches j-th rc-end
+S2S:        Comparison = 6 # i-th start matches j-th start
+E2E:        Comparison = 7 # i-th end matches j-th end
+S2RCE:      Comparison = 8 # i-th start matches j-th rc-end
+E2RCS:      Comparison = 9 # i-th end matches j-th rc-start
+
+
+# Dictionary maps `Comparison` to termini of two overlaps it results in:
+#   (terminus_i, terminus_j) of the overlap stored for the i-th contig and
+#   (terminus_j, terminus_i) of the overlap stored for the j-th contig.
+_COMPARISON_TERMINI: Dict[Comparison, Tuple[Tuple[Terminus, Terminus], Tuple[Terminus, Terminus]]] = {
+    SELF_E2S:   ((END, START), (START, END)),
+    SELF_S2RCE: ((START, RCEND), (RCEND, START)),
+    S2E:        ((START, END), (END, START)),
+    E2S:        ((END, START), (START, END)),
+    S2RCS:      ((START, RCSTART), (START, RCSTART)),
+    E2RCE:      ((END, RCEND), (END, RCEND)),
+    S2S:        ((START, START), (START, START)),
+    E2E:        ((END, END), (END, END)),
+    S2RCE:      ((START, RCEND), (RCEND, START)),
+    E2RCS:      ((END, RCSTART), (RCSTART, END)),
+}
+
+
+# Dictionary maps (self comparison, terminus_i, terminus_j) of the overlap stored
+#   for the i-th contig to `Comparison`. It inverts `_COMPARISON_TERMINI`.
+_TERMINI_COMPARISONS: Dict[Tuple[bool, Terminus, Terminus], Comparison] = {
+    (comparison in (SELF_E2S, SELF_S2RCE), *termini[0]): comparison
+    for comparison, termini in _COMPARISON_TERMINI.items()
+}
+
+
+# Dictionary maps `Comparison` to function comparing termini and to it's arguments:
+#   (function, (contig of the 1-st terminus, 1-st terminus), (the same for the 2-nd one)).
+# Contigs are denoted as 'i' and 'j' (i <= j).
+_COMPARISON_FUNCTIONS: Dict[Comparison, Tuple[Callable[[str, str, int, int], int],
+                                              Tuple[str, str], Tuple[str, str]]] = {
+    SELF_E2S:   (find_overlap_e2s, ('i', 'end'),   ('i', 'start')),
+    SELF_S2RCE: (find_overlap_s2s, ('i', 'start'), ('i', 'rcend')),
+    S2E:        (find_overlap_e2s, ('j', 'end'),   ('i', 'start')),
+    E2S:        (find_overlap_e2s, ('i', 'end'),   ('j', 'start')),
+    S2RCS:      (find_overlap_e2s, ('j', 'rcstart'), ('i', 'start')),
+    E2RCE:      (find_overlap_e2s, ('i', 'end'),   ('j', 'rcend')),
+    S2S:        (find_overlap_s2s, ('i', 'start'), ('j', 'start')),
+    E2E:        (find_overlap_e2e, ('i', 'end'),   ('j', 'end')),
+    S2RCE:      (find_overlap_s2s, ('i', 'start'), ('j', 'rcend')),
+    E2RCS:      (find_overlap_e2e, ('i', 'end'),   ('j', 'rcstart')),
+}
+
+
+# Result of a comparison: (i, j, comparison, ovl_len).
+ComparisonHit = Tuple[int, int, Comparison, int]
+
+
+# Sides of a contig, with which overlaps are associated
+#   (see `src.combinator_statistics.is_start_match` and `is_end_match`).
+_START_SIDE: int = 0
+_END_SIDE:   int = 1
+_OTHER_SIDE: int = 2 # start-to-start-like overlaps are associated with neither side
+_NUM_SIDES:  int = 3
+
+# Dictionary maps (terminus_i, terminus_j) of an overlap to the side it is associated with.
+_OVERLAP_SIDES: Dict[Tuple[Terminus, Terminus], int] = {
+    (START, END):     _START_SIDE,
+    (START, RCSTART): _START_SIDE,
+    (END, START):     _END_SIDE,
+    (END, RCEND):     _END_SIDE,
+}
+
+# Termini of a contig, for each of which overlaps are capped
+#   (see `OverlapCollection`): rc-start is the start, and rc-end is the end.
+_START_TERMINUS: int = 0
+_END_TERMINUS:   int = 1
+_NUM_TERMINI:    int = 2
+
+# Dictionary maps terminus_i of an overlap to the terminus of the contig it involves.
+_OVERLAP_TERMINI: Dict[Terminus, int] = {
+    START:   _START_TERMINUS,
+    RCSTART: _START_TERMINUS,
+    END:     _END_TERMINUS,
+    RCEND:   _END_TERMINUS,
+}
+
+
 class Overlap:
     # Class represents overlap between two contigs.
+    # Instances are lightweight records: `OverlapCollection` does not store them,
+    #   it creates them on access.
+
+    __slots__ = ('contig_i', 'terminus_i', 'contig_j', 'terminus_j', 'ovl_len')
 
     def __init__(self,
                  contig_i: ContigIndex, terminus_i: Terminus,
@@ -43,206 +147,672 @@ class Overlap:
                 self.contig_j, self.terminus_j, self.ovl_len)
     # end def __repr__
 
-    def __eq__(self, other) -> bool:
-        if self.contig_i != other.contig_i:
-            return False
-        # end if
-        if self.contig_j != other.contig_j:
-            return False
-        # end if
-
-        if self.terminus_i != other.terminus_i:
-            return False
-        # end if
-        if self.terminus_j != other.terminus_j:
-            return False
-        # end if
+    def _as_tuple(self) -> Tuple[ContigIndex, Terminus, ContigIndex, Terminus, int]:
+        return (self.contig_i, self.terminus_i, self.contig_j, self.terminus_j, self.ovl_len)
+    # end def _as_tuple
 
-        if self.ovl_len != other.ovl_len:
-            return False
-        # end if
-
-        return True
+    def __eq__(self, other) -> bool:
+        return self._as_tuple() == (other.contig_i, other.terminus_i,
+                                    other.contig_j, other.terminus_j, other.ovl_len)
     # end def __eq__
 
     def __hash__(self) -> int:
-        return hash(repr(self))
+        return hash(self._as_tuple())
     # end def __hash__
-
-        return True
-    # end def __eq__
 # end class Overlap
 
 
 class OverlapCollection:
     # Class represents collection of `Overlap`s.
-
-    def __init__(self) -> None:
-        # Our `_collection` will be a dictionary for the sake of constant access time.
-        self._collection: Dict[List[Overlap]] = dict()
+    # Overlaps are stored in parallel typed arrays ("columns"), one row per overlap,
+    #   in order of addition. Rows of each contig are located with an offset index,
+    #   which is built on the first access after addition of overlaps.
+    # Side of a contig (start or end), with which an overlap is associated,
+    #   is determined on addition, and start-side and end-side rows of each contig
+    #   are located with another offset index.
+    # A collection can be capped: then only M longest overlaps of each terminus
+    #   (start or end, including start-to-start-like overlaps) of a contig
+    #   are retained in a bounded heap, and a row of an overlap pushed out of the heap
+    #   is reused by the next one. Numbers of all added overlaps are counted,
+    #   so that a terminus with more than M overlaps (a repeat "hub") and the number
+    #   of dropped overlaps are known.
+
+    def __init__(self, max_overlaps_per_terminus: int = None) -> None:
+        # :param max_overlaps_per_terminus: maximum number of overlaps retained
+        #   for each terminus of a contig; None means no limit;
+        # Columns of overlaps
+        self._keys:       array = array('i') # contigs, to which overlaps belong
+        self._contigs_i:  array = array('i')
+        self._termini_i:  array = array('b')
+        self._contigs_j:  array = array('i')
+        self._termini_j:  array = array('b')
+        self._ovl_lens:   array = array('i')
+        self._sides:      array = array('b') # sides, with which overlaps are associated
+
+        # Offset index: rows of the key-th contig are
+        #   `_order[_offsets[key] : _offsets[key+1]]`
+        self._order:   array = array('i')
+        self._offsets: array = array('i', [0])
+        # Offset index of sides: rows of the key-th contig associated with the side are
+        #   `_side_order[_side_offsets[b] : _side_offsets[b+1]]`, where b = key * _NUM_SIDES + side
+        self._side_order:   array = array('i')
+        self._side_offsets: array = array('i', [0])
+        self._index_is_valid: bool = True
+
+        self.max_overlaps_per_terminus: int = max_overlaps_per_terminus
+        if not max_overlaps_per_terminus is None:
+            # Ordinal numbers of addition of overlaps, since rows are reused
+            self._seqs: array = array('q')
+            self._num_added: int = 0
+            # Bounded heaps of (ovl_len, -seq, row) of each terminus of each contig
+            #   (key is key * _NUM_TERMINI + terminus): the top is the shortest overlap,
+            #   of them -- the latest added one
+            self._heaps: Dict[int, List[Tuple[int, int, int]]] = dict()
+            # Numbers of all overlaps added for each terminus of each contig
+            self._terminus_totals: Dict[int, int] = dict()
+            # Numbers of all overlaps added for each side of each contig
+            self._side_totals: Dict[int, int] = dict()
+        # end if
     # end def
 
-    def __getitem__(self, key: ContigIndex) -> List[Overlap]:
-        # Returns list of overlaps associate with `key` contig.
-        try:
-            item_to_return = self._collection[key]
-        except KeyError:
-            # Return tuple just for efficiecy,
-            #   though, strictly speaking, it should have been a list.
-            item_to_return = tuple()
-        # end try
-        return item_to_return
+    def __getitem__(self, key: ContigIndex) -> Sequence[Overlap]:
+        # Returns tuple of overlaps associate with `key` contig.
+        if not self._index_is_valid:
+            self._build_index()
+        # end if
+
+        if key < 0 or key + 1 >= len(self._offsets):
+            return tuple()
+        # end if
+
+        return self._get_rows(self._order[self._offsets[key] : self._offsets[key+1]])
     # end def __getitem__
 
-    def __len__(self):
-        return len(self._collection.keys())
+    def get_start_overlaps(self, key: ContigIndex) -> Sequence[Overlap]:
+        # Returns tuple of overlaps associated with start of `key` contig.
+        return self._get_side_overlaps(key, _START_SIDE)
+    # end def get_start_overlaps
+
+    def get_end_overlaps(self, key: ContigIndex) -> Sequence[Overlap]:
+        # Returns tuple of overlaps associated with end of `key` contig.
+        return self._get_side_overlaps(key, _END_SIDE)
+    # end def get_end_overlaps
+
+    def get_longest_start_overlaps(self, key: ContigIndex, num: int) -> Sequence[Overlap]:
+        # Returns tuple of `num` longest overlaps associated with start of `key` contig.
+        return self._get_longest_side_overlaps(key, _START_SIDE, num)
+    # end def get_longest_start_overlaps
+
+    def get_longest_end_overlaps(self, key: ContigIndex, num: int) -> Sequence[Overlap]:
+        # Returns tuple of `num` longest overlaps associated with end of `key` contig.
+        return self._get_longest_side_overlaps(key, _END_SIDE, num)
+    # end def get_longest_end_overlaps
+
+    def count_start_overlaps(self, key: ContigIndex) -> int:
+        # Returns number of overlaps associated with start of `key` contig,
+        #   including ones dropped by the cap.
+        return self._count_side_overlaps(key, _START_SIDE)
+    # end def count_start_overlaps
+
+    def count_end_overlaps(self, key: ContigIndex) -> int:
+        # Returns number of overlaps associated with end of `key` contig,
+        #   including ones dropped by the cap.
+        return self._count_side_overlaps(key, _END_SIDE)
+    # end def count_end_overlaps
+
+    def count_dropped_start_overlaps(self, key: ContigIndex) -> int:
+        # Returns number of start-associated overlaps of `key` contig dropped by the cap.
+        return self._count_dropped_side_overlaps(key, _START_SIDE)
+    # end def count_dropped_start_overlaps
+
+    def count_dropped_end_overlaps(self, key: ContigIndex) -> int:
+        # Returns number of end-associated overlaps of `key` contig dropped by the cap.
+        return self._count_dropped_side_overlaps(key, _END_SIDE)
+    # end def count_dropped_end_overlaps
+
+    def count_dropped_overlaps(self, key: ContigIndex) -> int:
+        # Returns number of all overlaps of `key` contig dropped by the cap.
+        terminus: int
+        return sum(
+            self._count_dropped_terminus_overlaps(key, terminus)
+            for terminus in range(_NUM_TERMINI)
+        )
+    # end def count_dropped_overlaps
+
+    def is_start_hub(self, key: ContigIndex) -> bool:
+        # Returns True if start of `key` contig has more overlaps than the cap allows.
+        return self._count_dropped_terminus_overlaps(key, _START_TERMINUS) != 0
+    # end def is_start_hub
+
+    def is_end_hub(self, key: ContigIndex) -> bool:
+        # Returns True if end of `key` contig has more overlaps than the cap allows.
+        return self._count_dropped_terminus_overlaps(key, _END_TERMINUS) != 0
+    # end def is_end_hub
+
+    def _get_side_overlaps(self, key: ContigIndex, side: int) -> Sequence[Overlap]:
+        # Returns tuple of overlaps of `key` contig associated with the side.
+        if not self._index_is_valid:
+            self._build_index()
+        # end if
+
+        if key < 0 or key + 1 >= len(self._offsets):
+            return tuple()
+        # end if
+
+        bucket: int = key * _NUM_SIDES + side
+        return self._get_rows(
+            self._side_order[self._side_offsets[bucket] : self._side_offsets[bucket+1]]
+        )
+    # end def _get_side_overlaps
+
+    def _get_longest_side_overlaps(self, key: ContigIndex, side: int,
+                                   num: int) -> Sequence[Overlap]:
+        # Returns tuple of `num` longest overlaps of `key` contig associated with the side,
+        #   in descending order of length.
+        # Rows are selected with a bounded heap in O(N log num) time, and only
+        #   selected ones are turned into `Overlap`s. Selection is stable:
+        #   of overlaps of equal length, the earlier added ones are taken.
+        if not self._index_is_valid:
+            self._build_index()
+        # end if
+
+        if key < 0 or key + 1 >= len(self._offsets):
+            return tuple()
+        # end if
+
+        bucket: int = key * _NUM_SIDES + side
+        return self._get_rows(nlargest(
+            num,
+            self._side_order[self._side_offsets[bucket] : self._side_offsets[bucket+1]],
+            key=self._ovl_lens.__getitem__
+        ))
+    # end def _get_longest_side_overlaps
+
+    def _count_side_overlaps(self, key: ContigIndex, side: int) -> int:
+        # Returns number of overlaps of `key` contig associated with the side,
+        #   including ones dropped by the cap.
+        if not self.max_overlaps_per_terminus is None:
+            return self._side_totals.get(key * _NUM_SIDES + side, 0)
+        # end if
+        return self._count_retained_side_overlaps(key, side)
+    # end def _count_side_overlaps
+
+    def _count_dropped_side_overlaps(self, key: ContigIndex, side: int) -> int:
+        # Returns number of overlaps of `key` contig associated with the side,
+        #   which are dropped by the cap.
+        if self.max_overlaps_per_terminus is None:
+            return 0
+        # end if
+        return self._count_side_overlaps(key, side) \
+               - self._count_retained_side_overlaps(key, side)
+    # end def _count_dropped_side_overlaps
+
+    def _count_dropped_terminus_overlaps(self, key: ContigIndex, terminus: int) -> int:
+        # Returns number of overlaps of `key` contig involving the terminus,
+        #   which are dropped by the cap.
+        if self.max_overlaps_per_terminus is None:
+            return 0
+        # end if
+        bucket: int = key * _NUM_TERMINI + terminus
+        return self._terminus_totals.get(bucket, 0) - len(self._heaps.get(bucket, tuple()))
+    # end def _count_dropped_terminus_overlaps
+
+    def _count_retained_side_overlaps(self, key: ContigIndex, side: int) -> int:
+        # Returns number of retained overlaps of `key` contig associated with the side.
+        if not self._index_is_valid:
+            self._build_index()
+        # end if
+
+        if key < 0 or key + 1 >= len(self._offsets):
+            return 0
+        # end if
+
+        bucket: int = key * _NUM_SIDES + side
+        return self._side_offsets[bucket+1] - self._side_offsets[bucket]
+    # end def _count_retained_side_overlaps
+
+    def _get_rows(self, rows: Iterable[int]) -> Sequence[Overlap]:
+        # Returns tuple of overlaps stored in given rows.
+        return tuple(
+            Overlap(self._contigs_i[row], self._termini_i[row],
+                    self._contigs_j[row], self._termini_j[row],
+                    self._ovl_lens[row])
+            for row in rows
+        )
+    # end def _get_rows
+
+    def __len__(self) -> int:
+        # Returns number of contigs having overlaps.
+        if not self._index_is_valid:
+            self._build_index()
+        # end if
+        return sum(
+            map(lambda x: x[1] > x[0], zip(self._offsets, self._offsets[1:]))
+        )
     # end def __len__
 
     def add_overlap(self, key: ContigIndex, overlap: Overlap) -> None:
-        # Function adds overlap to proper list.
+        # Function adds overlap to the collection.
         #
         # :param key: key of contig of interest;
         # :param overlap: `Overlap` instance of the overlap to add;
-        try:
-            self._collection[key].append(overlap) # just append
-        except KeyError:
-            # If it's the 1-st overlap, initialize the list.
-            self._collection[key] = [overlap]
-        # end try
+        self.add_overlap_fields(key,
+                                overlap.contig_i, overlap.terminus_i,
+                                overlap.contig_j, overlap.terminus_j,
+                                overlap.ovl_len)
     # end def add_overlap
 
+    def add_overlap_fields(self, key: ContigIndex,
+                           contig_i: ContigIndex, terminus_i: Terminus,
+                           contig_j: ContigIndex, terminus_j: Terminus,
+                           ovl_len: int) -> None:
+        # Function adds overlap to the collection without creating `Overlap` instance.
+        #
+        # :param key: key of contig of interest;
+        # Other parameters are fields of the overlap (see `Overlap.__init__`);
+        side: int = _OVERLAP_SIDES.get((terminus_i, terminus_j), _OTHER_SIDE)
+
+        if not self.max_overlaps_per_terminus is None:
+            self._add_capped_overlap_fields(key, side, contig_i, terminus_i,
+                                            contig_j, terminus_j, ovl_len)
+            return
+        # end if
+
+        self._keys.append(key)
+        self._contigs_i.append(contig_i)
+        self._termini_i.append(terminus_i)
+        self._contigs_j.append(contig_j)
+        self._termini_j.append(terminus_j)
+        self._ovl_lens.append(ovl_len)
+        self._sides.append(side)
+        self._index_is_valid = False
+    # end def add_overlap_fields
+
+    def _add_capped_overlap_fields(self, key: ContigIndex, side: int,
+                                   contig_i: ContigIndex, terminus_i: Terminus,
+                                   contig_j: ContigIndex, terminus_j: Terminus,
+                                   ovl_len: int) -> None:
+        # Function adds overlap to the capped collection:
+        #   if the terminus already has M overlaps, the new overlap either replaces
+        #   the shortest of them (in it's row), or is dropped, if it is not longer.
+        #   Thus, of overlaps of equal length, the earlier added ones are retained.
+        side_bucket: int = key * _NUM_SIDES + side
+        self._side_totals[side_bucket] = self._side_totals.get(side_bucket, 0) + 1
+        bucket: int = key * _NUM_TERMINI + _OVERLAP_TERMINI[terminus_i]
+        self._terminus_totals[bucket] = self._terminus_totals.get(bucket, 0) + 1
+        seq: int = self._num_added
+        self._num_added += 1
+
+        heap: List[Tuple[int, int, int]] = self._heaps.setdefault(bucket, list())
+        row: int
+
+        if len(heap) < self.max_overlaps_per_terminus:
+            row = len(self._keys)
+            heappush(heap, (ovl_len, -seq, row))
+            self._keys.append(key)
+            self._contigs_i.append(contig_i)
+            self._termini_i.append(terminus_i)
+            self._contigs_j.append(contig_j)
+            self._termini_j.append(terminus_j)
+            self._ovl_lens.append(ovl_len)
+            self._sides.append(side)
+            self._seqs.append(seq)
+        elif (ovl_len, -seq) > heap[0][:2]:
+            row = heap[0][2]
+            heapreplace(heap, (ovl_len, -seq, row))
+            # Key of the row remains the same
+            self._contigs_i[row] = contig_i
+            self._termini_i[row] = terminus_i
+            self._contigs_j[row] = contig_j
+            self._termini_j[row] = terminus_j
+            self._ovl_lens[row] = ovl_len
+            self._sides[row] = side
+            self._seqs[row] = seq
+        else:
+            return # the overlap is dropped
+        # end if
+
+        self._index_is_valid = False
+    # end def _add_capped_overlap_fields
+
+    def get_comparison_hits(self) -> List[ComparisonHit]:
+        # Function returns comparison hits, from which the collection was built.
+        # Overlaps must have been added by `add_comparison_overlaps`
+        #   to a collection, which is not capped: each hit is then stored in two
+        #   successive rows, and the first one belongs to the i-th contig.
+        return [
+            (self._contigs_i[row], self._contigs_j[row],
+             _TERMINI_COMPARISONS[(self._contigs_i[row] == self._contigs_j[row],
+                                   self._termini_i[row], self._termini_j[row])],
+             self._ovl_lens[row])
+            for row in range(0, len(self._keys), 2)
+        ]
+    # end def get_comparison_hits
+
+    def _build_index(self) -> None:
+        # Function builds offset indices with counting sort of rows by keys
+        #   and by (key, side) pairs.
+        # Sort is stable, thus overlaps of a contig preserve order of their addition.
+        # Rows of a capped collection are reused, so they are sorted
+        #   by ordinal numbers of addition beforehand.
+
+        num_keys: int = max(self._keys) + 1 if len(self._keys) != 0 else 0
+
+        rows: Sequence[int] = range(len(self._keys))
+        if not self.max_overlaps_per_terminus is None:
+            rows = sorted(rows, key=self._seqs.__getitem__)
+        # end if
+
+        self._order, self._offsets = _counting_sort(
+            array('i', (self._keys[row] for row in rows)),
+            num_keys
+        )
+        self._side_order, self._side_offsets = _counting_sort(
+            array('i', (self._keys[row] * _NUM_SIDES + self._sides[row] for row in rows)),
+            num_keys * _NUM_SIDES
+        )
+        if not self.max_overlaps_per_terminus is None:
+            self._order = array('i', (rows[x] for x in self._order))
+            self._side_order = array('i', (rows[x] for x in self._side_order))
+        # end if
+        self._index_is_valid = True
+    # end def _build_index
+
     def __repr__(self) -> str:
-        return str(self._collection)
+        if not self._index_is_valid:
+            self._build_index()
+        # end if
+        key: ContigIndex
+        return str({
+            key: list(self[key])
+            for key in range(len(self._offsets) - 1)
+            if self._offsets[key+1] > self._offsets[key]
+        })
     # end def __repr__
 # end class OverlapCollection
 
 
+def _counting_sort(buckets: Sequence[int], num_buckets: int) -> Tuple[array, array]:
+    # Function sorts rows by their buckets with counting sort.
+    # Returns two arrays: rows in sorted order, and offsets:
+    #   rows of the b-th bucket are `order[offsets[b] : offsets[b+1]]`.
+    #
+    # :param buckets: bucket of each row;
+    # :param num_buckets: number of buckets;
+
+    # Count rows in each bucket and convert counts to offsets
+    offsets: array = array('i', bytes(4 * (num_buckets + 1)))
+    bucket: int
+    for bucket in buckets:
+        offsets[bucket + 1] += 1
+    # end for
+    for bucket in range(num_buckets):
+        offsets[bucket + 1] += offsets[bucket]
+    # end for
+
+    # Place rows to their positions
+    positions: array = array('i', offsets)
+    order: array = array('i', bytes(4 * len(buckets)))
+    row: int
+    for row, bucket in enumerate(buckets):
+        order[positions[bucket]] = row
+        positions[bucket] += 1
+    # end for
+
+    return order, offsets
+# end def _counting_sort
+
+
+def add_comparison_overlaps(overlap_collection: OverlapCollection,
+                            i: ContigIndex, j: ContigIndex,
+                            comparison: Comparison, ovl_len: int) -> None:
+    # Function adds both overlaps resulting from a comparison of contigs i and j
+    #   to `overlap_collection`.
+    #
+    # :param overlap_collection: `OverlapCollection` to add overlaps to;
+    # :param i: index of the 1-st contig (i <= j);
+    # :param j: index of the 2-nd contig;
+    # :param comparison: `Comparison` which detected the overlap;
+    # :param ovl_len: length of the overlap;
+
+    termini_i: Tuple[Terminus, Terminus]
+    termini_j: Tuple[Terminus, Terminus]
+    termini_i, termini_j = _COMPARISON_TERMINI[comparison]
+
+    overlap_collection.add_overlap_fields(i, i, termini_i[0], j, termini_i[1], ovl_len)
+    overlap_collection.add_overlap_fields(j, j, termini_j[0], i, termini_j[1], ovl_len)
+# end def add_comparison_overlaps
+
+
+def collect_overlaps(hits: Iterable[ComparisonHit],
+                     max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function converts comparison hits into `OverlapCollection`.
+    # Hits must be ordered by (i, j, comparison) -- in this case
+    #   overlaps are stored in the same order as `detect_adjacent_contigs` stores them.
+    #
+    # :param hits: collection of (i, j, comparison, ovl_len) tuples;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    overlap_collection: OverlapCollection = OverlapCollection(max_overlaps_per_terminus)
+
+    i: ContigIndex
+    j: ContigIndex
+    comparison: Comparison
+    ovl_len: int
+    for i, j, comparison, ovl_len in hits:
+        add_comparison_overlaps(overlap_collection, i, j, comparison, ovl_len)
+    # end for
+
+    return overlap_collection
+# end def collect_overlaps
+
+
+def compare_contigs(contig_collection: ContigCollection,
+                    i: ContigIndex, j: ContigIndex, comparison: Comparison,
+                    mink: int, maxk: int) -> int:
+    # Function performs a single comparison of termini of contigs i and j (i <= j).
+    # Returns length of the overlap, or 0 if termini do not overlap.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param i: index of the 1-st contig;
+    # :param j: index of the 2-nd contig;
+    # :param comparison: `Comparison` to perform;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+
+    contigs: Dict[str, Contig] = {'i': contig_collection[i], 'j': contig_collection[j]}
+    find_overlap, (contig_1, terminus_1), (contig_2, terminus_2) = \
+        _COMPARISON_FUNCTIONS[comparison]
+
+    return find_overlap(getattr(contigs[contig_1], terminus_1),
+                        getattr(contigs[contig_2], terminus_2),
+                        mink, maxk)
+# end def compare_contigs
+
+
 def detect_adjacent_contigs(contig_collection: ContigCollection,
-                            mink: int, maxk: int) -> OverlapCollection:
+                            mink: int, maxk: int,
+                            max_overlaps_per_terminus: int = None) -> OverlapCollection:
     # Function detects adjacent contigs by comparing their termini.
     #
     # :param contig_collection: instance of ContigCollection returned by
     #   `src.contigs.get_contig_collection` function;
     # :param mink: minimum length of and overlap to be detected;
     # :param maxk: maximum length of and overlap to be detected;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
 
     # Count contigs and save this length in order nom to re-cont it later.
     num_contigs: int = len(contig_collection)
 
     # Initialize `OverlapCollection` instance
-    overlap_collection: OverlapCollection = OverlapCollection()
+    overlap_collection: OverlapCollection = OverlapCollection(max_overlaps_per_terminus)
 
     # Iterate over contigs and compare it's termini to other termini
-    ovl_len: int
     i: ContigIndex
     for i in range(num_contigs):
 
-        # Omit contigs shorter that 'mink'
-        if contig_collection[i].length <= mink:
-            print('\r{}/{}'.format(i+1, num_contigs), end='')
-            continue
+        hit: ComparisonHit
+        for hit in compare_contig_row(contig_collection, i, mink, maxk):
+            add_comparison_overlaps(overlap_collection, *hit)
+        # end for
+
+        print('\r{}/{}'.format(i+1, num_contigs), end='')
+    # end for
+    print()
+
+    return overlap_collection
+# end def detect_adjacent_contigs
+
+
+def compare_contig_row(contig_collection: ContigCollection, i: ContigIndex,
+                       mink: int, maxk: int) -> List[ComparisonHit]:
+    # Function compares termini of the i-th contig to it's own termini and
+    #   to termini of contigs from i+1 to N.
+    # Returns list of comparison hits ordered by (j, comparison).
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param i: index of the contig to compare;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+
+    return compare_contig_partners(contig_collection, i,
+                                   range(i+1, len(contig_collection)), mink, maxk)
+# end def compare_contig_row
+
+
+def compare_contig_partners(contig_collection: ContigCollection, i: ContigIndex,
+                            partners: Iterable[ContigIndex],
+                            mink: int, maxk: int,
+                            suffix_prefix_only: bool = False) -> List[ComparisonHit]:
+    # Function compares termini of the i-th contig to it's own termini and
+    #   to termini of given contigs following it.
+    # Returns list of comparison hits ordered by (j, comparison).
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param i: index of the contig to compare;
+    # :param partners: indices of contigs to compare the i-th one to, in ascending order;
+    #   all of them must be greater than i;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param suffix_prefix_only: if True, termini of partners are compared only
+    #   in end-to-start-like comparisons (S2E, E2S, S2RCS and E2RCE);
+
+    hits: List[ComparisonHit] = list()
+
+    contig_i: Contig = contig_collection[i]
+
+    # Omit contigs shorter that 'mink'
+    if contig_i.length <= mink:
+        return hits
+    # end if
+
+    ovl_len: int
+
+    # === Compare start of the current contig to end of the current contig ===
+    ovl_len = find_overlap_e2s(contig_i.end,
+                               contig_i.start,
+                               mink, maxk)
+    if not ovl_len in (0, contig_i.length):
+        hits.append((i, i, SELF_E2S, ovl_len))
+    # end if
+
+    # === Compare start of the current conitg to rc-end of the current contig ===
+    ovl_len = find_overlap_s2s_packed(contig_i.start,
+                                      contig_i.packed_start,
+                                      contig_i.rcend,
+                                      contig_i.packed_rcend,
+                                      mink, maxk)
+    if ovl_len != 0:
+        hits.append((i, i, SELF_S2RCE, ovl_len))
+    # end if
+
+
+    # |=== Compare i-th contig to partners ===|
+    # Partners follow the i-th contig in order not to compare pairs of contigs more than one time
+    j: ContigIndex
+    for j in partners:
+        contig_j: Contig = contig_collection[j]
+
+        # === Compare i-th start to j-th end ===
+        ovl_len = find_overlap_e2s(contig_j.end,
+                                   contig_i.start,
+                                   mink, maxk)
+        if ovl_len != 0:
+            hits.append((i, j, S2E, ovl_len))
         # end if
 
-        # === Compare start of the current contig to end of the current contig ===
-        ovl_len = find_overlap_e2s(contig_collection[i].end,
-                                   contig_collection[i].start,
+        # === Compare i-th end to j-th start ===
+        ovl_len = find_overlap_e2s(contig_i.end,
+                                   contig_j.start,
                                    mink, maxk)
-        if not ovl_len in (0, contig_collection[i].length):
-            overlap_collection.add_overlap(i, Overlap(i, END, i, START, ovl_len))
-            overlap_collection.add_overlap(i, Overlap(i, START, i, END, ovl_len))
+        if ovl_len != 0:
+            hits.append((i, j, E2S, ovl_len))
         # end if
 
-        # === Compare start of the current conitg to rc-end of the current contig ===
-        ovl_len = find_overlap_s2s(contig_collection[i].start,
-                                   contig_collection[i].rcend,
+        # === Compare i-th start to reverse-complement j-th start ===
+        ovl_len = find_overlap_e2s(contig_j.rcstart,
+                                   contig_i.start,
                                    mink, maxk)
         if ovl_len != 0:
-            overlap_collection.add_overlap(i, Overlap(i, START, i, RCEND, ovl_len))
-            overlap_collection.add_overlap(i, Overlap(i, RCEND, i, START, ovl_len))
-        # end if
-
-
-        # |=== Compare i-th contig to contigs from i+1 to N ===|
-        # We do it in order not to compare pairs of contigs more than one time
-        j: ContigIndex
-        for j in range(i+1, num_contigs):
-
-            # === Compare i-th start to j-th end ===
-            ovl_len = find_overlap_e2s(contig_collection[j].end,
-                                       contig_collection[i].start,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, START, j, END, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, END, i, START, ovl_len))
-            # end if
-
-            # === Compare i-th end to j-th start ===
-            ovl_len = find_overlap_e2s(contig_collection[i].end,
-                                       contig_collection[j].start,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, END, j, START, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, START, i, END, ovl_len))
-            # end if
-
-            # === Compare i-th start to reverse-complement j-th start ===
-            ovl_len = find_overlap_e2s(contig_collection[j].rcstart,
-                                       contig_collection[i].start,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, START, j, RCSTART, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, START, i, RCSTART, ovl_len))
-            # end if
-
-            # === Compare i-th end to reverse-complement j-th end ===
-            ovl_len = find_overlap_e2s(contig_collection[i].end,
-                                       contig_collection[j].rcend,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, END, j, RCEND, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, END, i, RCEND, ovl_len))
-            # end if
-
-            # === Compare i-th start to j-th start ===
-            ovl_len = find_overlap_s2s(contig_collection[i].start,
-                                       contig_collection[j].start,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, START, j, START, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, START, i, START, ovl_len))
-            # end if
-
-            # === Compare i-th end to j-th end ===
-            ovl_len = find_overlap_e2e(contig_collection[i].end,
-                                       contig_collection[j].end,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, END, j, END, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, END, i, END, ovl_len))
-            # end if
-
-            # === Compare i-th start to reverse-complement j-th end ===
-            ovl_len = find_overlap_s2s(contig_collection[i].start,
-                                       contig_collection[j].rcend,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, START, j, RCEND, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, RCEND, i, START, ovl_len))
-            # end if
-
-            # === Compare i-th end to reverse-complement j-th start ===
-            ovl_len = find_overlap_e2e(contig_collection[i].end,
-                                       contig_collection[j].rcstart,
-                                       mink, maxk)
-            if ovl_len != 0:
-                overlap_collection.add_overlap(i, Overlap(i, END, j, RCSTART, ovl_len))
-                overlap_collection.add_overlap(j, Overlap(j, RCSTART, i, END, ovl_len))
-            # end if
-        # end for
+            hits.append((i, j, S2RCS, ovl_len))
+        # end if
 
-        print('\r{}/{}'.format(i+1, num_contigs), end='')
+        # === Compare i-th end to reverse-complement j-th end ===
+        ovl_len = find_overlap_e2s(contig_i.end,
+                                   contig_j.rcend,
+                                   mink, maxk)
+        if ovl_len != 0:
+            hits.append((i, j, E2RCE, ovl_len))
+        # end if
+
+        if suffix_prefix_only:
+            continue
+        # end if
+
+        # === Compare i-th start to j-th start ===
+        ovl_len = find_overlap_s2s_packed(contig_i.start,
+                                          contig_i.packed_start,
+                                          contig_j.start,
+                                          contig_j.packed_start,
+                                          mink, maxk)
+        if ovl_len != 0:
+            hits.append((i, j, S2S, ovl_len))
+        # end if
+
+        # === Compare i-th end to j-th end ===
+        ovl_len = find_overlap_e2e_packed(contig_i.end,
+                                          contig_i.packed_end,
+                                          contig_j.end,
+                                          contig_j.packed_end,
+                                          mink, maxk)
+        if ovl_len != 0:
+            hits.append((i, j, E2E, ovl_len))
+        # end if
+
+        # === Compare i-th start to reverse-complement j-th end ===
+        ovl_len = find_overlap_s2s_packed(contig_i.start,
+                                          contig_i.packed_start,
+                                          contig_j.rcend,
+                                          contig_j.packed_rcend,
+                                          mink, maxk)
+        if ovl_len != 0:
+            hits.append((i, j, S2RCE, ovl_len))
+        # end if
+
+        # === Compare i-th end to reverse-complement j-th start ===
+        ovl_len = find_overlap_e2e_packed(contig_i.end,
+                                          contig_i.packed_end,
+                                          contig_j.rcstart,
+                                          contig_j.packed_rcstart,
+                                          mink, maxk)
+        if ovl_len != 0:
+            hits.append((i, j, E2RCS, ovl_len))
+        # end if
     # end for
-    print()
 
-    return overlap_collection
-# end def detect_adjacent_contigs
+    return hits
+# end def compare_contig_partners
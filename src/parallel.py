@@ -0,0 +1,126 @@
+# -*- encoding: utf-8 -*-
+
+import multiprocessing as mp
+from typing import List, Tuple
+
+from src.contigs import ContigCollection, ContigIndex
+from src.overlaps import OverlapCollection, ComparisonHit
+from src.overlaps import compare_contig_row, add_comparison_overlaps
+
+
+# Block of rows of the comparison "matrix": [row_start, row_stop)
+RowBlock = Tuple[ContigIndex, ContigIndex]
+
+# Number of blocks per worker process.
+# Several blocks per process let processes, which finish early, take more work.
+_BLOCKS_PER_PROCESS: int = 4
+
+# Following variables are set in worker processes by `_init_worker`
+_worker_contig_collection: ContigCollection = None
+_worker_mink: int = None
+_worker_maxk: int = None
+
+
+def detect_adjacent_contigs_parallel(contig_collection: ContigCollection,
+                                     mink: int, maxk: int,
+                                     threads: int,
+                                     max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function detects adjacent contigs by comparing their termini
+    #   in `threads` worker processes.
+    # Result is identical to one returned by `src.overlaps.detect_adjacent_contigs`.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param threads: number of worker processes;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    num_contigs: int = len(contig_collection)
+
+    # Split triangular space of contig pairs into blocks of rows
+    row_blocks: List[RowBlock] = split_pair_space(num_contigs,
+                                                  threads * _BLOCKS_PER_PROCESS)
+
+    overlap_collection: OverlapCollection = OverlapCollection(max_overlaps_per_terminus)
+
+    with mp.Pool(threads, initializer=_init_worker,
+                 initargs=(contig_collection, mink, maxk)) as pool:
+
+        # Blocks are returned in order of submission,
+        #   thus overlaps are stored in the same order as in a serial run.
+        block: RowBlock
+        block_hits: List[ComparisonHit]
+        for block, block_hits in zip(row_blocks, pool.imap(_compare_row_block, row_blocks)):
+
+            hit: ComparisonHit
+            for hit in block_hits:
+                add_comparison_overlaps(overlap_collection, *hit)
+            # end for
+
+            print('\r{}/{}'.format(block[1], num_contigs), end='')
+        # end for
+    # end with
+    print()
+
+    return overlap_collection
+# end def detect_adjacent_contigs_parallel
+
+
+def split_pair_space(num_contigs: int, num_blocks: int) -> List[RowBlock]:
+    # Function splits rows of triangular space of contig pairs (i, j >= i)
+    #   into at most `num_blocks` contiguous blocks containing
+    #   approximately equal numbers of pairs.
+    # Row i contains N-i pairs, thus blocks of first rows are shorter.
+    #
+    # :param num_contigs: number of contigs;
+    # :param num_blocks: number of blocks to produce;
+
+    total_pairs: int = num_contigs * (num_contigs + 1) // 2
+    num_blocks = max(1, min(num_blocks, num_contigs))
+
+    row_blocks: List[RowBlock] = list()
+    row_start: ContigIndex = 0
+    pairs_so_far: int = 0
+
+    i: ContigIndex
+    for i in range(num_contigs):
+        pairs_so_far += num_contigs - i
+        # Close the block, when it reaches it's share of pairs
+        if pairs_so_far * num_blocks >= total_pairs * (len(row_blocks) + 1):
+            row_blocks.append((row_start, i + 1))
+            row_start = i + 1
+        # end if
+    # end for
+
+    return row_blocks
+# end def split_pair_space
+
+
+def _init_worker(contig_collection: ContigCollection, mink: int, maxk: int) -> None:
+    # Function initializes worker process.
+    global _worker_contig_collection, _worker_mink, _worker_maxk
+    _worker_contig_collection = contig_collection
+    _worker_mink = mink
+    _worker_maxk = maxk
+# end def _init_worker
+
+
+def _compare_row_block(block: RowBlock) -> List[ComparisonHit]:
+    # Function compares termini of contigs from a block of rows
+    #   to termini of contigs that follow them.
+    #
+    # :param block: block of rows (row_start, row_stop);
+
+    block_hits: List[ComparisonHit] = list()
+
+    i: ContigIndex
+    for i in range(*block):
+        block_hits.extend(
+            compare_contig_row(_worker_contig_collection, i, _worker_mink, _worker_maxk)
+        )
+    # end for
+
+    return block_hits
+# end def _compare_row_block
@@ -4,9 +4,13 @@ import os
 import sys
 import glob
 import getopt
+import multiprocessing as mp
 from typing import List, Sequence, Dict, Mapping, Any, Tuple
 
 import src.filesystem
+from src.engines import ENGINES, DEFAULT_ENGINE, LONG_OVERLAP_ENGINE, LONG_OVERLAP_MAXK
+from src.engines import K_SWEEP_ENGINE, SHARD_ENGINE
+from src.bloom import DEFAULT_BLOOM_FPR, DEFAULT_BLOOM_MEMORY
 from src.print_help import print_help
 from src.platform import platf_depend_exit
 
@@ -33,8 +37,9 @@ def parse_args(version: str, last_update_date: str) -> Tuple[Sequence[str], Mapp
     opts: List[List[str]]
     args: List[str]
     try:
-        opts, args = getopt.gnu_getopt(sys.argv[1:], 'hvk:i:a:o:',
-            ['help', 'version', 'k-mer=', 'mink=', 'maxk=', 'outdir='])
+        opts, args = getopt.gnu_getopt(sys.argv[1:], 'hvk:i:a:o:e:t:',
+            ['help', 'version', 'k-mer=', 'mink=', 'maxk=', 'outdir=', 'engine=', 'threads=', 'no-cache', 'cache-dir=', 'k-sweep=', 'shard=',
+             'bloom-fpr=', 'bloom-mem=', 'max-overlaps-per-terminus='])
     except getopt.GetoptError as err:
         print(str(err))
         platf_depend_exit(2)
@@ -60,10 +65,92 @@ def parse_args(version: str, last_update_date: str) -> Tuple[Sequence[str], Mapp
         # end if
     # end if
 
+    # Select engine for long overlaps, if neither engine nor number of threads is specified:
+    #   several threads are used by the default engine only.
+    if params['a'] >= LONG_OVERLAP_MAXK \
+       and not any(map(lambda opt: opt[0] in ('-e', '--engine', '-t', '--threads'), opts)):
+        params['e'] = LONG_OVERLAP_ENGINE
+    # end if
+
+    if not params['sweep'] is None and not params['shard'] is None:
+        print('Error: options `--k-sweep` and `--shard` cannot be used together.')
+        platf_depend_exit(1)
+    # end if
+
+    # Sweep over k-mer lengths always joins termini in hash indices
+    if not params['sweep'] is None:
+        if any(map(lambda opt: opt[0] in ('-e', '--engine'), opts)):
+            print('Error: option `-e` cannot be used with option `--k-sweep`.')
+            platf_depend_exit(1)
+        # end if
+        params['e'] = K_SWEEP_ENGINE
+    # end if
+
+    # Shards always compare pairs of contigs one by one
+    if not params['shard'] is None:
+        if any(map(lambda opt: opt[0] in ('-e', '--engine'), opts)):
+            print('Error: option `-e` cannot be used with option `--shard`.')
+            platf_depend_exit(1)
+        # end if
+        params['e'] = SHARD_ENGINE
+    # end if
+
     return contigs_fpaths, params
 # end def parse_args
 
 
+def parse_merge_args(version: str,
+                     last_update_date: str) -> Tuple[str, Sequence[str], Mapping[str, Any]]:
+    # Function parses command line arguments of `merge` command:
+    #   `combinator-FQ.py merge <input fasta> <partial files> [-o outdir] [-t threads] [--no-cache]
+    #      [--cache-dir dir]
+    #      [--max-overlaps-per-terminus M]`
+    # Returns three values:
+    #  1. Path to input fasta file, for which partial files are made.
+    #  2. Collection of paths to partial files.
+    #  3. Dictionary of parameters (see function _parse_options).
+
+    # Print help message and exit if required
+    if '-h' in sys.argv[2:] or '--help' in sys.argv[2:]:
+        print_help(version, last_update_date)
+        platf_depend_exit()
+    # end if
+
+    # Parse arguments woth getopt
+    opts: List[List[str]]
+    args: List[str]
+    try:
+        opts, args = getopt.gnu_getopt(sys.argv[2:], 'ho:t:',
+            ['help', 'outdir=', 'threads=', 'no-cache', 'cache-dir=', 'max-overlaps-per-terminus='])
+    except getopt.GetoptError as err:
+        print(str(err))
+        platf_depend_exit(2)
+    # end try
+
+    if len(args) < 2:
+        print('Error: input fasta file and partial files must be specified for `merge` command.')
+        print('Please, type `{} -h` for help.'.format(sys.argv[0]))
+        platf_depend_exit(1)
+    # end if
+
+    contigs_fpath: str = _get_input_fpaths(args[:1])[0]
+
+    # Check existance of partial files
+    arg: str
+    for arg in args[1:]:
+        if not os.path.exists(arg):
+            print('Error: file `{}` does not exist.'.format(arg))
+            platf_depend_exit(1)
+        # end if
+    # end for
+    partial_fpaths: Sequence[str] = tuple(map(os.path.abspath, args[1:]))
+
+    params: Dict[str, Any] = _parse_options(opts)
+
+    return contigs_fpath, partial_fpaths, params
+# end def parse_merge_args
+
+
 def _get_input_fpaths(args: Sequence[str]) -> Sequence[str]:
     # Function extracts paths to input files from `args` colection returned by `getopt.gnu_getopt`.
     # Returns collection of paths to input fasta files.
@@ -147,6 +234,15 @@ def _parse_options(opts: Sequence[Sequence[str]]) -> Mapping[str, Any]:
     #       'o': <outdir_path>,
     #       'i': <mink>,
     #       'a': <maxk>,
+    #       'e': <engine>,
+    #       't': <threads>,
+    #       'cache': <use cache>,
+    #       'cache_dir': <cache directory, or None for default one>,
+    #       'sweep': <(start, stop, step) of k sweep, or None>,
+    #       'shard': <(shard number, number of shards), or None>,
+    #       'bloom_fpr': <false-positive rate of Bloom filters>,
+    #       'bloom_mem': <memory budget for Bloom filters, MB>,
+    #       'max_ovl': <maximum number of overlaps per terminus, or None>,
     #    }
 
     # Set default values for parameters
@@ -154,6 +250,15 @@ def _parse_options(opts: Sequence[Sequence[str]]) -> Mapping[str, Any]:
         'o': os.path.join(os.getcwd(), 'combinator-result'), # outdir
         'i': 21,                                             # mink
         'a': 127,                                            # maxk
+        'e': DEFAULT_ENGINE,                                 # engine
+        't': 1,                                              # threads
+        'cache': True,                                       # use cache
+        'cache_dir': None,                                   # cache directory
+        'sweep': None,                                       # k sweep range
+        'shard': None,                                       # shard (I, N)
+        'bloom_fpr': DEFAULT_BLOOM_FPR,                      # Bloom filter FPR
+        'bloom_mem': DEFAULT_BLOOM_MEMORY,                   # Bloom filter memory, MB
+        'max_ovl': None,                                     # overlaps per terminus
     }
 
     # Parse command line options
@@ -205,6 +310,115 @@ def _parse_options(opts: Sequence[Sequence[str]]) -> Mapping[str, Any]:
                 print('Your value: `{}`'.format(arg))
                 platf_depend_exit(1)
             # end try
+
+        # Overlap detection engine
+        elif opt in ('-e', '--engine'):
+            if not arg in ENGINES.keys():
+                print('Error: invalid overlap detection engine: `{}`.'.format(arg))
+                print('Available engines: {}.'.format(', '.join(ENGINES.keys())))
+                platf_depend_exit(1)
+            # end if
+            params['e'] = arg
+
+        # Number of threads
+        elif opt in ('-t', '--threads'):
+            try:
+                params['t'] = int(arg)
+                if params['t'] <= 0:
+                    raise ValueError
+                # end if
+            except ValueError:
+                print('Error: number of threads must be positive integer number.')
+                print('Your value: `{}`'.format(arg))
+                platf_depend_exit(1)
+            # end try
+            if params['t'] > mp.cpu_count():
+                print('Warning: only {} CPUs are available.'.format(mp.cpu_count()))
+                print('Number of threads is set to {}.'.format(mp.cpu_count()))
+                params['t'] = mp.cpu_count()
+            # end if
+
+        # Disable cache
+        elif opt == '--no-cache':
+            params['cache'] = False
+
+        # Cache directory
+        elif opt == '--cache-dir':
+            params['cache_dir'] = os.path.abspath(arg)
+
+        # Sweep over k-mer lengths
+        elif opt == '--k-sweep':
+            try:
+                sweep_range: List[int] = list(map(int, arg.split(':')))
+                if len(sweep_range) == 2:
+                    sweep_range.append(1) # default step
+                # end if
+                if len(sweep_range) != 3 or min(sweep_range) <= 0 \
+                   or sweep_range[0] > sweep_range[1]:
+                    raise ValueError
+                # end if
+            except ValueError:
+                print('Error: invalid k sweep range: `{}`.'.format(arg))
+                print('It must be `START:STOP` or `START:STOP:STEP`,')
+                print('  where START <= STOP, and all values are positive integer numbers.')
+                platf_depend_exit(1)
+            # end try
+            params['sweep'] = tuple(sweep_range)
+
+        # Detect overlaps only for a shard of pairs of contigs
+        elif opt == '--shard':
+            try:
+                shard: List[int] = list(map(int, arg.split('/')))
+                if len(shard) != 2 or shard[0] <= 0 or shard[0] > shard[1]:
+                    raise ValueError
+                # end if
+            except ValueError:
+                print('Error: invalid shard: `{}`.'.format(arg))
+                print('It must be `I/N`, where 1 <= I <= N, and both values are integer numbers.')
+                platf_depend_exit(1)
+            # end try
+            params['shard'] = tuple(shard)
+
+        # False-positive rate of Bloom filters
+        elif opt == '--bloom-fpr':
+            try:
+                params['bloom_fpr'] = float(arg)
+                if not 0 < params['bloom_fpr'] < 1:
+                    raise ValueError
+                # end if
+            except ValueError:
+                print('Error: false-positive rate of Bloom filters must be a number'
+                      ' greater than 0 and less than 1.')
+                print('Your value: `{}`'.format(arg))
+                platf_depend_exit(1)
+            # end try
+
+        # Memory budget for Bloom filters
+        elif opt == '--bloom-mem':
+            try:
+                params['bloom_mem'] = int(arg)
+                if params['bloom_mem'] <= 0:
+                    raise ValueError
+                # end if
+            except ValueError:
+                print('Error: memory budget for Bloom filters must be positive integer number.')
+                print('Your value: `{}`'.format(arg))
+                platf_depend_exit(1)
+            # end try
+
+        # Maximum number of overlaps retained for each terminus
+        elif opt == '--max-overlaps-per-terminus':
+            try:
+                params['max_ovl'] = int(arg)
+                if params['max_ovl'] <= 0:
+                    raise ValueError
+                # end if
+            except ValueError:
+                print('Error: maximum number of overlaps per terminus'
+                      ' must be positive integer number.')
+                print('Your value: `{}`'.format(arg))
+                platf_depend_exit(1)
+            # end try
         # end if
     # end for
 
@@ -35,10 +35,52 @@ https://github.com/masikol/combinator-FQ""")
     If specified, `-i` and `-a` options are ignored.
     Value: integer > 0; Disabled by default.\n""")
     print("""  -o (--outdir): output directory.
-    Default value: `combinator-result`.""")
+    Default value: `combinator-result`.\n""")
+    print("""  -e (--engine): overlap detection engine.
+    Value: `pairwise` (compare termini of each pair of contigs),
+      `hash` (look termini up in hash indices: faster, but requires more memory),
+      `numpy` (compare termini of a contig to termini of all contigs at once; requires NumPy),
+      `sorted` (walk runs of lexicographically sorted termini: fast and memory-lean),
+      `minimizer` (compare only pairs of contigs sharing minimizers of termini)
+      or `bloom` (compare only pairs of contigs passing Bloom filters of boundary k-mers of termini).
+    All engines detect identical overlaps. Default is `pairwise`,
+    or `sorted` if maximum k is 1000 bp or more and option `-t` is not specified.\n""")
+    print("""  -t (--threads): number of threads (processes) for `pairwise` engine
+    and for decompression of BGZF-compressed input files.
+    Value: integer > 0; Default is 1.""")
+    print("""  --no-cache: do not use cache of parsed contigs and detected overlaps.""")
+    print("""  --cache-dir: directory of cache of parsed contigs and detected overlaps.
+    The cache does not depend on output directory.
+    Default value: `$XDG_CACHE_HOME/combinator-FQ` (`~/.cache/combinator-FQ` if XDG_CACHE_HOME is not set).""")
+    print("""  --k-sweep: sweep over k-mer lengths: detect overlaps of length k for each k
+    from START to STOP (inclusive) with step STEP, and write LQ-coefficient and
+    expected length of the genome for each k to a single table.
+    Other output files are not written, and options -i and -a are ignored.
+    Termini are joined in hash indices, thus option -e cannot be specified.
+    Value: START:STOP or START:STOP:STEP; Default step is 1.""")
+    print("""  --shard: detect overlaps only for the I-th of N shards of pairs of contigs
+    and write them to a partial file `<prefix>_combinator_shard_I_of_N.cfqpart`.
+    Shards can be run independently (e.g. on different machines) and then merged
+    with command `merge` (see examples). Pairs are compared one by one, thus option -e cannot be specified.
+    Value: I/N, where 1 <= I <= N.""")
+    print("""  --bloom-fpr: false-positive rate of Bloom filters of `bloom` engine.
+    Value: number > 0 and < 1; Default is 0.01.""")
+    print("""  --bloom-mem: memory budget for Bloom filters of `bloom` engine, MB.
+    If filters of the desired false-positive rate do not fit, they are truncated,
+    and more pairs of contigs are compared.
+    Value: integer > 0; Default is 256.""")
+    print("""  --max-overlaps-per-terminus: retain only M longest overlaps of each terminus
+    of a contig. Termini having more overlaps (e.g. collapsed repeats) are reported as hubs,
+    and the adjacency table shows the number of omitted overlaps as `[+N more]`.
+    Multiplicity and LQ-coefficient are calculated from numbers of all overlaps.
+    Overlaps are capped during detection, and capped overlaps are not cached.
+    Value: integer > 0; Option is disabled by default.""")
     print('='*15 + '\n' + 'Examples:\n')
     print('  ./combinator-FQ.py contigs.fasta -k 127\n')
-    print('  ./combinator-FQ.py another_contigs.fa -i 25 -a 300 -o my-outdir')
+    print('  ./combinator-FQ.py another_contigs.fa -i 25 -a 300 -o my-outdir\n')
+    print('  ./combinator-FQ.py contigs.fasta --shard 1/2 -o shards')
+    print('  ./combinator-FQ.py contigs.fasta --shard 2/2 -o shards')
+    print('  ./combinator-FQ.py merge contigs.fasta shards/*.cfqpart -o my-outdir')
     print('\n'+'='*15)
     print("""If input file is omitted in the command, combinator-FQ will
   process all fasta files in the working directory.\n""")
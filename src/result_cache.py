@@ -0,0 +1,303 @@
+# -*- encoding: utf-8 -*-
+
+# Persistent cache of detected overlaps.
+#
+# Overlaps detected in an input file are stored in cache directory
+#   (see `src.contig_cache.get_cache_dpath`) as comparison hits,
+#   in a file named after content digest of the input file and k-range:
+#   `<digest>_<mink>_<maxk>.overlaps`.
+# A cached result is reused for the same k-range, and results for a narrower
+#   k-range are obtained by filtering a result for a wider one (see `narrow_hits`).
+# Total size of cache directory is bounded: least recently used files are removed.
+
+import os
+import re
+from array import array
+from typing import List, Tuple, Sequence, BinaryIO
+
+from src.contigs import ContigCollection, ContigIndex
+from src.overlaps import OverlapCollection, ComparisonHit, SELF_E2S
+from src.overlaps import collect_overlaps, compare_contigs
+
+
+# Maximum total size of cache directory (in bytes)
+MAX_CACHE_SIZE: int = 1024 * 1024 * 1024
+
+# Extention of overlap cache files
+_OVERLAPS_EXT: str = '.overlaps'
+
+# Cache file format
+_MAGIC: bytes = b'CFQO'
+_VERSION: int = 1
+
+# Pattern of names of overlap cache files: digest, mink, maxk
+_OVERLAPS_FNAME_PATTERN: str = r'^([0-9a-f]+)_([0-9]+)_([0-9]+)' + re.escape(_OVERLAPS_EXT) + '$'
+
+
+# Custom types declaration
+# k-range: (mink, maxk)
+KRange = Tuple[int, int]
+
+
+def load_overlaps(cache_dpath: str, digest: bytes,
+                  contig_collection: ContigCollection,
+                  mink: int, maxk: int,
+                  max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function loads overlaps from cache.
+    # If there is no result for given k-range, the narrowest wider one is filtered.
+    # Returns None if there is no suitable cached result.
+    #
+    # :param cache_dpath: path to cache directory;
+    # :param digest: digest of the input file;
+    # :param contig_collection: contigs parsed from the input file with given 'maxk';
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    # Select wider k-ranges
+    k_ranges: List[KRange] = sorted(
+        filter(
+            lambda k_range: k_range[0] <= mink and k_range[1] >= maxk,
+            _list_cached_k_ranges(cache_dpath, digest)
+        ),
+        key=lambda k_range: k_range[1] - k_range[0]
+    )
+
+    k_range: KRange
+    for k_range in k_ranges:
+        cache_fpath: str = _get_overlaps_cache_fpath(cache_dpath, digest, *k_range)
+        try:
+            hits: List[ComparisonHit] = _read_hits(cache_fpath, len(contig_collection))
+        except (OSError, ValueError):
+            # Cache file is removed or corrupted
+            continue
+        # end try
+
+        _touch(cache_fpath)
+        print('Overlaps are loaded from cache `{}`'.format(cache_fpath))
+
+        if k_range != (mink, maxk):
+            hits = narrow_hits(contig_collection, hits, k_range, mink, maxk)
+        # end if
+
+        return collect_overlaps(hits, max_overlaps_per_terminus)
+    # end for
+
+    return None
+# end def load_overlaps
+
+
+def save_overlaps(cache_dpath: str, digest: bytes,
+                  num_contigs: int, mink: int, maxk: int,
+                  overlap_collection: OverlapCollection) -> None:
+    # Function stores overlaps in cache and then removes least recently used
+    #   cache files, if size of cache directory exceeds `MAX_CACHE_SIZE`.
+    # Failure to write cache is not fatal.
+    #
+    # :param cache_dpath: path to cache directory;
+    # :param digest: digest of the input file;
+    # :param num_contigs: number of contigs in the input file;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param overlap_collection: overlaps to store;
+
+    cache_fpath: str = _get_overlaps_cache_fpath(cache_dpath, digest, mink, maxk)
+
+    columns: array = array('i', [num_contigs])
+    hit: ComparisonHit
+    for hit in overlap_collection.get_comparison_hits():
+        columns.extend(hit)
+    # end for
+
+    tmp_fpath: str = '{}.{}.tmp'.format(cache_fpath, os.getpid())
+    try:
+        os.makedirs(cache_dpath, exist_ok=True)
+        cachefile: BinaryIO
+        with open(tmp_fpath, 'wb') as cachefile:
+            cachefile.write(_MAGIC + bytes([_VERSION, columns.itemsize]))
+            columns.tofile(cachefile)
+        # end with
+        os.replace(tmp_fpath, cache_fpath)
+    except OSError as err:
+        print('Warning: cannot write cache file `{}`.'.format(cache_fpath))
+        print(str(err))
+        if os.path.exists(tmp_fpath):
+            os.remove(tmp_fpath)
+        # end if
+        return
+    # end try
+
+    evict_cache_files(cache_dpath, MAX_CACHE_SIZE)
+# end def save_overlaps
+
+
+def narrow_hits(contig_collection: ContigCollection, hits: Sequence[ComparisonHit],
+                cached_k_range: KRange, mink: int, maxk: int) -> List[ComparisonHit]:
+    # Function converts comparison hits obtained for a wider k-range
+    #   to hits for a narrower k-range [mink, maxk].
+    # A cached overlap is the longest one within the wider k-range, thus:
+    #   - overlaps shorter than 'mink' are discarded;
+    #   - overlaps not longer than 'maxk' are kept as is;
+    #   - for overlaps longer than 'maxk' termini are compared again:
+    #     the longest overlap within the narrower k-range is unknown.
+    # Comparisons, which do not result in an overlap within the wider k-range,
+    #   do not result in it within the narrower one, except for comparison of end
+    #   of a contig to it's own start: entire contigs shorter than the cached 'maxk'
+    #   are not reported, so such contigs longer than 'maxk' are compared again.
+    #
+    # :param contig_collection: contigs parsed from the input file with given 'maxk';
+    # :param hits: hits obtained for the wider k-range;
+    # :param cached_k_range: the wider k-range;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+
+    narrowed_hits: List[ComparisonHit] = list()
+
+    i: ContigIndex
+    j: ContigIndex
+    for i, j, comparison, ovl_len in hits:
+
+        # Contigs shorter than 'mink' are not compared to contigs that follow them
+        if contig_collection[i].length <= mink or ovl_len < mink:
+            continue
+        # end if
+
+        # These comparisons are performed again below
+        if comparison == SELF_E2S and _is_self_e2s_lost(contig_collection[i].length,
+                                                        cached_k_range, maxk):
+            continue
+        # end if
+
+        if ovl_len > maxk:
+            ovl_len = compare_contigs(contig_collection, i, j, comparison, mink, maxk)
+            if ovl_len == 0 or (comparison == SELF_E2S and ovl_len == contig_collection[i].length):
+                continue
+            # end if
+        # end if
+
+        narrowed_hits.append((i, j, comparison, ovl_len))
+    # end for
+
+    # Compare ends of contigs of length in (maxk, cached maxk] to their own starts
+    for i in range(len(contig_collection)):
+        length: int = contig_collection[i].length
+        if length > mink and _is_self_e2s_lost(length, cached_k_range, maxk):
+            ovl_len = compare_contigs(contig_collection, i, i, SELF_E2S, mink, maxk)
+            if not ovl_len in (0, length):
+                narrowed_hits.append((i, i, SELF_E2S, ovl_len))
+            # end if
+        # end if
+    # end for
+
+    narrowed_hits.sort()
+
+    return narrowed_hits
+# end def narrow_hits
+
+
+def _is_self_e2s_lost(length: int, cached_k_range: KRange, maxk: int) -> bool:
+    # Function checks if comparison of end of a contig to it's own start
+    #   within the narrower k-range cannot be derived from the wider one.
+    return maxk < length <= cached_k_range[1]
+# end def _is_self_e2s_lost
+
+
+def evict_cache_files(cache_dpath: str, max_size: int) -> None:
+    # Function removes least recently used files from cache directory
+    #   until total size of the directory is not greater than `max_size`.
+    # Files are ordered by time of last modification: cache files are
+    #   touched when they are read.
+    #
+    # :param cache_dpath: path to cache directory;
+    # :param max_size: maximum total size of cache directory (in bytes);
+
+    cache_files: List[Tuple[int, int, str]] = list() # (mtime, size, path)
+
+    entry: os.DirEntry
+    for entry in os.scandir(cache_dpath):
+        if entry.is_file():
+            stat: os.stat_result = entry.stat()
+            cache_files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        # end if
+    # end for
+
+    total_size: int = sum(map(lambda x: x[1], cache_files))
+
+    cache_files.sort()
+    size: int
+    fpath: str
+    for _, size, fpath in cache_files:
+        if total_size <= max_size:
+            break
+        # end if
+        try:
+            os.remove(fpath)
+        except OSError:
+            continue
+        # end try
+        total_size -= size
+    # end for
+# end def evict_cache_files
+
+
+def _list_cached_k_ranges(cache_dpath: str, digest: bytes) -> List[KRange]:
+    # Function returns k-ranges of cached results for an input file.
+
+    if not os.path.isdir(cache_dpath):
+        return list()
+    # end if
+
+    k_ranges: List[KRange] = list()
+
+    fname: str
+    for fname in os.listdir(cache_dpath):
+        match = re.match(_OVERLAPS_FNAME_PATTERN, fname)
+        if not match is None and match.group(1) == digest.hex():
+            k_ranges.append((int(match.group(2)), int(match.group(3))))
+        # end if
+    # end for
+
+    return k_ranges
+# end def _list_cached_k_ranges
+
+
+def _get_overlaps_cache_fpath(cache_dpath: str, digest: bytes, mink: int, maxk: int) -> str:
+    # Function returns path to cache file for an input file and a k-range.
+    return os.path.join(cache_dpath,
+                        '{}_{}_{}{}'.format(digest.hex(), mink, maxk, _OVERLAPS_EXT))
+# end def _get_overlaps_cache_fpath
+
+
+def _read_hits(cache_fpath: str, num_contigs: int) -> List[ComparisonHit]:
+    # Function reads comparison hits from cache file.
+    # Raises ValueError if the file is invalid or is made for another number of contigs.
+
+    cachefile: BinaryIO
+    with open(cache_fpath, 'rb') as cachefile:
+        data: bytes = cachefile.read()
+    # end with
+
+    columns: array = array('i')
+    if data[:len(_MAGIC)] != _MAGIC \
+       or data[len(_MAGIC) : len(_MAGIC)+2] != bytes([_VERSION, columns.itemsize]):
+        raise ValueError('invalid cache file')
+    # end if
+
+    columns.frombytes(data[len(_MAGIC)+2:])
+    if len(columns) % 4 != 1 or columns[0] != num_contigs:
+        raise ValueError('invalid cache file')
+    # end if
+
+    return list(zip(columns[1::4], columns[2::4], columns[3::4], columns[4::4]))
+# end def _read_hits
+
+
+def _touch(fpath: str) -> None:
+    # Function marks a cache file as recently used.
+    try:
+        os.utime(fpath)
+    except OSError:
+        pass
+    # end try
+# end def _touch
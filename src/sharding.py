@@ -0,0 +1,216 @@
+# -*- encoding: utf-8 -*-
+
+# Sharding of overlap detection.
+#
+# Triangular space of contig pairs (i, j >= i) is split into N blocks of rows
+#   (see `src.parallel.split_pair_space`), and shard I (1 <= I <= N) compares
+#   termini of pairs from the I-th block only. The split depends only on number
+#   of contigs, thus shards can be run independently (e.g. on different machines).
+# Comparison hits of a shard are written to a compact binary partial file.
+# Partial files of all N shards are merged into a result identical to the one
+#   of a run without sharding: blocks of rows are concatenated in their order.
+
+import os
+import struct
+from array import array
+from typing import List, Tuple, Sequence, BinaryIO
+
+from src.contigs import ContigCollection, ContigIndex
+from src.overlaps import ComparisonHit, compare_contig_row
+from src.parallel import RowBlock, split_pair_space
+from src.platform import platf_depend_exit
+
+
+# Extention of partial files
+PARTIAL_EXT: str = '.cfqpart'
+
+# Partial file format
+_MAGIC: bytes = b'CFQP'
+_VERSION: int = 1
+# magic, version, item size of hits array, digest of input file, number of contigs,
+#   mink, maxk, shard number, number of shards
+_HEADER_FORMAT: struct.Struct = struct.Struct('<4sBB16sIIIII')
+
+
+# Custom types declaration
+# Shard: (shard number I, number of shards N)
+ShardSpec = Tuple[int, int]
+# Header of a partial file: (digest of input file, number of contigs, mink, maxk,
+#   shard number, number of shards)
+PartialHeader = Tuple[bytes, int, int, int, int, int]
+# Partial result: (header, comparison hits)
+Partial = Tuple[PartialHeader, List[ComparisonHit]]
+
+
+def get_shard_rows(num_contigs: int, shard: ShardSpec) -> RowBlock:
+    # Function returns block of rows of the comparison "matrix" for a shard.
+    # There may be less blocks than shards, if there are few contigs:
+    #   such redundant shards are empty.
+    #
+    # :param num_contigs: number of contigs;
+    # :param shard: shard (I, N);
+
+    shard_num, num_shards = shard
+    row_blocks: List[RowBlock] = split_pair_space(num_contigs, num_shards)
+
+    if shard_num > len(row_blocks):
+        return num_contigs, num_contigs
+    # end if
+    return row_blocks[shard_num - 1]
+# end def get_shard_rows
+
+
+def detect_shard_hits(contig_collection: ContigCollection,
+                      mink: int, maxk: int, shard: ShardSpec) -> List[ComparisonHit]:
+    # Function compares termini of contigs from rows of a shard
+    #   to termini of contigs that follow them.
+    # Returns comparison hits in the same order as in a serial run.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param shard: shard (I, N);
+
+    row_start, row_stop = get_shard_rows(len(contig_collection), shard)
+
+    shard_hits: List[ComparisonHit] = list()
+
+    i: ContigIndex
+    for i in range(row_start, row_stop):
+        shard_hits.extend(compare_contig_row(contig_collection, i, mink, maxk))
+        print('\r{}/{}'.format(i+1, row_stop), end='')
+    # end for
+    print()
+
+    return shard_hits
+# end def detect_shard_hits
+
+
+def get_partial_fpath(outdpath: str, out_prefix: str, shard: ShardSpec) -> str:
+    # Function returns path to partial file of a shard.
+    #
+    # :param outdpath: path to output directory;
+    # :param out_prefix: prefix for current output files;
+    # :param shard: shard (I, N);
+    return os.path.join(
+        outdpath,
+        '{}_combinator_shard_{}_of_{}{}'.format(out_prefix, *shard, PARTIAL_EXT)
+    )
+# end def get_partial_fpath
+
+
+def write_partial(partial_fpath: str, header: PartialHeader,
+                  hits: Sequence[ComparisonHit]) -> None:
+    # Function writes comparison hits of a shard to partial file.
+    #
+    # :param partial_fpath: path to partial file;
+    # :param header: header of the partial file;
+    # :param hits: comparison hits of the shard;
+
+    columns: array = array('i')
+    hit: ComparisonHit
+    for hit in hits:
+        columns.extend(hit)
+    # end for
+
+    print('Writing partial result to `{}`'.format(partial_fpath))
+
+    outfile: BinaryIO
+    with open(partial_fpath, 'wb') as outfile:
+        outfile.write(_HEADER_FORMAT.pack(_MAGIC, _VERSION, columns.itemsize, *header))
+        columns.tofile(outfile)
+    # end with
+# end def write_partial
+
+
+def read_partial(partial_fpath: str) -> Partial:
+    # Function reads partial file.
+    # Raises ValueError if the file is not a valid partial file.
+    #
+    # :param partial_fpath: path to partial file;
+
+    infile: BinaryIO
+    with open(partial_fpath, 'rb') as infile:
+        data: bytes = infile.read()
+    # end with
+
+    if len(data) < _HEADER_FORMAT.size:
+        raise ValueError('file is too short')
+    # end if
+
+    magic, version, itemsize, *header = _HEADER_FORMAT.unpack_from(data)
+    columns: array = array('i')
+    if magic != _MAGIC or version != _VERSION or itemsize != columns.itemsize:
+        raise ValueError('invalid format')
+    # end if
+
+    columns.frombytes(data[_HEADER_FORMAT.size:])
+    if len(columns) % 4 != 0:
+        raise ValueError('file is truncated')
+    # end if
+
+    hits: List[ComparisonHit] = list(zip(columns[0::4], columns[1::4],
+                                         columns[2::4], columns[3::4]))
+    return tuple(header), hits
+# end def read_partial
+
+
+def read_partials(partial_fpaths: Sequence[str]) -> List[Partial]:
+    # Function reads partial files of all shards and checks that they are
+    #   consistent: shards are made for the same input file and k-range,
+    #   and each of N shards is present exactly once.
+    # Returns partial results sorted by shard number.
+    # Function exits, if partial files are invalid or inconsistent.
+    #
+    # :param partial_fpaths: paths to partial files;
+
+    partials: List[Partial] = list()
+
+    partial_fpath: str
+    for partial_fpath in partial_fpaths:
+        try:
+            partials.append(read_partial(partial_fpath))
+        except (OSError, ValueError) as err:
+            print('Error: cannot read partial file `{}`.'.format(partial_fpath))
+            print(str(err))
+            platf_depend_exit(1)
+        # end try
+    # end for
+
+    partials.sort(key=lambda partial: partial[0][4])
+
+    # Everything but shard number must be the same
+    if len(set(map(lambda partial: partial[0][:4] + partial[0][5:], partials))) != 1:
+        print('Error: partial files are made for different input files or parameters.')
+        platf_depend_exit(1)
+    # end if
+
+    num_shards: int = partials[0][0][5]
+    shard_nums: List[int] = list(map(lambda partial: partial[0][4], partials))
+    if shard_nums != list(range(1, num_shards + 1)):
+        print('Error: partial files of all {} shards are required, each exactly once.'\
+            .format(num_shards))
+        print('Shards found: {}.'.format(', '.join(map(str, shard_nums))))
+        platf_depend_exit(1)
+    # end if
+
+    return partials
+# end def read_partials
+
+
+def merge_partial_hits(partials: Sequence[Partial]) -> List[ComparisonHit]:
+    # Function concatenates comparison hits of shards.
+    # Returns hits in the same order as in a serial run.
+    #
+    # :param partials: partial results returned by `read_partials`;
+
+    hits: List[ComparisonHit] = list()
+
+    partial_hits: List[ComparisonHit]
+    for _, partial_hits in partials:
+        hits.extend(partial_hits)
+    # end for
+
+    return hits
+# end def merge_partial_hits
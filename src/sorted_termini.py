@@ -0,0 +1,261 @@
+# -*- encoding: utf-8 -*-
+
+# Sorted-terminus index.
+#
+# Termini, which are matched by their prefixes, are sorted lexicographically:
+#   starts of contigs and reverse complements of their ends. Longest common
+#   prefixes (LCP) of neighbouring termini are stored along with them.
+# Reverse complement of a matching pair of ends (or of an end and an rc-start)
+#   is a matching pair of rc-ends (or of an rc-end and a start), thus
+#   these prefixes are enough to find all start-to-start-like overlaps:
+#   LCP of two termini is the minimum of LCPs of neighbours between them, so
+#   termini sharing at least 'mink' bases form runs of adjacent ones.
+# Suffix-prefix overlaps (end-to-start-like ones) of length k are found by
+#   binary search of k-suffixes of ends and rc-starts in the sorted termini:
+#   the run of termini starting with a k-suffix is delimited by LCPs.
+# Index takes O(N * maxk) memory for N contigs, and it is built
+#   in O(N log N * maxk) time: no hash is calculated for each k.
+# Search time depends on the number of seed hits, i.e. positions of ends and rc-starts,
+#   where a 'mink'-window equals a 'mink'-prefix of an indexed terminus: each seed hit
+#   slices the suffix (O(maxk)) and bisects the index (O(maxk * log N) comparisons).
+#   Seed hits are rare in ordinary termini, so the search takes O(N * maxk * mink) time
+#   to probe windows. In low-complexity termini, each position is a seed hit,
+#   and the search takes O(N * maxk^2 * log N) time in the worst case.
+
+from bisect import bisect_left
+from typing import Dict, List, Tuple, Set
+
+from src.contigs import Contig, ContigCollection, ContigIndex
+from src.overlaps import OverlapCollection, Comparison, collect_overlaps
+from src.overlaps import Terminus, START, RCSTART, END, RCEND
+from src.overlaps import SELF_E2S, SELF_S2RCE, S2E, E2S, S2RCS, E2RCE, S2S, E2E, S2RCE, E2RCS
+from src.oriented_termini import ComparisonKey, make_comparison_hits
+
+
+# Dictionary maps termini (terminus_x, terminus_y) of contigs x and y, which share a prefix,
+#   to `Comparison`s of these contigs: (comparison if x < y, comparison if x == y).
+# Shared prefix of rc-ends is shared suffix of ends, and so forth.
+_PREFIX_JOIN_RULES: Dict[Tuple[Terminus, Terminus], Tuple[Comparison, Comparison]] = {
+    (START, START): (S2S,   None),
+    (START, RCEND): (S2RCE, SELF_S2RCE),
+    (RCEND, START): (E2RCS, SELF_S2RCE),
+    (RCEND, RCEND): (E2E,   None),
+}
+
+# Dictionary maps termini (terminus_x, terminus_y) of contigs x and y, such that
+#   suffix of terminus_x is a prefix of terminus_y, to `Comparison`s of these contigs:
+#   (comparison if x < y, comparison if x > y, comparison if x == y).
+# Rc-start-to-rc-end overlap of contigs x and y is end-to-start one of contigs y and x,
+#   thus it is not included. Start-to-rc-start and end-to-rc-end matches
+#   of a contig are not considered.
+_SUFFIX_PREFIX_JOIN_RULES: Dict[Tuple[Terminus, Terminus],
+                                Tuple[Comparison, Comparison, Comparison]] = {
+    (END, START):     (E2S,   S2E,   SELF_E2S),
+    (END, RCEND):     (E2RCE, E2RCE, None),
+    (RCSTART, START): (S2RCS, S2RCS, None),
+}
+
+
+class SortedTerminusIndex:
+    # Class represents termini of contigs, which are matched by their prefixes
+    #   (starts and rc-ends), sorted lexicographically.
+
+    def __init__(self, contig_collection: ContigCollection, mink: int):
+        # :param contig_collection: instance of ContigCollection;
+        # :param mink: minimum length of and overlap to be detected:
+        #   termini shorter than 'mink' are not indexed;
+
+        termini: List[Tuple[str, ContigIndex, Terminus]] = list()
+
+        x: ContigIndex
+        contig: Contig
+        for x, contig in enumerate(contig_collection):
+            if len(contig.start) >= mink:
+                termini.append((contig.start, x, START))
+                termini.append((contig.rcend, x, RCEND))
+            # end if
+        # end for
+        termini.sort()
+
+        self.seqs: List[str] = [terminus[0] for terminus in termini]
+        self.contigs: List[ContigIndex] = [terminus[1] for terminus in termini]
+        self.termini: List[Terminus] = [terminus[2] for terminus in termini]
+
+        # LCP of the a-th terminus and the (a+1)-th one
+        self.lcps: List[int] = [
+            _calc_lcp(self.seqs[a], self.seqs[a+1]) for a in range(len(self.seqs) - 1)
+        ]
+        self.lcps.append(0)
+
+        # Overlaps start with 'mink'-prefixes of indexed termini
+        self.seeds: Set[str] = set(seq[:mink] for seq in self.seqs)
+    # end def __init__
+
+    def __len__(self) -> int:
+        return len(self.seqs)
+    # end def __len__
+# end class SortedTerminusIndex
+
+
+def detect_adjacent_contigs_sorted(contig_collection: ContigCollection,
+                                   mink: int, maxk: int,
+                                   max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function detects adjacent contigs by walking runs of neighbouring termini
+    #   in sorted terminus index (see `SortedTerminusIndex`).
+    # Result is identical to one returned by `src.overlaps.detect_adjacent_contigs`.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    terminus_index: SortedTerminusIndex = SortedTerminusIndex(contig_collection, mink)
+
+    best_ovl_lens: Dict[ComparisonKey, int] = dict()
+    _join_prefixes(terminus_index, mink, best_ovl_lens)
+    _join_suffixes_to_prefixes(contig_collection, terminus_index, mink, best_ovl_lens)
+
+    return collect_overlaps(
+        make_comparison_hits(contig_collection, best_ovl_lens, mink, maxk),
+        max_overlaps_per_terminus
+    )
+# end def detect_adjacent_contigs_sorted
+
+
+def _join_prefixes(terminus_index: SortedTerminusIndex, mink: int,
+                   best_ovl_lens: Dict[ComparisonKey, int]) -> None:
+    # Function joins termini sharing prefixes of length at least 'mink'.
+    # Lengths of the longest shared prefixes are stored in `best_ovl_lens`.
+
+    a: int
+    for a in range(len(terminus_index)):
+        # LCP of the a-th terminus and the b-th one
+        ovl_len: int = terminus_index.lcps[a]
+        b: int = a + 1
+        while ovl_len >= mink:
+            x: ContigIndex = terminus_index.contigs[a]
+            y: ContigIndex = terminus_index.contigs[b]
+            terminus_x: Terminus = terminus_index.termini[a]
+            terminus_y: Terminus = terminus_index.termini[b]
+            if x > y:
+                x, y, terminus_x, terminus_y = y, x, terminus_y, terminus_x
+            # end if
+
+            comparison: Comparison = _PREFIX_JOIN_RULES[(terminus_x, terminus_y)][x == y]
+            if not comparison is None:
+                _store_ovl_len(best_ovl_lens, (x, y, comparison), ovl_len)
+            # end if
+
+            ovl_len = min(ovl_len, terminus_index.lcps[b])
+            b += 1
+        # end while
+    # end for
+# end def _join_prefixes
+
+
+def _join_suffixes_to_prefixes(contig_collection: ContigCollection,
+                               terminus_index: SortedTerminusIndex, mink: int,
+                               best_ovl_lens: Dict[ComparisonKey, int]) -> None:
+    # Function joins suffixes of ends and rc-starts of contigs to indexed termini
+    #   starting with these suffixes.
+    # Lengths of the longest overlaps are stored in `best_ovl_lens`.
+
+    num_contigs: int = len(contig_collection)
+
+    x: ContigIndex
+    contig: Contig
+    for x, contig in enumerate(contig_collection):
+        if len(contig.end) < mink:
+            continue
+        # end if
+
+        terminus_x: Terminus
+        seq: str
+        for terminus_x, seq in ((END, contig.end), (RCSTART, contig.rcstart)):
+            seq_len: int = len(seq)
+
+            # Suffixes are considered from the longest to the shortest one
+            pos: int
+            for pos in range(seq_len - mink + 1):
+                if not seq[pos : pos+mink] in terminus_index.seeds:
+                    continue
+                # end if
+
+                suffix: str = seq[pos:]
+                ovl_len: int = seq_len - pos
+
+                b: int = bisect_left(terminus_index.seqs, suffix)
+                if b == len(terminus_index) or not terminus_index.seqs[b].startswith(suffix):
+                    continue
+                # end if
+
+                # Walk the run of termini starting with the suffix
+                while True:
+                    _join_suffix_to_prefix(best_ovl_lens, x, terminus_x,
+                                           terminus_index.contigs[b],
+                                           terminus_index.termini[b], ovl_len)
+                    if terminus_index.lcps[b] < ovl_len:
+                        break
+                    # end if
+                    b += 1
+                # end while
+            # end for
+        # end for
+
+        print('\r{}/{}'.format(x+1, num_contigs), end='')
+    # end for
+    print()
+# end def _join_suffixes_to_prefixes
+
+
+def _join_suffix_to_prefix(best_ovl_lens: Dict[ComparisonKey, int],
+                           x: ContigIndex, terminus_x: Terminus,
+                           y: ContigIndex, terminus_y: Terminus, ovl_len: int) -> None:
+    # Function stores length of an overlap of suffix of `terminus_x` of the x-th contig
+    #   and prefix of `terminus_y` of the y-th contig.
+
+    rules: Tuple[Comparison, Comparison, Comparison] = \
+        _SUFFIX_PREFIX_JOIN_RULES.get((terminus_x, terminus_y))
+    if rules is None:
+        return
+    # end if
+
+    if x < y:
+        _store_ovl_len(best_ovl_lens, (x, y, rules[0]), ovl_len)
+    elif x > y:
+        _store_ovl_len(best_ovl_lens, (y, x, rules[1]), ovl_len)
+    elif not rules[2] is None:
+        _store_ovl_len(best_ovl_lens, (x, x, rules[2]), ovl_len)
+    # end if
+# end def _join_suffix_to_prefix
+
+
+def _store_ovl_len(best_ovl_lens: Dict[ComparisonKey, int],
+                   key: ComparisonKey, ovl_len: int) -> None:
+    # Function stores length of an overlap, if it is the longest one for the key.
+    if best_ovl_lens.get(key, 0) < ovl_len:
+        best_ovl_lens[key] = ovl_len
+    # end if
+# end def _store_ovl_len
+
+
+def _calc_lcp(seq1: str, seq2: str) -> int:
+    # Function calculates length of the longest common prefix of two sequences.
+    # Prefixes are compared by binary search: slices are compared in C.
+
+    lower: int = 0
+    upper: int = min(len(seq1), len(seq2))
+
+    while lower < upper:
+        middle: int = (lower + upper + 1) // 2
+        if seq1[:middle] == seq2[:middle]:
+            lower = middle
+        else:
+            upper = middle - 1
+        # end if
+    # end while
+
+    return lower
+# end def _calc_lcp
@@ -0,0 +1,90 @@
+# -*- encoding: utf-8 -*-
+
+from typing import Dict, List, Iterator
+
+from src.contigs import ContigCollection
+from src.overlaps import OverlapCollection, collect_overlaps
+from src.oriented_termini import OrientedTerminus, ComparisonKey
+from src.oriented_termini import iterate_k_termini, join_termini, make_comparison_hits
+
+
+# Custom types declaration
+# Index maps canonical k-mers to oriented termini of contigs having these k-mers.
+TerminusIndex = Dict[str, List[OrientedTerminus]]
+
+
+def detect_adjacent_contigs_hashed(contig_collection: ContigCollection,
+                                   mink: int, maxk: int,
+                                   max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function detects adjacent contigs by looking their termini up in hash indices.
+    # Result is identical to one returned by `src.overlaps.detect_adjacent_contigs`,
+    #   but contigs are not compared pairwise: for each k in [mink, maxk],
+    #   termini of length k are indexed by their canonical k-mers, and termini
+    #   sharing a k-mer are joined (see `src.oriented_termini`).
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    # Termini are joined with k increasing,
+    #   therefore the last length stored for a key is the maximum one.
+    best_ovl_lens: Dict[ComparisonKey, int] = dict()
+
+    k: int
+    for k in range(mink, maxk + 1):
+        key: ComparisonKey
+        for key in join_k_termini(contig_collection, k):
+            best_ovl_lens[key] = k
+        # end for
+
+        print('\rk={}/{}'.format(k, maxk), end='')
+    # end for
+    print()
+
+    return collect_overlaps(
+        make_comparison_hits(contig_collection, best_ovl_lens, mink, maxk),
+        max_overlaps_per_terminus
+    )
+# end def detect_adjacent_contigs_hashed
+
+
+def join_k_termini(contig_collection: ContigCollection, k: int) -> Iterator[ComparisonKey]:
+    # Generator yields keys of comparisons, which termini of length k match in.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param k: length of termini;
+
+    terminus_index: TerminusIndex = build_terminus_index(contig_collection, k)
+
+    termini: List[OrientedTerminus]
+    for termini in terminus_index.values():
+        if len(termini) > 1:
+            yield from join_termini(termini)
+        # end if
+    # end for
+# end def join_k_termini
+
+
+def build_terminus_index(contig_collection: ContigCollection, k: int) -> TerminusIndex:
+    # Function indexes termini of length k of all contigs by their canonical k-mers.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param k: length of termini;
+
+    terminus_index: TerminusIndex = dict()
+
+    k_mer: str
+    terminus: OrientedTerminus
+    for k_mer, terminus in iterate_k_termini(contig_collection, k):
+        try:
+            terminus_index[k_mer].append(terminus)
+        except KeyError:
+            terminus_index[k_mer] = [terminus]
+        # end try
+    # end for
+
+    return terminus_index
+# end def build_terminus_index
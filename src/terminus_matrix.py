@@ -0,0 +1,150 @@
+# -*- encoding: utf-8 -*-
+
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+# end try
+
+from src.contigs import ContigCollection, ContigIndex
+from src.overlaps import OverlapCollection, Comparison, ComparisonHit
+from src.overlaps import detect_adjacent_contigs, compare_contig_partners, add_comparison_overlaps
+from src.overlaps import S2S, E2E, S2RCE, E2RCS
+
+
+# Value, with which termini shorter than 'maxk' are padded in terminus matrices.
+# It differs from any base, thus padding of one terminus never matches a base of another one.
+_PADDING: bytes = b'\x00'
+
+
+def detect_adjacent_contigs_numpy(contig_collection: ContigCollection,
+                                  mink: int, maxk: int,
+                                  max_overlaps_per_terminus: int = None) -> OverlapCollection:
+    # Function detects adjacent contigs by comparing their termini.
+    # Start-to-start and end-to-end comparisons are vectorized with NumPy:
+    #   termini of all contigs are stored in N x maxk matrices of bytes, and
+    #   a terminus of a contig is compared to termini of all following contigs at once.
+    # Result is identical to one returned by `src.overlaps.detect_adjacent_contigs`.
+    # If NumPy is not installed, the function falls back to the latter.
+    #
+    # :param contig_collection: instance of ContigCollection returned by
+    #   `src.contigs.get_contig_collection` function;
+    # :param mink: minimum length of and overlap to be detected;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param max_overlaps_per_terminus: maximum number of overlaps retained
+    #   for each terminus of a contig; None means no limit;
+
+    if np is None:
+        print('Warning: NumPy is not installed.')
+        print('Termini will be compared without vectorization.')
+        return detect_adjacent_contigs(contig_collection, mink, maxk,
+                                       max_overlaps_per_terminus)
+    # end if
+
+    num_contigs: int = len(contig_collection)
+
+    # Build terminus matrices.
+    # Ends are reversed in order to compare them like starts, from the 0-th column.
+    start_matrix:        np.ndarray = _make_terminus_matrix(contig_collection, 'start', maxk, False)
+    rcend_matrix:        np.ndarray = _make_terminus_matrix(contig_collection, 'rcend', maxk, False)
+    end_rev_matrix:      np.ndarray = _make_terminus_matrix(contig_collection, 'end', maxk, True)
+    rcstart_rev_matrix:  np.ndarray = _make_terminus_matrix(contig_collection, 'rcstart', maxk, True)
+
+    overlap_collection: OverlapCollection = OverlapCollection(max_overlaps_per_terminus)
+
+    i: ContigIndex
+    for i in range(num_contigs):
+
+        # Omit contigs shorter that 'mink'
+        if contig_collection[i].length > mink:
+
+            # Comparisons of the i-th contig to itself and end-to-start-like comparisons
+            #   to contigs from i+1 to N are not vectorized
+            hits: List[ComparisonHit] = compare_contig_partners(
+                contig_collection, i, range(i+1, num_contigs), mink, maxk, True
+            )
+
+            # Vectorized comparisons of i-th termini to termini of contigs from i+1 to N
+            comparison: Comparison
+            row: np.ndarray
+            block: np.ndarray
+            for comparison, row, block in (
+                (S2S,   start_matrix[i],   start_matrix[i+1:]),
+                (E2E,   end_rev_matrix[i], end_rev_matrix[i+1:]),
+                (S2RCE, start_matrix[i],   rcend_matrix[i+1:]),
+                (E2RCS, end_rev_matrix[i], rcstart_rev_matrix[i+1:]),
+            ):
+                partners: np.ndarray
+                ovl_lens: np.ndarray
+                partners, ovl_lens = calc_common_prefix_lens(row, block, mink)
+
+                j: ContigIndex
+                ovl_len: int
+                for j, ovl_len in zip(partners.tolist(), ovl_lens.tolist()):
+                    hits.append((i, i + 1 + j, comparison, ovl_len))
+                # end for
+            # end for
+
+            # Sort hits in order to store overlaps in the same order as pairwise comparison does
+            hits.sort()
+
+            hit: ComparisonHit
+            for hit in hits:
+                add_comparison_overlaps(overlap_collection, *hit)
+            # end for
+        # end if
+
+        print('\r{}/{}'.format(i+1, num_contigs), end='')
+    # end for
+    print()
+
+    return overlap_collection
+# end def detect_adjacent_contigs_numpy
+
+
+def calc_common_prefix_lens(row: 'np.ndarray', block: 'np.ndarray',
+                            mink: int) -> Tuple['np.ndarray', 'np.ndarray']:
+    # Function calculates lengths of longest common prefixes of `row` and each row of `block`.
+    # Returns two arrays: indices of rows of `block`, which share at least 'mink' first
+    #   columns with `row`, and lengths of common prefixes of these rows.
+    #
+    # :param row: terminus of one contig (1-D array of length maxk);
+    # :param block: termini of other contigs (2-D array of shape (n, maxk));
+    # :param mink: minimum length of and overlap to be detected;
+
+    # Select rows, which match `row` in the first 'mink' columns
+    partners: np.ndarray = np.flatnonzero(
+        (block[:, :mink] == row[:mink]).all(axis=1)
+    )
+
+    # Length of common prefix is sum of cumulative product of column-wise identity
+    identity: np.ndarray = block[partners] == row
+    ovl_lens: np.ndarray = np.logical_and.accumulate(identity, axis=1).sum(axis=1)
+
+    return partners, ovl_lens
+# end def calc_common_prefix_lens
+
+
+def _make_terminus_matrix(contig_collection: ContigCollection, terminus: str,
+                          maxk: int, reverse: bool) -> 'np.ndarray':
+    # Function stores termini of all contigs in a contiguous N x maxk matrix of bytes.
+    # Termini shorter than 'maxk' are padded with `_PADDING`.
+    #
+    # :param contig_collection: instance of ContigCollection;
+    # :param terminus: name of `Contig` attribute to store: 'start', 'rcend', etc.;
+    # :param maxk: maximum length of and overlap to be detected;
+    # :param reverse: reverse termini, if True;
+
+    step: int = -1 if reverse else 1
+
+    rows: bytes = b''.join(
+        map(
+            lambda contig: getattr(contig, terminus)[::step].encode('ascii').ljust(maxk, _PADDING),
+            contig_collection
+        )
+    )
+
+    return np.frombuffer(rows, dtype=np.uint8).reshape(len(contig_collection), maxk)
+# end def _make_terminus_matrix
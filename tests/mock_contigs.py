@@ -2,7 +2,7 @@
 
 import os
 import pytest
-from typing import Tuple
+from typing import Tuple, Sequence
 
 import src.contigs as cnt
 import src.overlaps as ovl
@@ -10,6 +10,25 @@ import src.assign_multiplicity as amu
 
 
 MockContigsFixture = Tuple[cnt.ContigCollection, ovl.OverlapCollection]
+# (path to input file, mink, maxk)
+InputFixture = Tuple[str, int, int]
+
+
+@pytest.fixture
+def engine_inputs() -> Sequence[InputFixture]:
+    # Returns collection of (path to input file, mink, maxk) tuples
+    #   for testing overlap detection engines
+    return tuple([
+        (os.path.join('tests', 'data', 'test_contigs_spades_0.fasta'), 16, 25),
+        (os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz'), 8, 17),
+        (os.path.join('tests', 'data', 'test_contigs_a5_0.fasta'), 16, 25),
+        (os.path.join('tests', 'data', 'test_contigs_a5_repeat.fasta'), 16, 25),
+        (os.path.join('tests', 'data', 'test_contigs_mix_0.fasta'), 16, 25),
+        # Contigs are shorter than `maxk` here
+        (os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz'), 21, 127),
+        (os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz'), 1, 70),
+    ])
+# end def engine_inputs
 
 
 @pytest.fixture(scope='session')
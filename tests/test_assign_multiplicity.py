@@ -82,6 +82,17 @@ def overlaps_start2_end4() -> MutableSequence[ovl.Overlap]:
 # end def overlaps_start2_end4
 
 
+def _collect(overlaps: Sequence[ovl.Overlap]) -> ovl.OverlapCollection:
+    # Returns OverlapCollection containing overlaps of contig 1
+    overlap_collection: ovl.OverlapCollection = ovl.OverlapCollection()
+    overlap: ovl.Overlap
+    for overlap in overlaps:
+        overlap_collection.add_overlap(1, overlap)
+    # end for
+    return overlap_collection
+# end def _collect
+
+
 # === Fixtures for function `src.assign_multiplicity.assign_multiplty` ===
 
 @pytest.fixture
@@ -246,7 +257,7 @@ class TestCalcMultpltyByOvl:
         # Tests how the function assigns mulpitlicity if
         #   contig has no overlaps.
         expected: float = 1.0
-        obtained: float = amu._calc_multiplty_by_overlaps(overlaps_empty)
+        obtained: float = amu._calc_multiplty_by_overlaps(_collect(overlaps_empty), 1)
         assert abs(obtained - expected) < 1e-1
     # end def test_calc_multplty_by_ovl_empty
 
@@ -254,7 +265,7 @@ class TestCalcMultpltyByOvl:
         # Tests how the function assigns mulpitlicity if
         #   contig has single overlap at one terminus.
         expected: float = 1.0
-        obtained: float = amu._calc_multiplty_by_overlaps(overlaps_start1_end0)
+        obtained: float = amu._calc_multiplty_by_overlaps(_collect(overlaps_start1_end0), 1)
         assert abs(obtained - expected) < 1e-1
     # end def test_calc_multplty_by_ovl_start1_end0
 
@@ -262,7 +273,7 @@ class TestCalcMultpltyByOvl:
         # Tests how the function assigns mulpitlicity if
         #   contig has one overlap at both termini.
         expected: float = 1.0
-        obtained: float = amu._calc_multiplty_by_overlaps(overlaps_start1_end1)
+        obtained: float = amu._calc_multiplty_by_overlaps(_collect(overlaps_start1_end1), 1)
         assert abs(obtained - expected) < 1e-1
     # end def test_calc_multplty_by_ovl_start1_end1
 
@@ -271,7 +282,7 @@ class TestCalcMultpltyByOvl:
         #   contig has one overlap at one terminus
         #   and two overlaps -- at another.
         expected: float = 1.0
-        obtained: float = amu._calc_multiplty_by_overlaps(overlaps_start1_end2)
+        obtained: float = amu._calc_multiplty_by_overlaps(_collect(overlaps_start1_end2), 1)
         assert abs(obtained - expected) < 1e-1
     # end def test_calc_multplty_by_ovl_start1_end2
 
@@ -279,7 +290,7 @@ class TestCalcMultpltyByOvl:
         # Tests how the function assigns mulpitlicity if
         #   contig has two overlaps at both termini.
         expected: float = 2.0
-        obtained: float = amu._calc_multiplty_by_overlaps(overlaps_start2_end2)
+        obtained: float = amu._calc_multiplty_by_overlaps(_collect(overlaps_start2_end2), 1)
         assert abs(obtained - expected) < 1e-1
     # end def test_calc_multplty_by_ovl_start2_end2
 
@@ -288,7 +299,7 @@ class TestCalcMultpltyByOvl:
         #   contig has two overlaps at one terminus
         #   and 4 overlaps -- at another.
         expected: float = 2.0
-        obtained: float = amu._calc_multiplty_by_overlaps(overlaps_start2_end4)
+        obtained: float = amu._calc_multiplty_by_overlaps(_collect(overlaps_start2_end4), 1)
         assert abs(obtained - expected) < 1e-1
     # end def test_calc_multplty_by_ovl_start2_end4
 
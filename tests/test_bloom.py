@@ -0,0 +1,51 @@
+# -*- encoding: utf-8 -*-
+
+import pytest
+from typing import Sequence
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.bloom as blm
+
+from tests.mock_contigs import InputFixture, engine_inputs
+
+
+# === Test classes ===
+
+class TestDetectAdjacentContigsBloom:
+    # Class for testing function `src.bloom.detect_adjacent_contigs_bloom`
+
+    def test_detect_adjacent_contigs_bloom_saturated(self,
+                                                    engine_inputs: Sequence[InputFixture]):
+        # Overlaps must not be lost even if filters are saturated by the memory budget
+        infpath, mink, maxk = engine_inputs[3]
+        contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+
+        expected: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
+            contig_collection, mink, maxk
+        )
+        obtained: ovl.OverlapCollection = blm.detect_adjacent_contigs_bloom(
+            contig_collection, mink, maxk, 0.5, 0
+        )
+        assert repr(obtained) == repr(expected)
+    # end def test_detect_adjacent_contigs_bloom_saturated
+# end class TestDetectAdjacentContigsBloom
+
+
+class TestBloomFilter:
+    # Class for testing class `src.bloom.BloomFilter`
+
+    def test_bloom_filter(self):
+        # Added items must be found; filter must not exceed the memory budget
+        bloom_filter: blm.BloomFilter = blm.BloomFilter(100, 0.01, 10**6)
+        items: Sequence[str] = tuple('ACGT' * i for i in range(1, 101))
+        item: str
+        for item in items:
+            bloom_filter.add(item)
+        # end for
+        assert all(item in bloom_filter for item in items)
+        assert bloom_filter.add(items[0])
+
+        assert len(blm.BloomFilter(10**6, 0.01, 800)) == 100
+    # end def test_bloom_filter
+# end class TestBloomFilter
@@ -382,3 +382,35 @@ class TestCalcExpGenomeSize:
         assert sts.calc_exp_genome_size(contig_collection, overlap_collection) == expected_egs
     # end def test_calc_exp_genome_size_spades_1
 # end class TestCalcExpGenomeSize
+
+
+class TestCalcSummary:
+    # Class for testing function `src.combinator_statistics.calc_summary`
+
+    def test_calc_summary(self, mock_contigs_spades_0, mock_contigs_spades_1,
+                          mock_contigs_a5_0, mock_contigs_mix_0):
+        # Statistics calculated in a single traversal must be equal to ones
+        #   calculated separately
+        for contig_collection, overlap_collection in (mock_contigs_spades_0,
+                                                      mock_contigs_spades_1,
+                                                      mock_contigs_a5_0,
+                                                      mock_contigs_mix_0):
+            cov_calc: CovCalc = sts.CoverageCalculator(contig_collection)
+            expected = {
+                'num_contigs': len(contig_collection),
+                'sum_contig_lengths': sts.calc_sum_contig_lengths(contig_collection),
+                'exp_genome_size': sts.calc_exp_genome_size(contig_collection,
+                                                            overlap_collection),
+                'min_coverage': cov_calc.get_min_coverage(),
+                'max_coverage': cov_calc.get_max_coverage(),
+                'mean_coverage': cov_calc.calc_mean_coverage(),
+                'median_coverage': cov_calc.calc_median_coverage(),
+                'lq_coef': sts.calc_lq_coef(contig_collection, overlap_collection),
+                'num_hub_termini': 0,
+                'num_dropped_overlaps': 0,
+            }
+            summary: sts.Summary = sts.calc_summary(contig_collection, overlap_collection)
+            assert summary.as_dict() == expected
+        # end for
+    # end def test_calc_summary
+# end class TestCalcSummary
@@ -0,0 +1,123 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import shutil
+import pytest
+from typing import List, Tuple, Any
+
+import src.contigs as cnt
+import src.contig_cache as cch
+
+
+# === Fixtures for testing function `src.contig_cache.load_contig_collection` ===
+
+@pytest.fixture
+def input_copy(tmpdir_factory) -> Tuple[str, str]:
+    # Returns (path to a copy of input file, path to cache directory)
+    dpath: str = str(tmpdir_factory.mktemp('contig-cache'))
+    infpath: str = os.path.join(dpath, 'test_contigs_a5_repeat.fasta')
+    shutil.copy(os.path.join('tests', 'data', 'test_contigs_a5_repeat.fasta'), infpath)
+    return infpath, cch.get_cache_dpath(os.path.join(dpath, 'cache'))
+# end def input_copy
+
+
+def _contig_tuples(contig_collection: cnt.ContigCollection) -> List[Tuple[Any, ...]]:
+    return [(c.name, c.length, c.cov, c.gc_content, c.start, c.end, c.rcstart, c.rcend)
+        for c in contig_collection]
+# end def _contig_tuples
+
+
+def _forbid_parsing(monkeypatch) -> None:
+    # Makes parsing of input file fail
+    def fail(*args, **kwargs):
+        pytest.fail('Input file is parsed despite cache')
+    # end def fail
+    monkeypatch.setattr(cch, 'get_contig_collection', fail)
+# end def _forbid_parsing
+
+
+# === Test classes ===
+
+class TestLoadContigCollection:
+    # Class for testing function `src.contig_cache.load_contig_collection`
+
+    def test_load_contig_collection_cached(self, input_copy: Tuple[str, str], monkeypatch):
+        # Contigs loaded from cache must be identical to parsed ones
+        infpath, cache_dpath = input_copy
+        parsed, digest = cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+
+        _forbid_parsing(monkeypatch)
+        cached, cached_digest = cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+
+        assert cached_digest == digest == cch.calc_file_digest(infpath)
+        assert _contig_tuples(cached) == _contig_tuples(parsed)
+    # end def test_load_contig_collection_cached
+
+    def test_load_contig_collection_lower_maxk(self, input_copy: Tuple[str, str], monkeypatch):
+        # Termini for lower maxk must be cut from cached ones
+        infpath, cache_dpath = input_copy
+        cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+        expected: cnt.ContigCollection = cnt.get_contig_collection(infpath, 16)
+
+        _forbid_parsing(monkeypatch)
+        cached, _ = cch.load_contig_collection(infpath, 16, 1, cache_dpath)
+
+        assert _contig_tuples(cached) == _contig_tuples(expected)
+    # end def test_load_contig_collection_lower_maxk
+
+    def test_load_contig_collection_higher_maxk(self, input_copy: Tuple[str, str]):
+        # Input file must be parsed again for higher maxk
+        infpath, cache_dpath = input_copy
+        cch.load_contig_collection(infpath, 16, 1, cache_dpath)
+
+        parsed, _ = cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+        expected: cnt.ContigCollection = cnt.get_contig_collection(infpath, 25)
+
+        assert _contig_tuples(parsed) == _contig_tuples(expected)
+    # end def test_load_contig_collection_higher_maxk
+
+    def test_load_contig_collection_touched(self, input_copy: Tuple[str, str], monkeypatch):
+        # Cache must be reused if mtime of the file changes, but content does not
+        infpath, cache_dpath = input_copy
+        cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+        stat: os.stat_result = os.stat(infpath)
+        os.utime(infpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        _forbid_parsing(monkeypatch)
+        cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+    # end def test_load_contig_collection_touched
+
+    def test_load_contig_collection_modified(self, input_copy: Tuple[str, str]):
+        # Cache must not be used if content of the file changes
+        infpath, cache_dpath = input_copy
+        _, digest = cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+        with open(infpath, 'a') as outfile:
+            outfile.write('>extra_contig\nACGTACGTACGTACGTACGTACGTACGT\n')
+        # end with
+
+        modified, modified_digest = cch.load_contig_collection(infpath, 25, 1, cache_dpath)
+
+        assert modified_digest != digest
+        assert modified[-1].name == 'extra_contig'
+    # end def test_load_contig_collection_modified
+# end class TestLoadContigCollection
+
+
+class TestGetCacheDpath:
+    # Class for testing function `src.contig_cache.get_cache_dpath`
+
+    def test_get_cache_dpath_default(self, monkeypatch):
+        # Default cache directory must not depend on output directory
+        monkeypatch.setenv('XDG_CACHE_HOME', os.path.join('some', 'cache'))
+        assert cch.get_cache_dpath() == os.path.join('some', 'cache', 'combinator-FQ')
+
+        monkeypatch.delenv('XDG_CACHE_HOME')
+        assert cch.get_cache_dpath() \
+            == os.path.join(os.path.expanduser('~'), '.cache', 'combinator-FQ')
+    # end def test_get_cache_dpath_default
+
+    def test_get_cache_dpath_specified(self):
+        # Cache directory specified by user must be used as is
+        assert cch.get_cache_dpath('my-cache') == os.path.abspath('my-cache')
+    # end def test_get_cache_dpath_specified
+# end class TestGetCacheDpath
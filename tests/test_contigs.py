@@ -8,7 +8,7 @@ import src.contigs as cnt
 
 
 # === Fixtures for function `src.contigs._rc` ===
-# And for `src.contigs._calc_gc_content`
+# And for class `src.contigs._FastaRecordSummary`
 
 @pytest.fixture
 def some_sequence() -> str:
@@ -21,7 +21,7 @@ def degenerate_sequence() -> str:
 # end def degenerate_sequence
 
 
-# === Fixtures for function `src.contigs._validate_fasta` ===
+# === Fixtures for function `src.contigs._check_fasta_record` ===
 
 @pytest.fixture
 def valid_fasta() -> Tuple[str, str]:
@@ -60,7 +60,7 @@ def invalid_fasta_seq() -> Tuple[str, str]:
 # end def invalid_fasta_seq
 
 
-# === Fixtures for generator `src.contigs._fasta_generator` ===
+# === Fixtures for generator `src.contigs._scan_fasta` ===
 
 @pytest.fixture
 def plain_text_fasta() -> str:
@@ -104,6 +104,29 @@ def spades_1_maxk_17() -> Tuple[str, int]:
 # end def spades_1_maxk_17
 
 
+# === Helper functions ===
+
+def _summarize_record(header: str, seq: str, maxk: int = 17) -> cnt._FastaRecordSummary:
+    # Function summarizes a fasta record passing it's sequence in two fragments
+    record: cnt._FastaRecordSummary = cnt._FastaRecordSummary(header, maxk)
+    if len(seq) != 0:
+        record.feed(seq[: len(seq) // 2].encode('ascii'))
+        record.feed(seq[len(seq) // 2 :].encode('ascii'))
+    # end if
+    return record
+# end def _summarize_record
+
+
+def _read_full_records(infpath: str) -> Tuple[Tuple[str, str], ...]:
+    # Function returns (name, sequence) tuples of all records of a fasta file.
+    # Termini of summaries are entire sequences, since 'maxk' is large enough.
+    return tuple(
+        (record.header[1:], record.start.decode('ascii'))
+            for record in cnt._fasta_summary_generator(infpath, 10**6)
+    )
+# end def _read_full_records
+
+
 # === Test classes ===
 
 class TestRC:
@@ -122,47 +145,107 @@ class TestRC:
 
         assert cnt._rc(degenerate_sequence) == expected
     # end def test_rc_degenerate_sequence
+
+    def test_rc_contig_termini(self, some_sequence, degenerate_sequence):
+        # Test lazy reverse-complements of termini of a contig
+        contig: cnt.Contig = cnt.Contig('NODE_1', 18, 1.0, 50.0,
+                                        some_sequence, degenerate_sequence)
+        assert not 'rcstart' in vars(contig)
+
+        assert contig.rcstart == 'AGCCAGATTCATTATGGT'
+        assert contig.rcend == 'ANCCHGATTCATTSTYGT'
+        # Reverse-complements are cached
+        assert vars(contig)['rcstart'] == contig.rcstart
+        with pytest.raises(AttributeError):
+            contig.rcmiddle
+        # end with
+    # end def test_rc_contig_termini
+
+    def test_packed_contig_termini(self, some_sequence, degenerate_sequence):
+        # Test lazy packed termini of a contig: 2 bits per base, A=0, C=1, G=2, T=3
+        contig: cnt.Contig = cnt.Contig('NODE_1', 18, 1.0, 50.0,
+                                        some_sequence, 'ACGT')
+        assert contig.packed_end == int('0123', 4)
+        assert contig.packed_start == int(some_sequence[::-1].translate(cnt._PACK_TABLE), 4)
+        assert contig.packed_rcstart == cnt._pack(contig.rcstart)
+        assert contig.packed_rcend == cnt._pack(contig.rcend[::-1])
+
+        # Termini containing IUPAC ambiguity codes are not packed
+        contig = cnt.Contig('NODE_1', 18, 1.0, 50.0, degenerate_sequence, some_sequence)
+        assert contig.packed_start is None
+        assert contig.packed_rcstart is None
+        assert not contig.packed_end is None
+    # end def test_packed_contig_termini
 # end class TestRC
 
 
-class TestValidateFasta:
-    # Class for testing function `src.contigs._validate_fasta`
+class TestCheckFastaRecord:
+    # Class for testing function `src.contigs._check_fasta_record`
+    #   called by method `src.contigs._FastaRecordSummary.finish`
 
-    def test_validate_fasta_ok(self, valid_fasta: Tuple[str, str]):
+    def test_check_fasta_record_ok(self, valid_fasta: Tuple[str, str]):
         # Test validateion of a valid fasta record
         try:
-            cnt._validate_fasta(valid_fasta[0], valid_fasta[1])
+            _summarize_record(valid_fasta[0], valid_fasta[1]).finish()
         except ValueError:
-            pytest.fail('Test `test_validate_fasta_ok` failed!')
+            pytest.fail('Test `test_check_fasta_record_ok` failed!')
         # end try
-    # end def test_validate_fasta_ok
+    # end def test_check_fasta_record_ok
 
-    def test_validate_fasta_invalid_header(self, invalid_fasta_header: Tuple[str, str]):
+    def test_check_fasta_record_invalid_header(self, invalid_fasta_header: Tuple[str, str]):
         # Test validateion of a fasta record with invalid header
         with pytest.raises(ValueError):
-            cnt._validate_fasta(invalid_fasta_header[0], invalid_fasta_header[1])
+            _summarize_record(invalid_fasta_header[0], invalid_fasta_header[1]).finish()
         # end with
-    # end def test_validate_fasta_invalid_header
+    # end def test_check_fasta_record_invalid_header
 
-    def test_validate_fasta_empty_seq(self, invalid_fasta_seq: Tuple[str, str]):
+    def test_check_fasta_record_invalid_seq(self, invalid_fasta_seq: Tuple[str, str]):
         # Test validateion of a fasta record with invalid sequence
         with pytest.raises(ValueError):
-            cnt._validate_fasta(invalid_fasta_seq[0], invalid_fasta_seq[1])
+            _summarize_record(invalid_fasta_seq[0], invalid_fasta_seq[1]).finish()
         # end with
-    # end def test_validate_fasta_empty_seq
+    # end def test_check_fasta_record_invalid_seq
 
-    def test_validate_fasta_invalid_seq(self, invalid_empty_seq: Tuple[str, str]):
+    def test_check_fasta_record_empty_seq(self, invalid_empty_seq: Tuple[str, str]):
         # Test validateion of a fasta record with empty sequence
         with pytest.raises(ValueError):
-            cnt._validate_fasta(invalid_empty_seq[0], invalid_empty_seq[1])
+            _summarize_record(invalid_empty_seq[0], invalid_empty_seq[1]).finish()
         # end with
-    # end def test_validate_fasta_invalid_seq
-# end class TestValidateFasta
+    # end def test_check_fasta_record_empty_seq
 
+    def test_check_fasta_record_invalid_positions(self, invalid_fasta_seq: Tuple[str, str],
+                                                  capsys):
+        # Test reporting positions of invalid bases
+        with pytest.raises(ValueError):
+            cnt._check_fasta_record(invalid_fasta_seq[0], len(invalid_fasta_seq[1]),
+                                    [(5, '$'), (24, 'X')])
+        # end with
+        assert '`$` (position 5), `X` (position 24)' in capsys.readouterr().out
+    # end def test_check_fasta_record_invalid_positions
+
+    def test_check_fasta_record_inner_whitespace(self, tmpdir, capsys):
+        # Test that whitespace inside sequence lines is reported as invalid bases,
+        #   while line breaks (including Windows ones) are not
+        fasta_fpath: str = str(tmpdir.join('whitespace.fasta'))
+        with open(fasta_fpath, 'wb') as outfile:
+            outfile.write(b'>seq_1\r\nACGTACGTAC\r\nGTACGTACGT\r\n>seq_2\nACGTACGTAC GTACGTACGT\n')
+        # end with
 
-class TestFastaGeerator:
-    # Class for testing generator `src.contigs._fasta_generator`
-    def test_fasta_generator_plain(self, plain_text_fasta: str):
+        records: Generator[cnt._FastaRecordSummary, None, None] = \
+            cnt._fasta_summary_generator(fasta_fpath, 17)
+        assert next(records).length == 20
+        with pytest.raises(SystemExit):
+            next(records)
+        # end with
+        assert '` ` (position 11)' in capsys.readouterr().out
+    # end def test_check_fasta_record_inner_whitespace
+# end class TestCheckFastaRecord
+
+
+class TestScanFasta:
+    # Class for testing generator `src.contigs._scan_fasta`
+    #   through generator `src.contigs._fasta_summary_generator`
+    def test_scan_fasta_plain(self, plain_text_fasta: str):
         # Check how the generator parses a plain fasta file
         expected_collection: Sequence[Tuple[str, str]] = tuple([
             (
@@ -185,12 +268,12 @@ class TestFastaGeerator:
 
         expected: Tuple[str, str]
         obtained: Tuple[str, str]
-        for expected, obtained in zip(expected_collection, cnt._fasta_generator(plain_text_fasta)):
+        for expected, obtained in zip(expected_collection, _read_full_records(plain_text_fasta)):
             assert obtained == expected
         # end for
-    # end def test_fasta_generator_plain
+    # end def test_scan_fasta_plain
 
-    def test_fasta_generator_gzipped(self, gzipped_fasta: str):
+    def test_scan_fasta_gzipped(self, gzipped_fasta: str):
         # Check how the generator parses a gzipped fasta file
         expected_collection: Sequence[Tuple[str, str]] = tuple([
             (
@@ -225,11 +308,81 @@ class TestFastaGeerator:
 
         expected: Tuple[str, str]
         obtained: Tuple[str, str]
-        for expected, obtained in zip(expected_collection, cnt._fasta_generator(gzipped_fasta)):
+        for expected, obtained in zip(expected_collection, _read_full_records(gzipped_fasta)):
             assert obtained == expected
         # end for
-    # end def test_fasta_generator_gzipped
-# end class TestFastaGeerator
+    # end def test_scan_fasta_gzipped
+
+    def test_scan_fasta_tiny_chunks(self, plain_text_fasta: str, monkeypatch):
+        # Check that records do not depend on boundaries of chunks, in which file is read
+        expected_collection: Sequence[Tuple[str, str]] = _read_full_records(plain_text_fasta)
+
+        monkeypatch.setattr(cnt, '_CHUNK_SIZE', 3)
+        assert _read_full_records(plain_text_fasta) == expected_collection
+    # end def test_scan_fasta_tiny_chunks
+
+    def test_scan_fasta_unmappable(self, plain_text_fasta: str, monkeypatch):
+        # Check that plain files, which cannot be memory-mapped, are read in chunks
+        expected_collection: Sequence[Tuple[str, str]] = _read_full_records(plain_text_fasta)
+
+        def fail_mmap(*args, **kwargs):
+            raise OSError
+        # end def fail_mmap
+
+        monkeypatch.setattr(cnt.mmap, 'mmap', fail_mmap)
+        monkeypatch.setattr(cnt, '_CHUNK_SIZE', 7)
+        assert _read_full_records(plain_text_fasta) == expected_collection
+    # end def test_scan_fasta_unmappable
+# end class TestScanFasta
+
+
+class TestFastaSummaryGenerator:
+    # Class for testing generator `src.contigs._fasta_summary_generator`
+    def test_fasta_summary_generator(self, gzipped_fasta: str, monkeypatch):
+        # Check that summaries match entire sequences
+        maxk: int = 17
+        monkeypatch.setattr(cnt, '_CHUNK_SIZE', 5)
+
+        record: cnt._FastaRecordSummary
+        name: str
+        seq: str
+        for record, (name, seq) in zip(cnt._fasta_summary_generator(gzipped_fasta, maxk),
+                                       _read_full_records(gzipped_fasta)):
+            assert record.header == '>' + name
+            assert record.length == len(seq)
+            assert record.gc_count == seq.count('G') + seq.count('C')
+            assert record.start == seq[:maxk].encode('ascii')
+            assert record.end == seq[-maxk:].encode('ascii')
+        # end for
+    # end def test_fasta_summary_generator
+
+    def test_fasta_summary_generator_bgzf(self, gzipped_fasta: str):
+        # Check that BGZF file decompressed in several threads is summarized as gzip one
+        bgzf_fasta: str = os.path.join('tests', 'data', 'test_contigs_spades_1_bgzf.fasta.gz')
+        maxk: int = 17
+
+        def summarize(infpath: str, threads: int):
+            return [(record.header, record.length, record.gc_count, record.start, record.end)
+                for record in cnt._fasta_summary_generator(infpath, maxk, threads)]
+        # end def summarize
+
+        assert summarize(bgzf_fasta, 2) == summarize(gzipped_fasta, 1)
+    # end def test_fasta_summary_generator_bgzf
+
+    def test_fasta_summary_invalid_positions(self, invalid_fasta_seq: Tuple[str, str], capsys):
+        # Check that summary locates invalid bases across fragments
+        record: cnt._FastaRecordSummary = cnt._FastaRecordSummary(invalid_fasta_seq[0], 17)
+        seq: bytes = invalid_fasta_seq[1].encode('ascii')
+        record.feed(seq[:10])
+        record.feed(seq[10:])
+
+        assert record.gc_count == seq.upper().count(b'G') + seq.upper().count(b'C')
+        with pytest.raises(ValueError):
+            record.finish()
+        # end with
+        assert '`$` (position 5), `X` (position 24)' in capsys.readouterr().out
+    # end def test_fasta_summary_invalid_positions
+# end class TestFastaSummaryGenerator
 
 
 class TestIsSpadesHeader:
@@ -298,18 +451,21 @@ class TestParseCoverage:
 # end class TestParseCoverage
 
 
-class TestCalcGcContent:
-    # Class for testing function `src.contigs._calc_gc_content`
-    def test_calc_gc_content_some_seq(self, some_sequence):
+class TestFastaRecordSummary:
+    # Class for testing GC count of class `src.contigs._FastaRecordSummary`
+    def test_gc_count_some_seq(self, some_sequence):
         expected: float = 38.89
-        assert abs(cnt._calc_gc_content(some_sequence) - expected) < 1e-2
-    # end def test_calc_gc_content_some_seq
+        record: cnt._FastaRecordSummary = _summarize_record('>some_sequence', some_sequence)
+        assert abs(record.gc_count / record.length * 100 - expected) < 1e-2
+    # end def test_gc_count_some_seq
 
-    def test_calc_gc_content_degenerate_seq(self, degenerate_sequence):
+    def test_gc_count_degenerate_seq(self, degenerate_sequence):
         expected: float = 33.33
-        assert abs(cnt._calc_gc_content(degenerate_sequence) - expected) < 1e-2
-    # end def test_calc_gc_content_degenerate_seq
-# end class TestCalcGcContent
+        record: cnt._FastaRecordSummary = _summarize_record('>degenerate_sequence',
+                                                            degenerate_sequence)
+        assert abs(record.gc_count / record.length * 100 - expected) < 1e-2
+    # end def test_gc_count_degenerate_seq
+# end class TestFastaRecordSummary
 
 
 class TestGetContigCollection:
@@ -0,0 +1,42 @@
+# -*- encoding: utf-8 -*-
+
+import pytest
+from typing import Sequence
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.engines as eng
+
+from tests.mock_contigs import InputFixture, engine_inputs
+
+
+# === Test classes ===
+
+class TestDetectOverlaps:
+    # Class for testing function `src.engines.detect_overlaps`
+
+    @pytest.mark.parametrize('engine', tuple(eng.ENGINES.keys()))
+    def test_detect_overlaps(self, engine: str, engine_inputs: Sequence[InputFixture]):
+        # Each engine must detect the same overlaps in the same order
+        #   as pairwise comparison does.
+        infpath: str
+        mink: int
+        maxk: int
+        for infpath, mink, maxk in engine_inputs:
+            contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+
+            expected: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
+                contig_collection, mink, maxk
+            )
+            obtained: ovl.OverlapCollection = eng.detect_overlaps(
+                contig_collection, mink, maxk, engine
+            )
+
+            assert repr(obtained) == repr(expected)
+            i: cnt.ContigIndex
+            for i in range(len(contig_collection)):
+                assert list(obtained[i]) == list(expected[i])
+            # end for
+        # end for
+    # end def test_detect_overlaps
+# end class TestDetectOverlaps
@@ -3,6 +3,7 @@
 import pytest
 from typing import Tuple
 
+import src.contigs as cnt
 import src.find_overlap as fov
 
 
@@ -158,6 +159,30 @@ def e2s_ovl_8_20_7() -> FixtureForFindOvl:
     )
 # end def e2s_ovl_8_20_7
 
+@pytest.fixture
+def e2s_ovl_low_complexity() -> FixtureForFindOvl:
+    # mink = 4, maxk = 40, overlap length = 20.
+    # Seed `ACAC` occurs in seq1 lots of times
+    return (
+        'ACACACACACACACACACACACACACACACACACACACAG',                         # seq1
+        #                    ||||||||||||||||||||
+                            'ACACACACACACACACACAGTTTT',                 # seq2
+        4,                                                                  # mink
+        40                                                                  # maxk
+    )
+# end def e2s_ovl_low_complexity
+
+@pytest.fixture
+def e2s_entire_seqs() -> FixtureForFindOvl:
+    # Identical sequences shorter than `maxk`
+    return (
+        'GATCGCTGTGAAGAG', # seq1
+        'GATCGCTGTGAAGAG', # seq2
+        7,                 # mink
+        20                 # maxk
+    )
+# end def e2s_entire_seqs
+
 
 # === Fixtures for testing `src.find_overlap.find_overlap_e2e` ===
 
@@ -362,9 +387,41 @@ class TestE2S:
 
         assert fov.find_overlap_e2s(seq1, seq2, mink, maxk) == 0
     # end def test_e2s_ovl_8_20_7
+
+    def test_e2s_ovl_low_complexity(self, e2s_ovl_low_complexity: FixtureForFindOvl):
+        # Should find overlap of 20 bp length
+        seq1: str = e2s_ovl_low_complexity[0]
+        seq2: str = e2s_ovl_low_complexity[1]
+        mink: int = e2s_ovl_low_complexity[2]
+        maxk: int = e2s_ovl_low_complexity[3]
+
+        assert fov.find_overlap_e2s(seq1, seq2, mink, maxk) == 20
+    # end def test_e2s_ovl_low_complexity
+
+    def test_e2s_entire_seqs(self, e2s_entire_seqs: FixtureForFindOvl):
+        # Entire sequences match at every length from their length to `maxk`
+        seq1: str = e2s_entire_seqs[0]
+        seq2: str = e2s_entire_seqs[1]
+        mink: int = e2s_entire_seqs[2]
+        maxk: int = e2s_entire_seqs[3]
+
+        assert fov.find_overlap_e2s(seq1, seq2, mink, maxk) == 20
+    # end def test_e2s_entire_seqs
 # end class TestE2S
 
 
+class TestLongestBorder:
+    # Test class for `src.find_overlap._longest_border`
+
+    def test_longest_border(self):
+        assert fov._longest_border('GATCGCTGTG', 'TTTGATCGCT') == 7
+        assert fov._longest_border('ACACAG', 'ACACACACAC') == 4
+        assert fov._longest_border('GATC', 'GATC') == 4
+        assert fov._longest_border('GATC', 'TTTT') == 0
+    # end def test_longest_border
+# end class TestLongestBorder
+
+
 class TestE2E:
     # Test class for `src.find_overlap.find_overlap_e2e`
 
@@ -428,3 +485,50 @@ class TestE2E:
         assert fov.find_overlap_e2e(seq1, seq2, mink, maxk) == 0
     # end def test_e2e_ovl_8_20_7
 # end class TestE2E
+
+
+class TestPacked:
+    # Test class for `src.find_overlap.find_overlap_s2s_packed`
+    #   and `src.find_overlap.find_overlap_e2e_packed`
+
+    def test_packed_equals_str(self, s2s_ovl_7_7: FixtureForFindOvl,
+                               s2s_ovl_7_6: FixtureForFindOvl,
+                               s2s_ovl_7_8: FixtureForFindOvl,
+                               s2s_ovl_1_20_7: FixtureForFindOvl,
+                               s2s_ovl_1_6_7: FixtureForFindOvl,
+                               s2s_ovl_8_20_7: FixtureForFindOvl):
+        # Packed sequences must give the same overlaps as strings do
+        fixture: FixtureForFindOvl
+        for fixture in (s2s_ovl_7_7, s2s_ovl_7_6, s2s_ovl_7_8,
+                        s2s_ovl_1_20_7, s2s_ovl_1_6_7, s2s_ovl_8_20_7):
+            seq1, seq2, mink, maxk = fixture
+            assert fov.find_overlap_s2s_packed(
+                seq1, cnt._pack(seq1[::-1]), seq2, cnt._pack(seq2[::-1]), mink, maxk
+            ) == fov.find_overlap_s2s(seq1, seq2, mink, maxk)
+
+            seq1, seq2 = seq1[::-1], seq2[::-1]
+            assert fov.find_overlap_e2e_packed(
+                seq1, cnt._pack(seq1), seq2, cnt._pack(seq2), mink, maxk
+            ) == fov.find_overlap_e2e(seq1, seq2, mink, maxk)
+        # end for
+    # end def test_packed_equals_str
+
+    def test_packed_entire_seqs(self):
+        # Entire equal sequences and prefixes of sequences must be handled as strings are
+        seq1: str
+        seq2: str
+        for seq1, seq2 in (('ACGTA', 'ACGTA'), ('ACGTA', 'ACGTAA'), ('ACGTAA', 'ACGTA')):
+            assert fov.find_overlap_s2s_packed(
+                seq1, cnt._pack(seq1[::-1]), seq2, cnt._pack(seq2[::-1]), 3, 10
+            ) == fov.find_overlap_s2s(seq1, seq2, 3, 10)
+        # end for
+    # end def test_packed_entire_seqs
+
+    def test_packed_fallback(self):
+        # Sequences, which cannot be packed, must be compared as strings
+        assert cnt._pack('ACGNT') is None
+        assert fov.find_overlap_s2s_packed('ACGNTA', None, 'ACGNTC', cnt._pack('CTNGCA'),
+                                           3, 10) == 5
+        assert fov.find_overlap_e2e_packed('AACGN', None, 'CACGN', None, 3, 10) == 4
+    # end def test_packed_fallback
+# end class TestPacked
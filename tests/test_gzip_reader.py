@@ -0,0 +1,102 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import gzip
+import pytest
+from typing import Iterator
+
+import src.gzip_reader as gzr
+
+
+# === Fixtures for testing module `src.gzip_reader` ===
+
+@pytest.fixture
+def gzipped_fasta() -> str:
+    # Ordinary gzip file
+    return os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz')
+# end def gzipped_fasta
+
+@pytest.fixture
+def bgzf_fasta() -> str:
+    # The same file compressed in BGZF blocks of 100 bytes
+    return os.path.join('tests', 'data', 'test_contigs_spades_1_bgzf.fasta.gz')
+# end def bgzf_fasta
+
+@pytest.fixture
+def bgzf_gzip_fasta(tmpdir_factory, bgzf_fasta: str, gzipped_fasta: str) -> str:
+    # BGZF file followed by an ordinary gzip file
+    fpath: str = str(tmpdir_factory.mktemp('bgzf-gzip').join('bgzf_gzip.fasta.gz'))
+    with open(fpath, 'wb') as outfile:
+        infpath: str
+        for infpath in (bgzf_fasta, gzipped_fasta):
+            with open(infpath, 'rb') as infile:
+                outfile.write(infile.read())
+            # end with
+        # end for
+    # end with
+    return fpath
+# end def bgzf_gzip_fasta
+
+
+# === Test classes ===
+
+class TestIsBgzf:
+    # Class for testing function `src.gzip_reader.is_bgzf`
+
+    def test_is_bgzf_gzip(self, gzipped_fasta: str):
+        assert gzr.is_bgzf(gzipped_fasta) == False
+    # end def test_is_bgzf_gzip
+
+    def test_is_bgzf_bgzf(self, bgzf_fasta: str):
+        assert gzr.is_bgzf(bgzf_fasta) == True
+    # end def test_is_bgzf_bgzf
+# end class TestIsBgzf
+
+
+class TestIterateGzipChunks:
+    # Class for testing function `src.gzip_reader.iterate_gzip_chunks`
+
+    def test_iterate_gzip_chunks_gzip(self, gzipped_fasta: str):
+        # Background decompression must yield contents of the file in order
+        with gzip.open(gzipped_fasta, 'rb') as infile:
+            expected: bytes = infile.read()
+        # end with
+        assert b''.join(gzr.iterate_gzip_chunks(gzipped_fasta, 16, 1)) == expected
+    # end def test_iterate_gzip_chunks_gzip
+
+    def test_iterate_gzip_chunks_bgzf(self, bgzf_fasta: str, gzipped_fasta: str):
+        # Decompression of BGZF blocks in several threads must preserve order of blocks
+        with gzip.open(gzipped_fasta, 'rb') as infile:
+            expected: bytes = infile.read()
+        # end with
+
+        threads: int
+        batch_size: int
+        for threads in (1, 3):
+            for batch_size in (1, 250, 10000):
+                obtained: bytes = b''.join(gzr.iterate_gzip_chunks(bgzf_fasta, batch_size, threads))
+                assert obtained == expected
+            # end for
+        # end for
+    # end def test_iterate_gzip_chunks_bgzf
+
+    def test_iterate_gzip_chunks_bgzf_gzip(self, bgzf_gzip_fasta: str):
+        # Ordinary gzip members following BGZF blocks must be decompressed as well
+        with gzip.open(bgzf_gzip_fasta, 'rb') as infile:
+            expected: bytes = infile.read()
+        # end with
+
+        threads: int
+        for threads in (1, 2):
+            obtained: bytes = b''.join(gzr.iterate_gzip_chunks(bgzf_gzip_fasta, 250, threads))
+            assert obtained == expected
+        # end for
+    # end def test_iterate_gzip_chunks_bgzf_gzip
+
+    def test_iterate_gzip_chunks_cancel(self, gzipped_fasta: str):
+        # Background thread must stop if reading is cancelled
+        chunks: Iterator[bytes] = gzr.iterate_gzip_chunks(gzipped_fasta, 1, 1)
+        assert len(next(chunks)) == 1
+        chunks.close()
+    # end def test_iterate_gzip_chunks_cancel
+# end class TestIterateGzipChunks
@@ -0,0 +1,67 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import pytest
+from typing import List, Tuple, Sequence
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.k_sweep as ksw
+import src.combinator_statistics as sts
+from src.assign_multiplicity import assign_multiplty
+
+
+InputFixture = Tuple[str, ksw.KSweepRange]
+
+
+# === Fixtures for testing function `src.k_sweep.sweep_k` ===
+
+@pytest.fixture
+def inputs() -> Sequence[InputFixture]:
+    # Returns collection of (path to input file, sweep range) tuples
+    return tuple([
+        (os.path.join('tests', 'data', 'test_contigs_spades_0.fasta'), (10, 25, 3)),
+        (os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz'), (5, 75, 7)),
+        (os.path.join('tests', 'data', 'test_contigs_a5_repeat.fasta'), (12, 20, 1)),
+        (os.path.join('tests', 'data', 'test_contigs_mix_0.fasta'), (16, 25, 2)),
+    ])
+# end def inputs
+
+
+# === Test classes ===
+
+class TestSweepK:
+    # Class for testing function `src.k_sweep.sweep_k`
+
+    def test_sweep_k(self, inputs: Sequence[InputFixture]):
+        # Each point of a sweep must be identical to a separate run with `-k k`
+        infpath: str
+        sweep_range: ksw.KSweepRange
+        for infpath, sweep_range in inputs:
+            ks: Sequence[int] = ksw.get_sweep_ks(sweep_range)
+            contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, ks[-1])
+            obtained: List[ksw.KSweepPoint] = ksw.sweep_k(contig_collection, ks)
+
+            assert [point[0] for point in obtained] == list(ks)
+
+            k: int
+            point: ksw.KSweepPoint
+            for k, point in zip(ks, obtained):
+                contig_collection = cnt.get_contig_collection(infpath, k)
+                overlap_collection: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
+                    contig_collection, k, k
+                )
+                assign_multiplty(contig_collection, overlap_collection)
+
+                expected: ksw.KSweepPoint = (
+                    k,
+                    len(overlap_collection.get_comparison_hits()),
+                    len(overlap_collection),
+                    sts.calc_lq_coef(contig_collection, overlap_collection),
+                    sts.calc_exp_genome_size(contig_collection, overlap_collection),
+                )
+                assert point == expected
+            # end for
+        # end for
+    # end def test_sweep_k
+# end class TestSweepK
@@ -0,0 +1,32 @@
+# -*- encoding: utf-8 -*-
+
+import pytest
+from typing import List, Sequence
+
+import src.contigs as cnt
+import src.minimizers as mnm
+
+from tests.mock_contigs import InputFixture, engine_inputs
+
+
+# === Test classes ===
+
+class TestFindCandidatePartners:
+    # Class for testing function `src.minimizers.find_candidate_partners`
+
+    def test_find_candidate_partners(self, engine_inputs: Sequence[InputFixture]):
+        # Candidate partners must be greater than the contig and sorted
+        infpath, mink, maxk = engine_inputs[3]
+        contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+        candidate_partners: List[List[cnt.ContigIndex]] = mnm.find_candidate_partners(
+            contig_collection, mink
+        )
+        assert len(candidate_partners) == len(contig_collection)
+        i: cnt.ContigIndex
+        partners: List[cnt.ContigIndex]
+        for i, partners in enumerate(candidate_partners):
+            assert partners == sorted(partners)
+            assert all(j > i for j in partners)
+        # end for
+    # end def test_find_candidate_partners
+# end class TestFindCandidatePartners
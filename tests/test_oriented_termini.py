@@ -0,0 +1,60 @@
+# -*- encoding: utf-8 -*-
+
+import pytest
+from typing import List, Set
+
+import src.overlaps as ovl
+import src.oriented_termini as otm
+from src.oriented_termini import PREFIX, SUFFIX, FORWARD, REVERSE, PALINDROME
+
+
+# === Test classes ===
+
+class TestCanonize:
+    # Class for testing function `src.oriented_termini.canonize`
+
+    def test_canonize_forward(self):
+        assert otm.canonize('AACG', 'CGTT') == ('AACG', FORWARD)
+    # end def test_canonize_forward
+
+    def test_canonize_reverse(self):
+        assert otm.canonize('CGTT', 'AACG') == ('AACG', REVERSE)
+    # end def test_canonize_reverse
+
+    def test_canonize_palindrome(self):
+        assert otm.canonize('ACGT', 'ACGT') == ('ACGT', PALINDROME)
+    # end def test_canonize_palindrome
+# end class TestCanonize
+
+
+class TestJoinTermini:
+    # Class for testing function `src.oriented_termini.join_termini`
+
+    def test_join_termini_identical(self):
+        # Start of contig 0 is identical to end of contig 1
+        termini: List[otm.OrientedTerminus] = [(1, SUFFIX, REVERSE), (0, PREFIX, REVERSE)]
+        assert list(otm.join_termini(termini)) == [(0, 1, ovl.S2E)]
+    # end def test_join_termini_identical
+
+    def test_join_termini_rc(self):
+        # Start of contig 0 is reverse complement of end of contig 1
+        termini: List[otm.OrientedTerminus] = [(0, PREFIX, FORWARD), (1, SUFFIX, REVERSE)]
+        assert list(otm.join_termini(termini)) == [(0, 1, ovl.S2RCE)]
+    # end def test_join_termini_rc
+
+    def test_join_termini_self(self):
+        # End of contig 2 matches it's own start
+        #   and it's own rc-start matches it's own rc-end
+        termini: List[otm.OrientedTerminus] = [(2, PREFIX, FORWARD), (2, SUFFIX, FORWARD)]
+        assert list(otm.join_termini(termini)) == [(2, 2, ovl.SELF_E2S)]
+        termini = [(2, PREFIX, FORWARD), (2, SUFFIX, REVERSE)]
+        assert list(otm.join_termini(termini)) == [(2, 2, ovl.SELF_S2RCE)]
+    # end def test_join_termini_self
+
+    def test_join_termini_palindrome(self):
+        # Palindromic termini match each other in both orientations
+        termini: List[otm.OrientedTerminus] = [(0, PREFIX, PALINDROME), (1, PREFIX, PALINDROME)]
+        expected: Set[otm.ComparisonKey] = {(0, 1, ovl.S2S), (0, 1, ovl.S2RCS)}
+        assert set(otm.join_termini(termini)) == expected
+    # end def test_join_termini_palindrome
+# end class TestJoinTermini
@@ -6,6 +6,7 @@ from typing import List, Generator
 
 import src.contigs as cnt
 import src.overlaps as ovl
+import src.combinator_statistics as sts
 from src.overlaps import START, RCSTART, END, RCEND
 
 from tests.mock_contigs import mock_contigs_spades_0
@@ -114,6 +115,127 @@ class TestOverlapCollection:
             pytest.fatal('Error: method `OverlapCollection.__getitem__` does not work.`')
         # end try
     # end def test_getitem
+
+    def test_order_of_overlaps(self):
+        # Overlaps of a contig must be returned in order of their addition,
+        #   even if overlaps are added after access to the collection
+        overlap_collection: ovl.OverlapCollection = ovl.OverlapCollection()
+        overlap_collection.add_overlap(2, ovl.Overlap(2, END, 0, START, 21))
+        overlap_collection.add_overlap(0, ovl.Overlap(0, START, 2, END, 21))
+        overlap_collection.add_overlap(2, ovl.Overlap(2, START, 1, START, 33))
+        assert list(overlap_collection[2]) == [
+            ovl.Overlap(2, END, 0, START, 21),
+            ovl.Overlap(2, START, 1, START, 33)
+        ]
+        assert len(overlap_collection[1]) == 0
+
+        overlap_collection.add_overlap_fields(2, 2, RCEND, 0, END, 25)
+        assert list(overlap_collection[2]) == [
+            ovl.Overlap(2, END, 0, START, 21),
+            ovl.Overlap(2, START, 1, START, 33),
+            ovl.Overlap(2, RCEND, 0, END, 25)
+        ]
+        assert list(overlap_collection[0]) == [ovl.Overlap(0, START, 2, END, 21)]
+        assert len(overlap_collection) == 2
+    # end def test_order_of_overlaps
+
+    def test_side_overlaps(self):
+        # Start-side and end-side overlaps must match `is_start_match` and `is_end_match`
+        #   and preserve order of their addition
+        overlap_collection: ovl.OverlapCollection = ovl.OverlapCollection()
+        overlaps: List[ovl.Overlap] = [
+            ovl.Overlap(1, terminus_i, 2 + n, terminus_j, 21 + n)
+            for n, (terminus_i, terminus_j) in enumerate(
+                (ti, tj) for ti in (START, END) for tj in (START, RCSTART, END, RCEND)
+            )
+        ] * 2
+        overlap: ovl.Overlap
+        for overlap in overlaps:
+            overlap_collection.add_overlap(1, overlap)
+        # end for
+        overlap_collection.add_overlap(3, ovl.Overlap(3, END, 1, START, 21))
+
+        assert list(overlap_collection.get_start_overlaps(1)) \
+            == list(filter(sts.is_start_match, overlaps))
+        assert list(overlap_collection.get_end_overlaps(1)) \
+            == list(filter(sts.is_end_match, overlaps))
+        assert overlap_collection.count_start_overlaps(1) == 4
+        assert overlap_collection.count_end_overlaps(1) == 4
+
+        assert overlap_collection.count_start_overlaps(3) == 0
+        assert overlap_collection.count_end_overlaps(3) == 1
+        assert len(overlap_collection.get_start_overlaps(0)) == 0
+        assert overlap_collection.count_end_overlaps(7) == 0
+    # end def test_side_overlaps
+
+    def test_longest_side_overlaps(self):
+        # Longest overlaps must be returned in descending order of length,
+        #   and earlier added ones must be taken of overlaps of equal length
+        overlap_collection: ovl.OverlapCollection = ovl.OverlapCollection()
+        overlaps: List[ovl.Overlap] = [
+            ovl.Overlap(1, START, 2 + n, END, ovl_len)
+            for n, ovl_len in enumerate((30, 50, 40, 50, 30))
+        ]
+        overlap: ovl.Overlap
+        for overlap in overlaps:
+            overlap_collection.add_overlap(1, overlap)
+        # end for
+        overlap_collection.add_overlap(1, ovl.Overlap(1, END, 9, START, 99))
+
+        assert list(overlap_collection.get_longest_start_overlaps(1, 3)) \
+            == [overlaps[1], overlaps[3], overlaps[2]]
+        assert list(overlap_collection.get_longest_start_overlaps(1, 10)) \
+            == [overlaps[1], overlaps[3], overlaps[2], overlaps[0], overlaps[4]]
+        assert list(overlap_collection.get_longest_end_overlaps(1, 1)) \
+            == [ovl.Overlap(1, END, 9, START, 99)]
+        assert len(overlap_collection.get_longest_end_overlaps(5, 2)) == 0
+    # end def test_longest_side_overlaps
+
+    def test_capped_overlaps(self):
+        # Capped collection must retain M longest overlaps of each terminus in order
+        #   of their addition, and count all of them
+        hits: List[ovl.ComparisonHit] = [
+            (0, 1 + n, ovl.S2E, ovl_len) for n, ovl_len in enumerate((30, 50, 40, 50, 30, 60))
+        ] + [(0, 7, ovl.E2S, 25)]
+        full: ovl.OverlapCollection = ovl.collect_overlaps(hits)
+        capped: ovl.OverlapCollection = ovl.collect_overlaps(hits, 3)
+
+        assert list(capped.get_start_overlaps(0)) \
+            == [full.get_start_overlaps(0)[x] for x in (1, 3, 5)]
+        assert list(capped.get_end_overlaps(0)) == list(full.get_end_overlaps(0))
+        assert list(capped[1]) == list(full[1])
+
+        assert capped.count_start_overlaps(0) == 6
+        assert capped.count_dropped_start_overlaps(0) == 3
+        assert capped.count_dropped_end_overlaps(0) == 0
+        assert capped.count_dropped_overlaps(0) == 3
+        assert capped.is_start_hub(0) and not capped.is_end_hub(0)
+        assert not full.is_start_hub(0)
+        assert full.count_dropped_overlaps(0) == 0
+    # end def test_capped_overlaps
+
+    def test_capped_overlaps_mixed(self):
+        # Start-to-start-like overlaps must be capped with overlaps of the terminus involved
+        capped: ovl.OverlapCollection = ovl.collect_overlaps(
+            [(0, 1, ovl.S2S, 30), (0, 2, ovl.E2E, 20)], 1
+        )
+        assert len(capped[0]) == 2
+        assert capped.count_dropped_overlaps(0) == 0
+        assert not capped.is_start_hub(0) and not capped.is_end_hub(0)
+
+        capped = ovl.collect_overlaps(
+            [(0, 1, ovl.S2E, 30), (0, 2, ovl.S2S, 40), (0, 3, ovl.E2E, 20),
+             (0, 4, ovl.E2RCS, 35), (0, 5, ovl.E2S, 25)], 1
+        )
+        assert list(capped[0]) == [ovl.Overlap(0, START, 2, START, 40),
+                                   ovl.Overlap(0, END, 4, RCSTART, 35)]
+        assert capped.count_start_overlaps(0) == 1
+        assert len(capped.get_start_overlaps(0)) == 0
+        assert capped.count_dropped_start_overlaps(0) == 1
+        assert capped.count_dropped_end_overlaps(0) == 1
+        assert capped.count_dropped_overlaps(0) == 3
+        assert capped.is_start_hub(0) and capped.is_end_hub(0)
+    # end def test_capped_overlaps_mixed
 # end class TestOverlapCollection
 
 
@@ -157,4 +279,15 @@ class TestDetectAdjacentContigs:
         assert set(overlap_collection[node_4]) == expected
 
     # end def test_detect_adjacent_contigs
+
+    def test_detect_adjacent_contigs_capped(self, contig_collection_spades_0):
+        # Overlaps capped during detection must be the same as ones capped afterwards
+        contig_collection, mink, maxk = contig_collection_spades_0
+        full: ovl.OverlapCollection = ovl.detect_adjacent_contigs(contig_collection, mink, maxk)
+        capped: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
+            contig_collection, mink, maxk, 1
+        )
+        assert repr(capped) == repr(ovl.collect_overlaps(full.get_comparison_hits(), 1))
+        assert capped.max_overlaps_per_terminus == 1
+    # end def test_detect_adjacent_contigs_capped
 # end class TestDetectAdjacentContigs
\ No newline at end of file
@@ -0,0 +1,87 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import pytest
+from typing import List, Tuple, Sequence
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.parallel as par
+
+
+InputFixture = Tuple[str, int, int]
+
+
+# === Fixtures for testing function `src.parallel.detect_adjacent_contigs_parallel` ===
+
+@pytest.fixture
+def inputs() -> Sequence[InputFixture]:
+    # Returns collection of (path to input file, mink, maxk) tuples
+    return tuple([
+        (os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz'), 8, 17),
+        (os.path.join('tests', 'data', 'test_contigs_a5_repeat.fasta'), 16, 25),
+    ])
+# end def inputs
+
+
+# === Test classes ===
+
+class TestSplitPairSpace:
+    # Class for testing function `src.parallel.split_pair_space`
+
+    def test_split_pair_space_covers_rows(self):
+        # Blocks must be contiguous and cover all rows
+        num_contigs: int
+        num_blocks: int
+        for num_contigs, num_blocks in ((1, 4), (7, 2), (100, 8), (1000, 64)):
+            row_blocks: List[par.RowBlock] = par.split_pair_space(num_contigs, num_blocks)
+            assert row_blocks[0][0] == 0
+            assert row_blocks[-1][1] == num_contigs
+            assert len(row_blocks) <= num_blocks
+            assert all(map(lambda x: x[0][1] == x[1][0], zip(row_blocks, row_blocks[1:])))
+        # end for
+    # end def test_split_pair_space_covers_rows
+
+    def test_split_pair_space_balanced(self):
+        # Blocks must contain approximately equal numbers of pairs
+        num_contigs: int = 1000
+        num_blocks: int = 8
+        row_blocks: List[par.RowBlock] = par.split_pair_space(num_contigs, num_blocks)
+
+        pair_counts: List[int] = [
+            sum(num_contigs - i for i in range(*block)) for block in row_blocks
+        ]
+        expected_count: float = num_contigs * (num_contigs + 1) / 2 / num_blocks
+        assert len(row_blocks) == num_blocks
+        assert all(map(lambda x: abs(x - expected_count) <= num_contigs, pair_counts))
+        # First rows are longer, thus first blocks contain less rows
+        assert row_blocks[0][1] - row_blocks[0][0] < row_blocks[-1][1] - row_blocks[-1][0]
+    # end def test_split_pair_space_balanced
+# end class TestSplitPairSpace
+
+
+class TestDetectAdjacentContigsParallel:
+    # Class for testing function `src.parallel.detect_adjacent_contigs_parallel`
+
+    def test_detect_adjacent_contigs_parallel(self, inputs: Sequence[InputFixture]):
+        # Parallel run must detect the same overlaps in the same order as serial one
+        infpath: str
+        mink: int
+        maxk: int
+        for infpath, mink, maxk in inputs:
+            contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+
+            expected: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
+                contig_collection, mink, maxk
+            )
+            obtained: ovl.OverlapCollection = par.detect_adjacent_contigs_parallel(
+                contig_collection, mink, maxk, 2
+            )
+
+            i: cnt.ContigIndex
+            for i in range(len(contig_collection)):
+                assert list(obtained[i]) == list(expected[i])
+            # end for
+        # end for
+    # end def test_detect_adjacent_contigs_parallel
+# end class TestDetectAdjacentContigsParallel
@@ -157,6 +157,99 @@ def params_k_nonint() -> OptsArgs:
     ])
 # end def params_k_nonint
 
+@pytest.fixture
+def params_engine_valid() -> OptsArgs:
+    # Returns OptsArgs where valid engine is specified
+    return tuple([
+        ('-e', 'hash'),
+    ])
+# end def params_engine_valid
+
+@pytest.fixture
+def params_engine_invalid() -> OptsArgs:
+    # Returns OptsArgs where invalid engine is specified
+    return tuple([
+        ('-e', 'SABAKA'),
+    ])
+# end def params_engine_invalid
+
+@pytest.fixture
+def params_threads_valid() -> OptsArgs:
+    # Returns OptsArgs where valid number of threads is specified
+    return tuple([
+        ('-t', '1'),
+    ])
+# end def params_threads_valid
+
+@pytest.fixture
+def params_threads_zero() -> OptsArgs:
+    # Returns OptsArgs where number of threads is zero
+    return tuple([
+        ('-t', '0'),
+    ])
+# end def params_threads_zero
+
+@pytest.fixture
+def params_threads_nonint() -> OptsArgs:
+    # Returns OptsArgs where number of threads is not int
+    return tuple([
+        ('-t', 'SABAKA'),
+    ])
+# end def params_threads_nonint
+
+@pytest.fixture
+def params_no_cache() -> OptsArgs:
+    # Returns OptsArgs where cache is disabled
+    return tuple([
+        ('--no-cache', ''),
+    ])
+# end def params_no_cache
+
+@pytest.fixture
+def params_k_sweep_valid() -> OptsArgs:
+    # Returns OptsArgs where valid k sweep ranges are specified
+    return tuple([
+        ('--k-sweep', '21:127:2'),
+    ]), tuple([
+        ('--k-sweep', '21:127'),
+    ])
+# end def params_k_sweep_valid
+
+@pytest.fixture
+def params_k_sweep_invalid() -> Sequence[OptsArgs]:
+    # Returns collection of OptsArgs where invalid k sweep ranges are specified
+    return tuple([
+        tuple([('--k-sweep', arg)])
+        for arg in ('127:21', '21', '0:127', '21:127:0', '21:127:2:1', 'SABAKA')
+    ])
+# end def params_k_sweep_invalid
+
+@pytest.fixture
+def params_shard_invalid() -> Sequence[OptsArgs]:
+    # Returns collection of OptsArgs where invalid shards are specified
+    return tuple([
+        tuple([('--shard', arg)])
+        for arg in ('0/4', '5/4', '-1/4', '1/4/2', '1', 'SABAKA')
+    ])
+# end def params_shard_invalid
+
+@pytest.fixture
+def params_bloom_invalid() -> Sequence[OptsArgs]:
+    # Returns collection of OptsArgs where invalid parameters of Bloom filters are specified
+    return tuple(
+        [tuple([('--bloom-fpr', arg)]) for arg in ('0', '1', '-0.1', 'SABAKA')]
+        + [tuple([('--bloom-mem', arg)]) for arg in ('0', '-1', '0.5', 'SABAKA')]
+    )
+# end def params_bloom_invalid
+
+@pytest.fixture
+def params_max_ovl_invalid() -> Sequence[OptsArgs]:
+    # Returns collection of OptsArgs where invalid maximum number of overlaps per terminus is specified
+    return tuple(
+        [tuple([('--max-overlaps-per-terminus', arg)]) for arg in ('0', '-1', '0.5', 'SABAKA')]
+    )
+# end def params_max_ovl_invalid
+
 
 # === Fixtures for fuction `src.parse_args.parse_args` ===
 
@@ -193,6 +286,16 @@ def argv_defaults() -> Argv:
     ]
 # end def argv_defaults
 
+@pytest.fixture
+def argv_long_maxk() -> Argv:
+    # Arguments with large maxk and without engine
+    return [
+    'combinatro-FQ.py',
+    os.path.join('tests', 'data', 'test_contigs_spades_0.fasta'),
+    '-a', '5000'
+    ]
+# end def argv_long_maxk
+
 @pytest.fixture
 def argv_all_valid() -> Argv:
     # All valid arguments
@@ -319,7 +422,16 @@ class TestParseOtions:
         expected: Params = {
             'o': os.path.join(os.getcwd(), 'combinator-result'),
             'i': 21,
-            'a': 127
+            'a': 127,
+            'e': 'pairwise',
+            't': 1,
+            'cache': True,
+            'cache_dir': None,
+            'sweep': None,
+            'shard': None,
+            'bloom_fpr': 0.01,
+            'bloom_mem': 256,
+            'max_ovl': None
         }
         par._parse_options(default_params)
     # end def test_parse_options_defaults
@@ -329,7 +441,16 @@ class TestParseOtions:
         expected: Params = {
             'o': os.path.join(os.getcwd(), 'output-dir'),
             'i': 23,
-            'a': 125
+            'a': 125,
+            'e': 'pairwise',
+            't': 1,
+            'cache': True,
+            'cache_dir': None,
+            'sweep': None,
+            'shard': None,
+            'bloom_fpr': 0.01,
+            'bloom_mem': 256,
+            'max_ovl': None
         }
         par._parse_options(all_valid_params)
     # end def test_parse_options_all_valid
@@ -379,7 +500,16 @@ class TestParseOtions:
         expected: Params = {
             'o': os.path.join(os.getcwd(), 'output-dir'),
             'i': 127,
-            'a': 127
+            'a': 127,
+            'e': 'pairwise',
+            't': 1,
+            'cache': True,
+            'cache_dir': None,
+            'sweep': None,
+            'shard': None,
+            'bloom_fpr': 0.01,
+            'bloom_mem': 256,
+            'max_ovl': None
         }
         par._parse_options(params_k_valid)
     # end def test_parse_options_k_valid
@@ -403,6 +533,112 @@ class TestParseOtions:
             par._parse_options(params_k_nonint)
         # end with
     # end def test_parse_options_k_nonint
+
+    def test_parse_options_engine_valid(self, params_engine_valid: OptsArgs):
+        # Test `_parse_options` with valid engine specified
+        assert par._parse_options(params_engine_valid)['e'] == 'hash'
+    # end def test_parse_options_engine_valid
+
+    def test_parse_options_engine_invalid(self, params_engine_invalid: OptsArgs):
+        # Test `_parse_options` with invalid engine specified
+        with pytest.raises(SystemExit):
+            par._parse_options(params_engine_invalid)
+        # end with
+    # end def test_parse_options_engine_invalid
+
+    def test_parse_options_threads_valid(self, params_threads_valid: OptsArgs):
+        # Test `_parse_options` with valid number of threads specified
+        assert par._parse_options(params_threads_valid)['t'] == 1
+    # end def test_parse_options_threads_valid
+
+    def test_parse_options_threads_invalid(
+        self,
+        params_threads_zero: OptsArgs,
+        params_threads_nonint: OptsArgs
+    ):
+        # Test `_parse_options` with invalid number of threads specified
+        for fixture in (params_threads_zero, params_threads_nonint):
+            with pytest.raises(SystemExit):
+                par._parse_options(fixture)
+            # end with
+        # end for
+    # end def test_parse_options_threads_invalid
+
+    def test_parse_options_no_cache(self, params_no_cache: OptsArgs):
+        # Test `_parse_options` with cache disabled
+        assert par._parse_options(params_no_cache)['cache'] == False
+    # end def test_parse_options_no_cache
+
+    def test_parse_options_cache_dir(self):
+        # Test `_parse_options` with cache directory specified
+        assert par._parse_options((('--cache-dir', 'my-cache'),))['cache_dir'] \
+            == os.path.join(os.getcwd(), 'my-cache')
+    # end def test_parse_options_cache_dir
+
+    def test_parse_options_k_sweep_valid(self, params_k_sweep_valid: Tuple[OptsArgs, OptsArgs]):
+        # Test `_parse_options` with valid k sweep ranges specified
+        assert par._parse_options(params_k_sweep_valid[0])['sweep'] == (21, 127, 2)
+        assert par._parse_options(params_k_sweep_valid[1])['sweep'] == (21, 127, 1)
+    # end def test_parse_options_k_sweep_valid
+
+    def test_parse_options_k_sweep_invalid(self, params_k_sweep_invalid: Sequence[OptsArgs]):
+        # Test `_parse_options` with invalid k sweep ranges specified
+        fixture: OptsArgs
+        for fixture in params_k_sweep_invalid:
+            with pytest.raises(SystemExit):
+                par._parse_options(fixture)
+            # end with
+        # end for
+    # end def test_parse_options_k_sweep_invalid
+
+    def test_parse_options_shard_valid(self):
+        # Test `_parse_options` with valid shard specified
+        assert par._parse_options((('--shard', '2/4'),))['shard'] == (2, 4)
+        assert par._parse_options((('--shard', '1/1'),))['shard'] == (1, 1)
+    # end def test_parse_options_shard_valid
+
+    def test_parse_options_shard_invalid(self, params_shard_invalid: Sequence[OptsArgs]):
+        # Test `_parse_options` with invalid shards specified
+        fixture: OptsArgs
+        for fixture in params_shard_invalid:
+            with pytest.raises(SystemExit):
+                par._parse_options(fixture)
+            # end with
+        # end for
+    # end def test_parse_options_shard_invalid
+
+    def test_parse_options_bloom_valid(self):
+        # Test `_parse_options` with valid parameters of Bloom filters specified
+        params: Params = par._parse_options((('--bloom-fpr', '0.001'), ('--bloom-mem', '64')))
+        assert params['bloom_fpr'] == 0.001
+        assert params['bloom_mem'] == 64
+    # end def test_parse_options_bloom_valid
+
+    def test_parse_options_bloom_invalid(self, params_bloom_invalid: Sequence[OptsArgs]):
+        # Test `_parse_options` with invalid parameters of Bloom filters specified
+        fixture: OptsArgs
+        for fixture in params_bloom_invalid:
+            with pytest.raises(SystemExit):
+                par._parse_options(fixture)
+            # end with
+        # end for
+    # end def test_parse_options_bloom_invalid
+
+    def test_parse_options_max_ovl_valid(self):
+        # Test `_parse_options` with valid maximum number of overlaps per terminus specified
+        params: Params = par._parse_options((('--max-overlaps-per-terminus', '50'),))
+        assert params['max_ovl'] == 50
+    # end def test_parse_options_max_ovl_valid
+
+    def test_parse_options_max_ovl_invalid(self, params_max_ovl_invalid: Sequence[OptsArgs]):
+        # Test `_parse_options` with invalid maximum number of overlaps per terminus specified
+        fixture: OptsArgs
+        for fixture in params_max_ovl_invalid:
+            with pytest.raises(SystemExit):
+                par._parse_options(fixture)
+            # end with
+        # end for
+    # end def test_parse_options_max_ovl_invalid
 # end class TestParseOtions
 
 
@@ -454,7 +690,16 @@ class TestParseArgs:
             {
                 'o': os.path.join(os.getcwd(), 'combinator-result'),
                 'i': 21,
-                'a': 127
+                'a': 127,
+                'e': 'pairwise',
+                't': 1,
+                'cache': True,
+                'cache_dir': None,
+                'sweep': None,
+                'shard': None,
+                'bloom_fpr': 0.01,
+                'bloom_mem': 256,
+                'max_ovl': None
             }
         ])
 
@@ -480,7 +725,16 @@ class TestParseArgs:
             {
                 'o': os.path.join(os.getcwd(), 'combinator-result'),
                 'i': 23,
-                'a': 125
+                'a': 125,
+                'e': 'pairwise',
+                't': 1,
+                'cache': True,
+                'cache_dir': None,
+                'sweep': None,
+                'shard': None,
+                'bloom_fpr': 0.01,
+                'bloom_mem': 256,
+                'max_ovl': None
             }
         ])
 
@@ -495,6 +749,51 @@ class TestParseArgs:
         # end try
     # end def test_parse_argv_all_valid
 
+    def test_parse_argv_long_maxk_engine(self, argv_long_maxk: Argv):
+        # Engine for long overlaps must be selected for large maxk, unless engine is specified
+        try:
+            sys.argv = argv_long_maxk
+            assert par.parse_args('version', 'date')[1]['e'] == 'sorted'
+            sys.argv = argv_long_maxk + ['-e', 'pairwise']
+            assert par.parse_args('version', 'date')[1]['e'] == 'pairwise'
+            sys.argv = argv_long_maxk[:2]
+            assert par.parse_args('version', 'date')[1]['e'] == 'pairwise'
+            # Several threads are used by the default engine only
+            sys.argv = argv_long_maxk + ['--threads', '2']
+            assert par.parse_args('version', 'date')[1]['e'] == 'pairwise'
+        finally:
+            sys.argv = list()
+        # end try
+    # end def test_parse_argv_long_maxk_engine
+
+    def test_parse_argv_k_sweep_engine(self, argv_defaults: Argv):
+        # Engine used by k sweep must be reported; engine cannot be specified for k sweep
+        try:
+            sys.argv = argv_defaults + ['--k-sweep', '21:127', '-a', '5000']
+            assert par.parse_args('version', 'date')[1]['e'] == 'hash'
+            sys.argv = argv_defaults + ['--k-sweep', '21:127', '-e', 'sorted']
+            with pytest.raises(SystemExit):
+                par.parse_args('version', 'date')
+            # end with
+        finally:
+            sys.argv = list()
+        # end try
+    # end def test_parse_argv_k_sweep_engine
+
+    def test_parse_argv_shard_engine(self, argv_defaults: Argv):
+        # Engine used by shards must be reported; engine cannot be specified for shards
+        try:
+            sys.argv = argv_defaults + ['--shard', '1/2', '-a', '5000']
+            assert par.parse_args('version', 'date')[1]['e'] == 'pairwise'
+            sys.argv = argv_defaults + ['--shard', '1/2', '-e', 'hash']
+            with pytest.raises(SystemExit):
+                par.parse_args('version', 'date')
+            # end with
+        finally:
+            sys.argv = list()
+        # end try
+    # end def test_parse_argv_shard_engine
+
     def test_parse_argv_mink_gt_maxk_mink_not_spec(self, argv_mink_gt_maxk_mink_not_spec: Argv):
         # Function for testing how `parse_args` handles situation
         #   where `mink` > `maxk` but `mink` is not specified
@@ -507,7 +806,16 @@ class TestParseArgs:
             {
                 'o': os.path.join(os.getcwd(), 'combinator-result'),
                 'i': 19,
-                'a': 19
+                'a': 19,
+                'e': 'pairwise',
+                't': 1,
+                'cache': True,
+                'cache_dir': None,
+                'sweep': None,
+                'shard': None,
+                'bloom_fpr': 0.01,
+                'bloom_mem': 256,
+                'max_ovl': None
             }
         ])
 
@@ -534,7 +842,16 @@ class TestParseArgs:
             {
                 'o': os.path.join(os.getcwd(), 'combinator-result'),
                 'i': 129,
-                'a': 129
+                'a': 129,
+                'e': 'pairwise',
+                't': 1,
+                'cache': True,
+                'cache_dir': None,
+                'sweep': None,
+                'shard': None,
+                'bloom_fpr': 0.01,
+                'bloom_mem': 256,
+                'max_ovl': None
             }
         ])
 
@@ -0,0 +1,116 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import pytest
+from typing import List, Tuple
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.result_cache as rch
+
+
+InputFixture = Tuple[str, int, int]
+
+_DIGEST: bytes = bytes(range(16))
+
+
+# === Fixtures for testing module `src.result_cache` ===
+
+@pytest.fixture
+def inputs() -> List[InputFixture]:
+    # Returns collection of (path to input file, mink, maxk) tuples
+    return [
+        (os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz'), 8, 17),
+        (os.path.join('tests', 'data', 'test_contigs_a5_repeat.fasta'), 16, 25),
+    ]
+# end def inputs
+
+@pytest.fixture
+def cache_dpath(tmpdir_factory) -> str:
+    return str(tmpdir_factory.mktemp('result-cache'))
+# end def cache_dpath
+
+
+def _detect(infpath: str, mink: int, maxk: int) -> Tuple[cnt.ContigCollection,
+                                                          ovl.OverlapCollection]:
+    contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+    return contig_collection, ovl.detect_adjacent_contigs(contig_collection, mink, maxk)
+# end def _detect
+
+
+# === Test classes ===
+
+class TestResultCache:
+    # Class for testing functions `src.result_cache.save_overlaps` and
+    #   `src.result_cache.load_overlaps`
+
+    def test_result_cache_same_k_range(self, inputs: List[InputFixture], cache_dpath: str):
+        # Loaded overlaps must be identical to stored ones
+        infpath: str
+        mink: int
+        maxk: int
+        for infpath, mink, maxk in inputs:
+            contig_collection, expected = _detect(infpath, mink, maxk)
+            rch.save_overlaps(cache_dpath, _DIGEST, len(contig_collection),
+                              mink, maxk, expected)
+
+            obtained: ovl.OverlapCollection = rch.load_overlaps(cache_dpath, _DIGEST,
+                                                                contig_collection, mink, maxk)
+            assert repr(obtained) == repr(expected)
+            os.remove(rch._get_overlaps_cache_fpath(cache_dpath, _DIGEST, mink, maxk))
+        # end for
+    # end def test_result_cache_same_k_range
+
+    def test_result_cache_narrower_k_range(self, inputs: List[InputFixture], cache_dpath: str):
+        # Overlaps for a narrower k-range must be identical to detected ones
+        infpath: str
+        mink: int
+        maxk: int
+        for infpath, mink, maxk in inputs:
+            contig_collection, overlap_collection = _detect(infpath, mink - 6, maxk + 6)
+            rch.save_overlaps(cache_dpath, _DIGEST, len(contig_collection),
+                              mink - 6, maxk + 6, overlap_collection)
+
+            contig_collection, expected = _detect(infpath, mink, maxk)
+            obtained: ovl.OverlapCollection = rch.load_overlaps(cache_dpath, _DIGEST,
+                                                                contig_collection, mink, maxk)
+            assert repr(obtained) == repr(expected)
+
+            # Wider k-range cannot be obtained
+            assert rch.load_overlaps(cache_dpath, _DIGEST, contig_collection,
+                                     mink - 7, maxk) is None
+            os.remove(rch._get_overlaps_cache_fpath(cache_dpath, _DIGEST, mink - 6, maxk + 6))
+        # end for
+    # end def test_result_cache_narrower_k_range
+
+    def test_result_cache_other_input(self, inputs: List[InputFixture], cache_dpath: str):
+        # Result stored for a different number of contigs must not be loaded
+        infpath, mink, maxk = inputs[0]
+        contig_collection, overlap_collection = _detect(infpath, mink, maxk)
+        rch.save_overlaps(cache_dpath, _DIGEST, len(contig_collection) + 1,
+                          mink, maxk, overlap_collection)
+
+        assert rch.load_overlaps(cache_dpath, _DIGEST, contig_collection, mink, maxk) is None
+    # end def test_result_cache_other_input
+# end class TestResultCache
+
+
+class TestEvictCacheFiles:
+    # Class for testing function `src.result_cache.evict_cache_files`
+
+    def test_evict_cache_files(self, cache_dpath: str):
+        # Least recently used files must be removed first
+        fname: str
+        for mtime, fname in enumerate(('b', 'c', 'a')):
+            fpath: str = os.path.join(cache_dpath, fname)
+            with open(fpath, 'wb') as outfile:
+                outfile.write(bytes(100))
+            # end with
+            os.utime(fpath, (mtime, mtime))
+        # end for
+
+        rch.evict_cache_files(cache_dpath, 250)
+
+        assert sorted(os.listdir(cache_dpath)) == ['a', 'c']
+    # end def test_evict_cache_files
+# end class TestEvictCacheFiles
@@ -0,0 +1,112 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import pytest
+from typing import List, Tuple
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.sharding as shr
+
+
+InputFixture = Tuple[str, int, int]
+
+_DIGEST: bytes = bytes(range(16))
+
+
+# === Fixtures for testing module `src.sharding` ===
+
+@pytest.fixture
+def inputs() -> List[InputFixture]:
+    # Returns collection of (path to input file, mink, maxk) tuples
+    return [
+        (os.path.join('tests', 'data', 'test_contigs_spades_1.fasta.gz'), 8, 40),
+        (os.path.join('tests', 'data', 'test_contigs_a5_repeat.fasta'), 16, 25),
+        (os.path.join('tests', 'data', 'test_contigs_mix_0.fasta'), 20, 127),
+    ]
+# end def inputs
+
+@pytest.fixture
+def partial_dpath(tmpdir_factory) -> str:
+    return str(tmpdir_factory.mktemp('partials'))
+# end def partial_dpath
+
+
+def _write_partials(contig_collection: cnt.ContigCollection, mink: int, maxk: int,
+                    num_shards: int, partial_dpath: str) -> List[str]:
+    # Detects overlaps for each shard and writes them to partial files
+    partial_fpaths: List[str] = list()
+    shard_num: int
+    for shard_num in range(1, num_shards + 1):
+        shard: shr.ShardSpec = (shard_num, num_shards)
+        partial_fpath: str = shr.get_partial_fpath(partial_dpath, 'test', shard)
+        shr.write_partial(
+            partial_fpath,
+            (_DIGEST, len(contig_collection), mink, maxk, *shard),
+            shr.detect_shard_hits(contig_collection, mink, maxk, shard)
+        )
+        partial_fpaths.append(partial_fpath)
+    # end for
+    return partial_fpaths
+# end def _write_partials
+
+
+# === Test classes ===
+
+class TestSharding:
+    # Class for testing functions `src.sharding.detect_shard_hits`
+    #   and `src.sharding.merge_partial_hits`
+
+    def test_merge_partials(self, inputs: List[InputFixture], partial_dpath: str):
+        # Merged result must be identical to the one of a run without sharding
+        infpath: str
+        mink: int
+        maxk: int
+        for infpath, mink, maxk in inputs:
+            contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+            expected: ovl.OverlapCollection = ovl.detect_adjacent_contigs(contig_collection,
+                                                                          mink, maxk)
+            num_shards: int
+            for num_shards in (1, 3, len(contig_collection) + 2):
+                partial_fpaths: List[str] = _write_partials(contig_collection, mink, maxk,
+                                                            num_shards, partial_dpath)
+                # Order of partial files must not matter
+                partials: List[shr.Partial] = shr.read_partials(partial_fpaths[::-1])
+                obtained: ovl.OverlapCollection = ovl.collect_overlaps(
+                    shr.merge_partial_hits(partials)
+                )
+                assert repr(obtained) == repr(expected)
+
+                fpath: str
+                for fpath in partial_fpaths:
+                    os.remove(fpath)
+                # end for
+            # end for
+        # end for
+    # end def test_merge_partials
+
+    def test_read_partials_missing_shard(self, inputs: List[InputFixture], partial_dpath: str):
+        # Merge must fail if a shard is missing or duplicated
+        infpath, mink, maxk = inputs[0]
+        contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+        partial_fpaths: List[str] = _write_partials(contig_collection, mink, maxk,
+                                                    3, partial_dpath)
+        with pytest.raises(SystemExit):
+            shr.read_partials(partial_fpaths[:2])
+        # end with
+        with pytest.raises(SystemExit):
+            shr.read_partials(partial_fpaths + partial_fpaths[:1])
+        # end with
+    # end def test_read_partials_missing_shard
+
+    def test_read_partial_invalid(self, partial_dpath: str):
+        # Invalid partial files must not be read
+        partial_fpath: str = os.path.join(partial_dpath, 'invalid' + shr.PARTIAL_EXT)
+        with open(partial_fpath, 'wb') as outfile:
+            outfile.write(b'>contig\nACGT\n' * 8)
+        # end with
+        with pytest.raises(ValueError):
+            shr.read_partial(partial_fpath)
+        # end with
+    # end def test_read_partial_invalid
+# end class TestSharding
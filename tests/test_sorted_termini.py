@@ -0,0 +1,70 @@
+# -*- encoding: utf-8 -*-
+
+import random
+import pytest
+from typing import List
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.sorted_termini as srt
+
+
+# === Fixtures for testing function `src.sorted_termini.detect_adjacent_contigs_sorted` ===
+
+@pytest.fixture
+def long_overlaps_fpath(tmpdir_factory) -> str:
+    # Returns path to a file containing contigs with overlaps of thousands of bp
+    rand: random.Random = random.Random(17)
+    genome: str = ''.join(rand.choice('ACGT') for _ in range(40000))
+
+    seqs: List[str] = list()
+    pos: int = 0
+    while pos < len(genome) - 6000:
+        seq: str = genome[pos : pos+6000]
+        seqs.append(seq if rand.random() < 0.5 else cnt._rc(seq))
+        pos += 6000 - rand.randint(1000, 3000)
+    # end while
+
+    fpath: str = str(tmpdir_factory.mktemp('long-overlaps').join('long_overlaps.fasta'))
+    with open(fpath, 'w') as outfile:
+        outfile.write(''.join('>NODE_{}\n{}\n'.format(i+1, seq) for i, seq in enumerate(seqs)))
+    # end with
+    return fpath
+# end def long_overlaps_fpath
+
+
+# === Test classes ===
+
+class TestDetectAdjacentContigsSorted:
+    # Class for testing function `src.sorted_termini.detect_adjacent_contigs_sorted`
+
+    def test_detect_adjacent_contigs_sorted_long(self, long_overlaps_fpath: str):
+        # Long overlaps must be detected as by pairwise comparison.
+        # Short overlaps are tested along with other engines in `tests.test_engines`.
+        contig_collection: cnt.ContigCollection = cnt.get_contig_collection(
+            long_overlaps_fpath, 4000
+        )
+        expected: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
+            contig_collection, 21, 4000
+        )
+        obtained: ovl.OverlapCollection = srt.detect_adjacent_contigs_sorted(
+            contig_collection, 21, 4000
+        )
+        assert repr(obtained) == repr(expected)
+        assert len(obtained) != 0
+    # end def test_detect_adjacent_contigs_sorted_long
+# end class TestDetectAdjacentContigsSorted
+
+
+class TestCalcLcp:
+    # Class for testing function `src.sorted_termini._calc_lcp`
+
+    def test_calc_lcp(self):
+        # Longest common prefixes must be found for sequences of any lengths
+        assert srt._calc_lcp('ACGTA', 'ACGTT') == 4
+        assert srt._calc_lcp('ACGT', 'ACGTTT') == 4
+        assert srt._calc_lcp('ACGT', 'ACGT') == 4
+        assert srt._calc_lcp('ACGT', 'TCGT') == 0
+        assert srt._calc_lcp('', 'ACGT') == 0
+    # end def test_calc_lcp
+# end class TestCalcLcp
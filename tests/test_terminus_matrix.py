@@ -0,0 +1,58 @@
+# -*- encoding: utf-8 -*-
+
+import pytest
+from typing import Sequence
+
+import src.contigs as cnt
+import src.overlaps as ovl
+import src.terminus_matrix as tmx
+
+from tests.mock_contigs import InputFixture, engine_inputs
+
+
+# === Test classes ===
+
+class TestCalcCommonPrefixLens:
+    # Class for testing function `src.terminus_matrix.calc_common_prefix_lens`
+
+    def test_calc_common_prefix_lens(self):
+        np = pytest.importorskip('numpy')
+
+        row = np.frombuffer(b'GATCGATC', dtype=np.uint8)
+        block = np.frombuffer(
+            b'GATCGATC' + b'GATCGTTT' + b'GTTCGATC' + b'GATC\x00\x00\x00\x00',
+            dtype=np.uint8
+        ).reshape(4, 8)
+
+        partners, ovl_lens = tmx.calc_common_prefix_lens(row, block, 4)
+        assert partners.tolist() == [0, 1, 3]
+        assert ovl_lens.tolist() == [8, 5, 4]
+    # end def test_calc_common_prefix_lens
+# end class TestCalcCommonPrefixLens
+
+
+class TestDetectAdjacentContigsNumpy:
+    # Class for testing function `src.terminus_matrix.detect_adjacent_contigs_numpy`
+
+    def test_detect_adjacent_contigs_numpy_fallback(self, engine_inputs: Sequence[InputFixture],
+                                                    monkeypatch):
+        # Engine must fall back to pairwise comparison if NumPy is not installed.
+        # Vectorized engine is tested along with other engines in `tests.test_engines`.
+        monkeypatch.setattr(tmx, 'np', None)
+
+        infpath: str
+        mink: int
+        maxk: int
+        for infpath, mink, maxk in engine_inputs:
+            contig_collection: cnt.ContigCollection = cnt.get_contig_collection(infpath, maxk)
+
+            expected: ovl.OverlapCollection = ovl.detect_adjacent_contigs(
+                contig_collection, mink, maxk
+            )
+            obtained: ovl.OverlapCollection = tmx.detect_adjacent_contigs_numpy(
+                contig_collection, mink, maxk
+            )
+            assert repr(obtained) == repr(expected)
+        # end for
+    # end def test_detect_adjacent_contigs_numpy_fallback
+# end class TestDetectAdjacentContigsNumpy